@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# benchmarks/bench_end_to_end.py - 로컬 대역 서버로 크롤러 전체의 처리량(products/min, reviews/min) 측정
+#
+# 사용법:
+#   python benchmarks/bench_end_to_end.py --max-depth 3 --product-limit 20 --workers 2 --latency-ms 80
+#   python benchmarks/bench_end_to_end.py --failure-rate 0.05 --wait-mode adaptive --lean --report e2e.json
+#
+# standin_server.py를 별도 스레드에서 띄우고 크롤링 대상 주소(set_base_url)를 그 서버로 바꾼 뒤
+# main.py와 같은 순서로 URL 수집(crawl_urls → run_url_crawler)과 상품/리뷰 수집(crawl_product_info_and_reviews)을 실행합니다.
+# 결과 파일(URL 목록, 카테고리 트리, product_info_all / review_all)은 임시 작업 디렉터리에 기록됩니다.
+# (Chrome이 필요하지만 네트워크 연결은 필요하지 않습니다)
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'urlcrawler'))
+sys.path.append(os.path.join(ROOT_DIR, 'reviewcrawler'))
+
+from standin_server import StandInServer
+from common.endpoints import set_base_url
+from common.browser import PAGE_LOAD_STRATEGIES, configure_browser
+from common.waits import WAIT_MODES, set_wait_mode, print_wait_summary
+from main import crawl_urls, crawl_product_info_and_reviews
+from scraper import HARVEST_MODES, set_harvest_mode
+from reviewcrawler.review_crawler import REVIEW_EXTRACTORS, set_review_extractor
+from reviewcrawler.parse_pipeline import configure_parse_pool, shutdown_parse_pool
+from reviewcrawler.product_info import SUMMARY_SOURCES, set_summary_source
+
+def per_minute(count, seconds):
+    return round(count / seconds * 60, 1) if seconds > 0 else 0.0
+
+def run(args):
+    """대역 서버를 대상으로 URL 수집과 상품/리뷰 수집을 차례로 실행하고 단계별 처리량을 반환합니다."""
+    server = StandInServer(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, failure_rate=args.failure_rate, seed=args.seed,
+        products_per_category=args.products_per_category, max_reviews=args.max_reviews,
+    )
+    work_dir = tempfile.mkdtemp(prefix='bench_e2e_')
+    previous_dir = os.getcwd()
+    with server:
+        set_base_url(server.url)
+        try:
+            os.chdir(work_dir)
+
+            start = time.perf_counter()
+            url_df = crawl_urls(max_depth=args.max_depth, product_limit=args.product_limit, refresh_tree=True,
+                                workers=args.url_workers)
+            url_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            product_count, review_count = crawl_product_info_and_reviews(
+                url_df, max_pages=args.max_pages, max_products=args.max_products, max_retries=args.max_retries,
+                workers=args.workers, output_format='csv',
+            )
+            product_seconds = time.perf_counter() - start
+        finally:
+            os.chdir(previous_dir)
+            set_base_url(None)
+            if args.keep_output:
+                print(f"[INFO] 결과 파일 위치: {work_dir}")
+            else:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'url_crawl': {
+            'seconds': round(url_seconds, 2),
+            'urls': len(url_df),
+            'urls_per_min': per_minute(len(url_df), url_seconds),
+        },
+        'product_crawl': {
+            'seconds': round(product_seconds, 2),
+            'products': product_count,
+            'reviews': review_count,
+            'products_per_min': per_minute(product_count, product_seconds),
+            'reviews_per_min': per_minute(review_count, product_seconds),
+        },
+        'server': server.stats(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 대역 서버 기반 크롤러 전체 처리량 측정')
+    parser.add_argument('--max-depth', type=int, default=3, help='크롤링할 최대 depth (1-4, 기본값: 3)')
+    parser.add_argument('--product-limit', type=int, default=20, help='카테고리별 수집할 제품 URL 수 (기본값: 20)')
+    parser.add_argument('--url-workers', type=int, default=1, help='URL 수집 브라우저 워커 수')
+    parser.add_argument('--workers', type=int, default=1, help='상품/리뷰 수집 브라우저 워커 수')
+    parser.add_argument('--max-products', type=int, default=None, help='상품/리뷰를 수집할 최대 제품 수')
+    parser.add_argument('--max-pages', type=int, default=3, help='제품별 최대 리뷰 페이지 수 (기본값: 3)')
+    parser.add_argument('--max-retries', type=int, default=2, help='제품별 최대 시도 횟수 (기본값: 2)')
+    parser.add_argument('--latency-ms', type=int, default=50, help='대역 서버 응답 지연(ms) (기본값: 50)')
+    parser.add_argument('--jitter-ms', type=int, default=20, help='응답 지연에 더할 임의 값의 최대치(ms) (기본값: 20)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='대역 서버가 500 오류로 응답할 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0, help='카탈로그와 지연/오류 시드')
+    parser.add_argument('--products-per-category', type=int, default=60, help='카테고리별 상품 수 (기본값: 60)')
+    parser.add_argument('--max-reviews', type=int, default=60, help='상품별 최대 리뷰 수 (기본값: 60)')
+    parser.add_argument('--harvest-mode', choices=HARVEST_MODES, default='incremental', help='제품 URL 수집 방식 (기본값: incremental)')
+    parser.add_argument('--review-extractor', choices=REVIEW_EXTRACTORS, default='html', help='리뷰 추출 방식 (기본값: html)')
+    parser.add_argument('--parse-processes', type=int, default=None, help='리뷰 페이지 백그라운드 파싱 프로세스 수 (기본값: 0=사용 안 함)')
+    parser.add_argument('--summary-source', choices=SUMMARY_SOURCES, default='state', help='상품 요약 정보 추출 방식 (기본값: state)')
+    parser.add_argument('--wait-mode', choices=WAIT_MODES, default='fixed', help='대기 방식 (기본값: fixed)')
+    parser.add_argument('--lean', action='store_true', help='이미지/미디어/폰트 요청 차단')
+    parser.add_argument('--headed', action='store_true', help='브라우저 화면 표시 (기본값: 헤드리스)')
+    parser.add_argument('--page-load-strategy', choices=PAGE_LOAD_STRATEGIES, default='normal', help='페이지 로딩 전략')
+    parser.add_argument('--keep-output', action='store_true', help='임시 작업 디렉터리(결과 파일)를 지우지 않음')
+    parser.add_argument('--report', type=str, default=None, help='측정 결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    set_wait_mode(args.wait_mode)
+    set_harvest_mode(args.harvest_mode)
+    set_review_extractor(args.review_extractor)
+    configure_parse_pool(args.parse_processes)
+    set_summary_source(args.summary_source)
+    configure_browser(lean=args.lean, headless=not args.headed, page_load_strategy=args.page_load_strategy)
+
+    try:
+        result = run(args)
+    finally:
+        shutdown_parse_pool()
+    result['settings'] = {
+        key: getattr(args, key) for key in (
+            'max_depth', 'product_limit', 'url_workers', 'workers', 'max_pages', 'latency_ms', 'jitter_ms',
+            'failure_rate', 'seed', 'harvest_mode', 'review_extractor', 'parse_processes', 'summary_source', 'wait_mode', 'lean', 'page_load_strategy',
+        )
+    }
+    result['machine'] = f"{platform.platform()} / Python {platform.python_version()}"
+
+    url_crawl, product_crawl = result['url_crawl'], result['product_crawl']
+    print("\n" + "=" * 60)
+    print(f"URL 수집     : {url_crawl['urls']}개 / {url_crawl['seconds']:.1f}초 ({url_crawl['urls_per_min']:.1f} urls/min)")
+    print(
+        f"상품/리뷰 수집: 상품 {product_crawl['products']}개, 리뷰 {product_crawl['reviews']}개 / {product_crawl['seconds']:.1f}초 "
+        f"({product_crawl['products_per_min']:.1f} products/min, {product_crawl['reviews_per_min']:.1f} reviews/min)"
+    )
+    for route, stats in sorted(result['server'].items()):
+        print(f"  서버 {route:<9}: 요청 {stats['requests']}회, 주입한 오류 {stats['failures']}회")
+    print("=" * 60)
+    print_wait_summary()
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"[INFO] 측정 결과 저장: {args.report}")
+
+if __name__ == "__main__":
+    main()
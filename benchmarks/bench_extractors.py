@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# benchmarks/bench_extractors.py - 추출 함수별 처리량(ops/sec)과 메모리 측정 및 기준값 비교
+#
+# 사용법:
+#   python benchmarks/bench_extractors.py                  # 측정 후 baseline_extractors.json과 비교
+#   python benchmarks/bench_extractors.py --save-baseline  # 현재 결과를 기준값으로 저장
+#   python benchmarks/bench_extractors.py --parser lxml --tolerance 0.2
+#
+# fixtures/ 의 익명화된 상품/리뷰/카테고리 페이지(선택자 목록이 기대하는 클래스 레이아웃별)로
+# 네이버에 접속하지 않고 추출 함수를 측정합니다. 각 실행은 새 문서를 파싱하므로 파싱 시간이 포함되며,
+# html_parse 케이스(파싱만)와 비교하면 추출 자체의 비용을 알 수 있습니다.
+# 처리량이 기준값보다 tolerance 이상 낮거나 추출 결과가 기준값과 다르면 종료 코드 1을 반환합니다.
+# (처리량 기준값은 측정한 머신에 따라 다르므로 같은 머신에서 비교하세요)
+
+import os
+import sys
+import io
+import json
+import time
+import hashlib
+import argparse
+import platform
+import contextlib
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from common.html_parser import PARSER_BACKENDS, DEFAULT_PARSER_BACKEND, set_parser_backend, get_parser_backend
+from reviewcrawler.document import ParsedDocument
+from reviewcrawler.product_info import parse_summary_info
+from reviewcrawler.text_based_parser import parse_product_info_by_text
+from reviewcrawler.utils import parse_product_info_tables, extract_product_info_from_html
+from reviewcrawler.review_crawler import extract_reviews
+from urlcrawler.scraper import extract_product_urls
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline_extractors.json')
+
+def _parse_only(document):
+    document.soup
+    return None
+
+def _card_extraction(document):
+    return extract_product_urls(document.html, [], limit=1000)
+
+# (케이스 이름, 픽스처 파일, 추출 함수)
+# 픽스처별 레이아웃:
+#   product_page.html          - 기본 스마트스토어 레이아웃 (요약 영역, __PRELOADED_STATE__ 상태 JSON, TH_yvPweZa 테이블)
+#   product_page_alt.html      - headingArea 제목, _yvPweZa 계열 테이블 (colspan 헤더 포함)
+#   product_page_fallback.html - 텍스트 매칭 라벨이 없는 productInfo 테이블 (대체 경로)
+#   review_page.html           - li.BnwL_cs1av 리뷰 목록
+#   review_page_alt.html       - reviewItems_review_item 리뷰 목록 (yyyy.mm.dd 날짜, 이미지 목록)
+#   category_page.html         - 제품 카드 60개 (중복 링크 포함)
+CASES = [
+    ('html_parse', 'product_page.html', _parse_only),
+    ('parse_summary_info', 'product_page.html', parse_summary_info),
+    ('parse_product_info_by_text', 'product_page.html', parse_product_info_by_text),
+    ('parse_product_info_by_text', 'product_page_alt.html', parse_product_info_by_text),
+    ('parse_product_info_tables', 'product_page.html', parse_product_info_tables),
+    ('parse_product_info_tables', 'product_page_fallback.html', parse_product_info_tables),
+    ('extract_product_info_from_html', 'product_page.html', extract_product_info_from_html),
+    ('extract_product_info_from_html', 'product_page_alt.html', extract_product_info_from_html),
+    ('card_extraction', 'category_page.html', _card_extraction),
+    ('review_loop', 'review_page.html', extract_reviews),
+    ('review_loop', 'review_page_alt.html', extract_reviews),
+]
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+def run_case(extractor, html_source):
+    """새 문서를 파싱한 뒤 추출 함수를 실행합니다. (문서 캐시를 사용하지 않음)"""
+    document = ParsedDocument(html_source, backend=get_parser_backend())
+    # 추출 함수의 [DEBUG] 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extractor(document)
+
+def result_hash(result):
+    """추출 결과의 내용 해시 (기준값과 결과가 같은지 비교용)"""
+    return hashlib.sha1(json.dumps(result, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+def measure_case(extractor, html_source, min_time, min_rounds, repeat=5):
+    """
+    repeat개 구간으로 나누어 각 구간을 최소 min_time/repeat초 또는 min_rounds회 반복하고,
+    가장 빠른 구간의 처리량을 사용합니다. (다른 프로세스에 의한 잡음 제거)
+    최대 메모리 사용량은 별도 1회 실행으로 측정합니다. (tracemalloc은 속도에 영향을 주므로 분리)
+    """
+    result = run_case(extractor, html_source)
+    best = None
+    for _ in range(repeat):
+        rounds = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while rounds < min_rounds or elapsed < min_time / repeat:
+            run_case(extractor, html_source)
+            rounds += 1
+            elapsed = time.perf_counter() - start
+        per_op = elapsed / rounds
+        best = per_op if best is None else min(best, per_op)
+
+    tracemalloc.start()
+    run_case(extractor, html_source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'ops_per_sec': round(1 / best, 2),
+        'best_ms': round(best * 1000, 3),
+        'peak_kb': round(peak / 1024, 1),
+        'result_hash': result_hash(result),
+    }
+
+def compare(results, baseline, tolerance):
+    """기준값과 비교하여 (처리량 저하, 결과 변경) 케이스 목록을 반환합니다."""
+    regressions, changed = [], []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        if current['ops_per_sec'] < previous['ops_per_sec'] * (1 - tolerance):
+            regressions.append(key)
+        if current['result_hash'] != previous['result_hash']:
+            changed.append(key)
+    return regressions, changed
+
+def main():
+    parser = argparse.ArgumentParser(description='추출 함수 벤치마크 (픽스처 기반)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER_BACKEND, help='HTML 파서 백엔드')
+    parser.add_argument('--min-time', type=float, default=1.0, help='케이스별 최소 측정 시간(초) (기본값: 1.0)')
+    parser.add_argument('--min-rounds', type=int, default=3, help='구간별 최소 반복 횟수 (기본값: 3)')
+    parser.add_argument('--repeat', type=int, default=5, help='측정 구간 수, 가장 빠른 구간을 사용 (기본값: 5)')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='기준값 JSON 파일')
+    parser.add_argument('--save-baseline', action='store_true', help='현재 결과를 기준값으로 저장 (같은 파서의 기존 값은 덮어씀)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 처리량 저하 비율 (기본값: 0.25)')
+    parser.add_argument('--case', nargs='+', default=None, help='측정할 케이스 이름 (기본값: 전체)')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        set_parser_backend(args.parser)
+
+    baseline_file = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline_file = json.load(f)
+    baseline = baseline_file.get('parsers', {}).get(args.parser, {})
+
+    fixtures = {}
+    results = {}
+    print(f"{'case':<32} {'fixture':<28} {'ops/sec':>10} {'best(ms)':>10} {'peak(KB)':>10} {'vs base':>9}")
+    print("-" * 104)
+    for case_name, fixture, extractor in CASES:
+        if args.case and case_name not in args.case:
+            continue
+        if fixture not in fixtures:
+            fixtures[fixture] = load_fixture(fixture)
+        key = f"{case_name}:{fixture}"
+        results[key] = measure_case(extractor, fixtures[fixture], args.min_time, args.min_rounds, args.repeat)
+        previous = baseline.get(key)
+        ratio = f"{results[key]['ops_per_sec'] / previous['ops_per_sec']:.2f}x" if previous else '-'
+        print(
+            f"{case_name:<32} {fixture:<28} {results[key]['ops_per_sec']:>10.1f} "
+            f"{results[key]['best_ms']:>10.3f} {results[key]['peak_kb']:>10.1f} {ratio:>9}"
+        )
+
+    if args.save_baseline:
+        baseline_file.setdefault('parsers', {}).setdefault(args.parser, {}).update(results)
+        baseline_file['machine'] = f"{platform.platform()} / Python {platform.python_version()}"
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline_file, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"\n기준값 저장: {args.baseline} (파서: {args.parser})")
+        return
+
+    if not baseline:
+        print(f"\n[WARN] {args.parser} 파서의 기준값이 없습니다. --save-baseline으로 먼저 저장하세요.")
+        return
+
+    regressions, changed = compare(results, baseline, args.tolerance)
+    for key in regressions:
+        print(f"[WARN] 처리량 저하: {key} ({baseline[key]['ops_per_sec']:.1f} → {results[key]['ops_per_sec']:.1f} ops/sec)")
+    for key in changed:
+        print(f"[WARN] 추출 결과 변경: {key} ({baseline[key]['result_hash']} → {results[key]['result_hash']})")
+    if regressions or changed:
+        sys.exit(1)
+    print(f"\n모든 케이스가 기준값 대비 허용 범위(-{args.tolerance:.0%}) 안이며 추출 결과가 동일합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# benchmarks/bench_lean_mode.py - lean 브라우저 모드 on/off 별 상품 페이지 전송량과 로딩 시간 비교
+#
+# 사용법:
+#   python benchmarks/bench_lean_mode.py --url-file all_category_product_urls.csv --limit 10 --headless
+#
+# 같은 상품 URL 목록을 lean 모드 off → on 순서로 각각 새 브라우저에서 열어
+# 상품별 전송량(DevTools 네트워크 이벤트 기준)과 로딩 시간을 측정합니다.
+# (Chrome과 네트워크 연결이 필요합니다)
+
+import os
+import sys
+import argparse
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from common.browser import PAGE_LOAD_STRATEGIES, configure_browser, page_metrics, start_page_measurement, record_page_metrics
+from common.waits import wait_page_loaded
+from reviewcrawler.crawler import NaverShoppingCrawler
+
+def load_urls(args):
+    if args.url:
+        return args.url
+    url_df = pd.read_csv(args.url_file)
+    return url_df['제품_URL'].head(args.limit).tolist()
+
+def measure(urls, lean, headless, page_load_strategy):
+    """lean 설정으로 새 브라우저를 띄워 URL별 측정 결과를 반환합니다. (측정에 실패한 URL은 빠짐)"""
+    configure_browser(lean=lean, headless=headless, page_load_strategy=page_load_strategy, measure=True)
+    page_metrics.reset()
+    crawler = NaverShoppingCrawler()
+    driver = crawler.setup_driver()
+    try:
+        # 첫 요청의 연결 설정 비용이 비교에 섞이지 않도록 한 번 미리 로딩
+        driver.get(urls[0])
+        wait_page_loaded(driver, fixed_delay=3)
+        for url in urls:
+            start_page_measurement(driver)
+            driver.get(url)
+            wait_page_loaded(driver, fixed_delay=3)
+            record_page_metrics(driver, url)
+    finally:
+        crawler.close()
+    return {record['url']: record for record in page_metrics.records()}
+
+def main():
+    parser = argparse.ArgumentParser(description='lean 브라우저 모드 전송량/로딩 시간 비교')
+    parser.add_argument('--url', nargs='+', help='측정할 상품 URL 목록')
+    parser.add_argument('--url-file', type=str, default='all_category_product_urls.csv', help='측정할 URL이 있는 CSV 파일')
+    parser.add_argument('--limit', type=int, default=10, help='URL 파일에서 사용할 상품 수 (기본값: 10)')
+    parser.add_argument('--headless', action='store_true', help='브라우저를 화면 없이 실행')
+    parser.add_argument('--page-load-strategy', choices=PAGE_LOAD_STRATEGIES, default='normal', help='lean 모드 측정 시 페이지 로딩 전략')
+    args = parser.parse_args()
+
+    urls = load_urls(args)
+    if not urls:
+        print("[ERROR] 측정할 URL이 없습니다.")
+        sys.exit(1)
+
+    baseline = measure(urls, lean=False, headless=args.headless, page_load_strategy='normal')
+    lean = measure(urls, lean=True, headless=args.headless, page_load_strategy=args.page_load_strategy)
+
+    # 한쪽에서 측정에 실패한 URL은 비교에서 제외 (같은 URL끼리만 비교)
+    paired = [url for url in dict.fromkeys(urls) if url in baseline and url in lean]
+    skipped = [url for url in dict.fromkeys(urls) if url not in paired]
+
+    print(f"\n{'#':>3} {'off KB':>10} {'on KB':>10} {'off ms':>9} {'on ms':>9}  url")
+    print("-" * 90)
+    for i, url in enumerate(paired, 1):
+        off, on = baseline[url], lean[url]
+        print(f"{i:>3} {off['bytes'] / 1024:>10.1f} {on['bytes'] / 1024:>10.1f} {off['load_ms']:>9.0f} {on['load_ms']:>9.0f}  {url[:50]}")
+    for url in skipped:
+        print(f"[WARN] 측정 실패로 비교에서 제외: {url}")
+
+    def mean(records, key):
+        return sum(records[url][key] for url in paired) / len(paired) if paired else 0.0
+
+    off_kb, on_kb = mean(baseline, 'bytes') / 1024, mean(lean, 'bytes') / 1024
+    off_ms, on_ms = mean(baseline, 'load_ms'), mean(lean, 'load_ms')
+    print("-" * 90)
+    print(f"평균 전송량: {off_kb:.1f}KB → {on_kb:.1f}KB ({(1 - on_kb / off_kb) * 100 if off_kb else 0:.1f}% 감소)")
+    print(f"평균 로딩 시간: {off_ms:.0f}ms → {on_ms:.0f}ms ({(1 - on_ms / off_ms) * 100 if off_ms else 0:.1f}% 감소)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# benchmarks/bench_parser_backends.py - HTML 파서 백엔드별 파싱+추출 시간 비교
+#
+# 사용법:
+#   python benchmarks/bench_parser_backends.py --iterations 50
+#
+# 각 백엔드에 대해 fixtures/ 의 HTML을 매번 새로 파싱하여
+# parse_summary_info, parse_product_info_by_text, 리뷰 추출 루프의 시간을 측정하고,
+# 결과가 기본 백엔드(html.parser)와 동일한지 확인합니다.
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from common.html_parser import PARSER_BACKENDS, DEFAULT_PARSER_BACKEND
+from reviewcrawler.document import ParsedDocument
+from reviewcrawler.product_info import parse_summary_info
+from reviewcrawler.text_based_parser import parse_product_info_by_text
+from reviewcrawler.review_crawler import extract_reviews
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 같은 태그가 중첩된 문서 (요소 기준 검색이 자기 자신을 결과에 넣지 않는지 확인)
+INLINE_FIXTURES = {
+    'nested_same_tag': (
+        '<html><body><div class="a"><div class="b"><div class="c">x</div></div>'
+        '<ul class="list"><li class="item"><ul><li class="sub">y</li></ul></li></ul></div></body></html>'
+    ),
+}
+
+def _nested_same_tag(document):
+    soup = document.soup
+    outer = soup.select_one('div.a')
+    item = soup.select_one('li.item')
+    return {
+        'find_all': [div['class'] for div in outer.find_all('div')],
+        'select': [div['class'] for div in outer.select('div')],
+        'find': outer.find('div')['class'],
+        'select_one': outer.select_one('div')['class'],
+        'find_attrs': [li['class'] for li in item.find_all('li', {'class': 'sub'})],
+        'li_select': [li.get('class') for li in item.select('li')],
+        'document_html': [tag.name for tag in soup.find_all('html')],
+    }
+
+# (이름, 픽스처 파일, 추출 함수)
+CASES = [
+    ('parse_summary_info', 'product_page.html', parse_summary_info),
+    ('parse_product_info_by_text', 'product_page.html', parse_product_info_by_text),
+    ('review_loop', 'review_page.html', extract_reviews),
+    ('nested_same_tag', 'nested_same_tag', _nested_same_tag),
+]
+
+def load_fixture(name):
+    if name in INLINE_FIXTURES:
+        return INLINE_FIXTURES[name]
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+def run_case(extractor, html_source, backend):
+    """새 문서를 파싱한 뒤 추출 함수를 실행합니다. (캐시를 사용하지 않음)"""
+    document = ParsedDocument(html_source, backend=backend)
+    # 추출 함수의 [DEBUG] 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extractor(document)
+
+def backend_available(backend):
+    try:
+        ParsedDocument('<p></p>', backend=backend).soup
+        return True
+    except Exception as e:
+        print(f"[WARN] {backend} 백엔드를 사용할 수 없습니다: {e}")
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--iterations', type=int, default=20, help='케이스별 반복 횟수 (기본값: 20)')
+    parser.add_argument('--backends', nargs='+', default=list(PARSER_BACKENDS), help='측정할 백엔드 목록')
+    args = parser.parse_args()
+
+    fixtures = {name: load_fixture(name) for _, name, _ in CASES}
+    backends = [backend for backend in args.backends if backend_available(backend)]
+
+    # 기준 결과 (기본 백엔드)
+    expected = {
+        case_name: run_case(extractor, fixtures[fixture], DEFAULT_PARSER_BACKEND)
+        for case_name, fixture, extractor in CASES
+    }
+
+    print(f"{'case':<28} {'backend':<12} {'mean(ms)':>10} {'min(ms)':>10} {'identical':>10}")
+    print("-" * 74)
+    mismatches = 0
+    for case_name, fixture, extractor in CASES:
+        html_source = fixtures[fixture]
+        for backend in backends:
+            result = run_case(extractor, html_source, backend)
+            identical = result == expected[case_name]
+            if not identical:
+                mismatches += 1
+            timings = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                run_case(extractor, html_source, backend)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{case_name:<28} {backend:<12} {sum(timings) / len(timings):>10.3f} {min(timings):>10.3f} {str(identical):>10}")
+
+    if mismatches:
+        print(f"\n[WARN] 기본 백엔드와 결과가 다른 케이스: {mismatches}개")
+        sys.exit(1)
+    print("\n모든 백엔드의 추출 결과가 기본 백엔드와 동일합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,587 @@
+#!/usr/bin/env python
+# benchmarks/standin_server.py - 네이버 쇼핑 카테고리/상품/리뷰 페이지를 흉내 내는 로컬 대역 서버
+#
+# 사용법:
+#   python benchmarks/standin_server.py --port 8765 --latency-ms 80 --jitter-ms 40 --failure-rate 0.02
+#   python main.py --base-url http://127.0.0.1:8765 --max-depth 3 --product-limit 20
+#
+# 네트워크 없이 크롤러 전체(run_url_crawler, crawl_product_info_and_reviews)를 돌려 처리량을 측정하기 위한 서버입니다.
+# page_navigation.py / scraper.py / review_crawler.py가 기대하는 구조를 그대로 제공합니다.
+#   - 카테고리 페이지: imageMenu(대분류) → roundButtonMenu(소분류) → textMenuPc(1·2번째 detail 메뉴),
+#     정렬 필터(리뷰 많은순 → 전체), 무한 스크롤(스크롤 시 /api/cards로 20개씩 추가)
+#   - 상품 페이지: fixtures/product_page.html 기반 (상품명/상품번호/가격/리뷰 수만 상품별로 바꿈)
+#   - 리뷰 탭: 탭 클릭 시 /api/reviews로 20개씩 로딩, 랭킹순/최신순 정렬, 10페이지 단위 페이지네이션
+# 메뉴 클릭은 주소 이동(쿼리 변경)으로 처리하므로 카테고리 트리 캐시의 노드 URL로 바로 이동할 수 있습니다.
+# 모든 응답에 지연(--latency-ms ± --jitter-ms)을 넣고, --failure-rate 비율로 500 오류를 반환합니다.
+# 카탈로그(카테고리별 상품, 상품 정보, 리뷰)는 --seed로 결정되므로 같은 설정이면 항상 같은 결과가 나옵니다.
+
+import os
+import re
+import json
+import time
+import html
+import zlib
+import random
+import argparse
+import threading
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PRODUCT_TEMPLATE = os.path.join(BENCH_DIR, 'fixtures', 'product_page.html')
+
+CATEGORY_PATH = '/window/style/category'
+CATEGORY_MENU = '20033952'
+ROOT_CATEGORY = '여성의류'
+
+# 소분류 → 1번째 detail 메뉴 → 2번째 detail 메뉴
+CATALOG = {
+    '원피스': {'미니원피스': ['캐주얼', '오피스'], '롱원피스': ['캐주얼', '오피스']},
+    '니트': {'가디건': ['크롭', '롱'], '풀오버': ['크롭', '롱']},
+    '블라우스': {'셔츠': ['오버핏', '슬림핏'], '블라우스': ['오버핏', '슬림핏']},
+}
+
+CARDS_PER_PAGE = 20
+REVIEWS_PER_PAGE = 20
+PAGINATION_BLOCK = 10
+
+# 1x1 투명 GIF (상세/리뷰 이미지 요청 응답)
+PIXEL_GIF = (
+    b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+    b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+)
+
+ADJECTIVES = ['데일리', '베이직', '빈티지', '루즈핏', '모던', '러블리', '미니멀', '클래식']
+MATERIALS = ['린넨', '코튼', '울', '캐시미어', '쉬폰', '니트', '데님', '레이온']
+COLORS = ['화이트', '블랙', '베이지', '네이비', '그레이', '핑크']
+SIZES = ['S', 'M', 'L', 'FREE']
+REVIEW_SENTENCES = [
+    '핏이 예쁘고 재질이 좋아요.', '생각보다 얇아서 여름에 입기 좋습니다.', '색감이 사진이랑 똑같아요.',
+    '배송이 빨라서 좋았어요.', '사이즈가 조금 크게 나온 편이에요.', '세탁 후에도 변형이 없어요.',
+    '가격 대비 만족합니다.', '두 벌 더 구매했어요.', '구김이 적당히 가는 편입니다.', '마감이 조금 아쉬워요.',
+]
+
+def category_query(sub='', d1='', d2=''):
+    params = {'menu': CATEGORY_MENU}
+    for key, value in (('sub', sub), ('d1', d1), ('d2', d2)):
+        if value:
+            params[key] = value
+    return CATEGORY_PATH + '?' + urlencode(params)
+
+def _json_for_script(value):
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+class StandInCatalog:
+    """seed로 결정되는 카테고리별 상품 목록, 상품 정보, 리뷰"""
+
+    def __init__(self, seed=0, products_per_category=60, max_reviews=60):
+        self.seed = seed
+        self.products_per_category = products_per_category
+        self.max_reviews = max_reviews
+
+    def _rng(self, *parts):
+        return random.Random(':'.join(str(part) for part in (self.seed,) + parts))
+
+    def category_products(self, path, sort='popular'):
+        """카테고리 경로(소분류, detail1, detail2)의 상품 번호 목록 (sort='review'면 리뷰 많은순)"""
+        key = '|'.join(path)
+        ids = [
+            1000000000 + zlib.crc32(f"{self.seed}|{key}|{i}".encode('utf-8')) % 9000000000
+            for i in range(self.products_per_category)
+        ]
+        if sort == 'review':
+            ids.sort(key=lambda product_id: -self.product(product_id)['review_count'])
+        return ids
+
+    def product(self, product_id):
+        rng = self._rng('product', product_id)
+        price = rng.randrange(19000, 129000, 100)
+        return {
+            'id': product_id,
+            'store': f"스토어{product_id % 97:02d}",
+            'brand': f"브랜드{product_id % 31:02d}",
+            'title': f"{rng.choice(ADJECTIVES)} {rng.choice(MATERIALS)} {rng.choice(['원피스', '니트', '셔츠', '블라우스', '가디건'])} {rng.choice(COLORS)}",
+            'price': price,
+            'original_price': price * 5 // 4 // 100 * 100,
+            'review_count': rng.randint(0, self.max_reviews),
+        }
+
+    def reviews(self, product_id, sort='ranking'):
+        """상품의 리뷰 목록 (최신순은 작성일 내림차순, 그 외는 고정된 섞은 순서)"""
+        info = self.product(product_id)
+        newest = date(2024, 6, 30)
+        reviews = []
+        for i in range(info['review_count']):
+            rng = self._rng('review', product_id, i)
+            reviews.append({
+                'index': i,
+                'date': newest - timedelta(days=i * 2 + rng.randint(0, 1)),
+                'rating': rng.choice([5, 5, 5, 4, 4, 3, 2]),
+                'color': rng.choice(COLORS),
+                'size': rng.choice(SIZES),
+                'user': f"user{i:02d}***",
+                'height': rng.randint(152, 174),
+                'content': ' '.join(rng.sample(REVIEW_SENTENCES, rng.randint(1, 3))),
+                'images': rng.choice([0, 0, 1, 2]),
+            })
+        if sort == 'latest':
+            return reviews
+        if sort == 'rating_high':
+            return sorted(reviews, key=lambda review: -review['rating'])
+        self._rng('ranking', product_id).shuffle(reviews)
+        return reviews
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    대역 서버 요청 처리 (self.server.standin이 StandInServer)
+    페이지 생성 함수는 (요청, 쿼리, 경로)를 받아 (상태 코드, Content-Type, 본문)을 반환합니다.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        standin = self.server.standin
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        route, handler = self._route(parts.path)
+        if handler is None:
+            self._send(404, 'text/plain; charset=utf-8', b'not found')
+            return
+        standin.delay()
+        if route != 'static' and standin.should_fail():
+            standin.count(route, failed=True)
+            self._send(500, 'text/plain; charset=utf-8', b'stand-in failure')
+            return
+        standin.count(route)
+        status, content_type, body = handler(self, query, parts.path)
+        self._send(status, content_type, body)
+
+    def _route(self, path):
+        if path == CATEGORY_PATH:
+            return 'category', _category_page
+        if path == '/api/cards':
+            return 'cards', _cards_api
+        if path == '/api/reviews':
+            return 'reviews', _reviews_api
+        if re.fullmatch(r'/window-products/style/\d+', path) or re.fullmatch(r'/[\w-]+/products/\d+', path):
+            return 'product', _product_page
+        if path.startswith('/static/'):
+            return 'static', _static
+        return None, None
+
+    def _send(self, status, content_type, body):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    @property
+    def base_url(self):
+        return 'http://' + (self.headers.get('Host') or '127.0.0.1')
+
+def _card_html(base_url, catalog, product_id):
+    info = catalog.product(product_id)
+    return (
+        f'<li class="productCard_item"><a href="{base_url}/window-products/style/{product_id}" class="productCard_link">'
+        f'<span class="productCard_brand">{html.escape(info["brand"])}</span>'
+        f'<strong class="productCard_title">{html.escape(info["title"])}</strong>'
+        f'<span class="productCard_price">{info["price"]:,}원</span>'
+        f'<span class="productCard_review">리뷰 {info["review_count"]}</span></a></li>'
+    )
+
+def _cards_api(request, query, path):
+    standin = request.server.standin
+    path_key = tuple(query.get(key, '') for key in ('sub', 'd1', 'd2'))
+    page = max(1, int(query.get('page', 1)))
+    ids = standin.catalog.category_products(path_key, query.get('sort', 'popular'))
+    chunk = ids[(page - 1) * CARDS_PER_PAGE:page * CARDS_PER_PAGE]
+    body = ''.join(_card_html(request.base_url, standin.catalog, product_id) for product_id in chunk)
+    return 200, 'text/html; charset=utf-8', body
+
+def _menu_button(css_class, label, href, active):
+    classes = css_class + (' menu_active' if active else '')
+    return f'<button type="button" class="{classes}" data-href="{html.escape(href)}">{html.escape(label)}</button>'
+
+def _category_page(request, query, path):
+    standin = request.server.standin
+    sub, d1, d2 = (query.get(key, '') for key in ('sub', 'd1', 'd2'))
+    if sub not in CATALOG:
+        sub, d1, d2 = '', '', ''
+    if d1 not in CATALOG.get(sub, {}):
+        d1, d2 = '', ''
+    if d2 not in CATALOG.get(sub, {}).get(d1, []):
+        d2 = ''
+
+    image_menu = ''.join(
+        f'<li>{_menu_button("imageMenu_button__q1s9j", label, category_query(), label == ROOT_CATEGORY)}</li>'
+        for label in ('전체', ROOT_CATEGORY)
+    )
+    round_menu = _menu_button('roundButtonMenu_button__K8uup', '전체', category_query(), not sub) + ''.join(
+        _menu_button('roundButtonMenu_button__K8uup', label, category_query(label), label == sub) for label in CATALOG
+    )
+    detail_menus = ''
+    if sub:
+        buttons = _menu_button('textMenuPc_menu_button__aUoDb', '전체', category_query(sub), not d1) + ''.join(
+            _menu_button('textMenuPc_menu_button__aUoDb', label, category_query(sub, label), label == d1)
+            for label in CATALOG[sub]
+        )
+        detail_menus += f'<div class="textMenuPc_text_menu_pc__7l6HC textMenuPc_second_menu__wdNMp">{buttons}</div>'
+    if d1:
+        # 선택된 '전체' 버튼은 실제 페이지처럼 '선택됨' 표시를 텍스트에 포함
+        all_label = '<span>전체</span> <span class="menu_selected">선택됨</span>' if not d2 else '전체'
+        buttons = (
+            f'<button type="button" class="textMenuPc_menu_button__aUoDb{" menu_active" if not d2 else ""}" '
+            f'data-href="{html.escape(category_query(sub, d1))}">{all_label}</button>'
+        ) + ''.join(
+            _menu_button('textMenuPc_menu_button__aUoDb', label, category_query(sub, d1, label), label == d2)
+            for label in CATALOG[sub][d1]
+        )
+        detail_menus += f'<div class="textMenuPc_text_menu_pc__7l6HC textMenuPc_second_menu__wdNMp">{buttons}</div>'
+
+    path_key = (sub, d1, d2)
+    ids = standin.catalog.category_products(path_key)
+    cards = ''.join(_card_html(request.base_url, standin.catalog, product_id) for product_id in ids[:CARDS_PER_PAGE])
+    state = {
+        'sub': sub, 'd1': d1, 'd2': d2, 'sort': 'popular', 'page': 1,
+        'pages': (len(ids) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE,
+    }
+    body = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>스타일윈도 : {ROOT_CATEGORY}</title>
+<style>
+  body {{ font-family: sans-serif; margin: 0 auto; width: 960px; }}
+  ul {{ list-style: none; padding: 0; }}
+  .flicking-camera li {{ display: inline-block; margin-right: 8px; }}
+  button {{ margin: 2px; padding: 4px 10px; }}
+  .menu_active, .sort_active {{ font-weight: bold; border: 2px solid #03c75a; }}
+  .sort_option_detail_list__4oSrw {{ display: none; }}
+  .productCard_item {{ height: 90px; border-bottom: 1px solid #eee; }}
+  .productCard_link {{ display: block; padding: 10px; }}
+</style>
+</head>
+<body>
+<div id="content">
+  <ul class="flicking-camera">{image_menu}</ul>
+  <div class="roundButtonMenu_round_button_menu">{round_menu}</div>
+  {detail_menus}
+  <div class="sortFilterWrapper_sort_filter_wrapper__Ny94X">
+    <button type="button" class="sort_button">인기순</button>
+    <button type="button" class="sort_button" id="sort-review">리뷰 많은순</button>
+    <ul class="sort_option_detail_list__4oSrw" id="sort-detail">
+      <li><button type="button" class="sort_detail_button__CoQKb" data-sort="review">전체</button></li>
+      <li><button type="button" class="sort_detail_button__CoQKb" data-sort="review">1개월</button></li>
+    </ul>
+  </div>
+  <ul class="productList" id="product-list">{cards}</ul>
+</div>
+<script type="application/json" id="list-state">{_json_for_script(state)}</script>
+<script>
+(function () {{
+  var state = JSON.parse(document.getElementById('list-state').textContent);
+  var list = document.getElementById('product-list');
+  var loading = false;
+  document.addEventListener('click', function (e) {{
+    var target = e.target.closest('[data-href]');
+    if (target) location.href = target.getAttribute('data-href');
+  }});
+  function load(reset) {{
+    if (loading || (!reset && state.page >= state.pages)) return;
+    loading = true;
+    var page = reset ? 1 : state.page + 1;
+    var query = 'sub=' + encodeURIComponent(state.sub) + '&d1=' + encodeURIComponent(state.d1) +
+      '&d2=' + encodeURIComponent(state.d2) + '&sort=' + state.sort + '&page=' + page;
+    fetch('/api/cards?' + query).then(function (r) {{
+      if (!r.ok) throw new Error(r.status);
+      return r.text();
+    }}).then(function (cards) {{
+      if (reset) list.innerHTML = '';
+      list.insertAdjacentHTML('beforeend', cards);
+      state.page = page;
+    }}).catch(function () {{}}).then(function () {{ loading = false; }});
+  }}
+  window.addEventListener('scroll', function () {{
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) load(false);
+  }});
+  document.getElementById('sort-review').addEventListener('click', function () {{
+    this.classList.add('sort_active');
+    document.getElementById('sort-detail').style.display = 'block';
+  }});
+  document.querySelectorAll('.sort_detail_button__CoQKb').forEach(function (button) {{
+    button.addEventListener('click', function () {{
+      state.sort = button.getAttribute('data-sort');
+      load(true);
+    }});
+  }});
+}})();
+</script>
+</body>
+</html>"""
+    return 200, 'text/html; charset=utf-8', body
+
+_template_cache = {}
+
+def _product_template():
+    if 'product' not in _template_cache:
+        with open(PRODUCT_TEMPLATE, encoding='utf-8') as f:
+            _template_cache['product'] = f.read()
+    return _template_cache['product']
+
+# 리뷰 탭 (review_crawler의 최신순 선택자 구조와 같게 구성)
+REVIEW_SECTION = """
+  <div id="REVIEW">
+    <div>
+      <div class="_2LvIMaBiIO">
+        <div class="_2LAwVxx1Sd">
+          <strong>리뷰 <span class="review_count">{total}</span></strong>
+          <div class="_1txuie7UTH">
+            <ul>
+              <li><a href="#" class="filter_sort" data-sort="ranking" aria-selected="true">랭킹순</a></li>
+              <li><a href="#" class="filter_sort" data-sort="latest" aria-selected="false">최신순</a></li>
+              <li><a href="#" class="filter_sort" data-sort="rating_high" aria-selected="false">평점 높은순</a></li>
+            </ul>
+          </div>
+        </div>
+      </div>
+      <ul class="_3pDCBHw4WQ" id="review-list"></ul>
+      <div class="_2g7PKvqCKe" id="review-pagination"></div>
+    </div>
+  </div>
+<script>
+(function () {{
+  var productId = '{product_id}';
+  var state = {{sort: 'ranking', loaded: false}};
+  var list = document.getElementById('review-list');
+  var pagination = document.getElementById('review-pagination');
+  function link(page, label, current, extra) {{
+    return '<a href="#" data-page="' + page + '"' + (current ? ' aria-current="true"' : '') +
+      (extra ? ' class="' + extra + '"' : '') + '>' + label + '</a>';
+  }}
+  function renderPagination(page, pages) {{
+    var start = Math.floor((page - 1) / {block}) * {block} + 1;
+    var end = Math.min(start + {block} - 1, pages);
+    var links = start > 1 ? link(start - 1, '이전', false, '_2Ar8-aEUTq') : '';
+    for (var i = start; i <= end; i++) links += link(i, String(i), i === page);
+    if (end < pages) links += link(end + 1, '다음', false, 'fAUKm1ewwo _2Ar8-aEUTq');
+    pagination.innerHTML = links;
+  }}
+  function load(page) {{
+    fetch('/api/reviews?product=' + productId + '&sort=' + state.sort + '&page=' + page).then(function (r) {{
+      if (!r.ok) throw new Error(r.status);
+      return r.json();
+    }}).then(function (data) {{
+      list.innerHTML = data.html;
+      renderPagination(data.page, data.pages);
+      state.loaded = true;
+    }}).catch(function () {{}});
+  }}
+  document.querySelector('a[href="#REVIEW"]').addEventListener('click', function () {{
+    if (!state.loaded) load(1);
+  }});
+  document.querySelectorAll('a.filter_sort').forEach(function (a) {{
+    a.addEventListener('click', function (e) {{
+      e.preventDefault();
+      document.querySelectorAll('a.filter_sort').forEach(function (other) {{
+        other.setAttribute('aria-selected', other === a ? 'true' : 'false');
+      }});
+      state.sort = a.getAttribute('data-sort');
+      load(1);
+    }});
+  }});
+  pagination.addEventListener('click', function (e) {{
+    var target = e.target.closest('a[data-page]');
+    if (!target) return;
+    e.preventDefault();
+    load(parseInt(target.getAttribute('data-page'), 10));
+  }});
+}})();
+</script>
+"""
+
+def _product_page(request, query, path):
+    standin = request.server.standin
+    product_id = int(path.rsplit('/', 1)[1])
+    info = standin.catalog.product(product_id)
+    title = html.escape(info['title'])
+    body = _product_template()
+    body = re.sub(r'<title>.*?</title>', f"<title>{html.escape(info['store'])} : {title}</title>", body, count=1)
+    body = body.replace('샘플브랜드 여성 린넨 오버핏 셔츠 봄 여름&nbsp;데일리', f"{html.escape(info['brand'])} {title}")
+    body = body.replace('샘플브랜드', html.escape(info['brand']))
+    body = body.replace('8045986719', str(product_id))
+    body = body.replace('1,814', f"{info['review_count']:,}")
+    body = body.replace('39,200', f"{info['price']:,}").replace('49,000', f"{info['original_price']:,}")
+    body = body.replace('https://shop-phinf.example.com', request.base_url + '/static')
+    # 페이지 상태 JSON도 화면 값과 같게 (관심고객수/평점/할인율/배송비는 템플릿 값 그대로)
+    state = {'product': {'A': {
+        'id': product_id,
+        'name': f"{info['brand']} {info['title']}",
+        'keepCount': 1234,
+        'salePrice': info['original_price'],
+        'benefitsView': {'discountedSalePrice': info['price'], 'discountedRatio': 20},
+        'reviewAmount': {'totalReviewCount': info['review_count'], 'averageReviewScore': 4.8},
+        'productDeliveryInfo': {'baseFee': 0, 'deliveryFeeType': 'FREE'},
+    }}}
+    body = re.sub(r'window\.__PRELOADED_STATE__ = .*?;\n', lambda m: f"window.__PRELOADED_STATE__ = {_json_for_script(state)};\n", body, count=1)
+    section = REVIEW_SECTION.format(total=info['review_count'], product_id=product_id, block=PAGINATION_BLOCK)
+    body = body.replace('  <div id="footer">', section + '  <div id="footer">', 1)
+    return 200, 'text/html; charset=utf-8', body
+
+def _review_html(base_url, product_title, review):
+    images = ''.join(
+        f'<img src="{base_url}/static/review/{review["index"]}_{k}.jpg" alt="review_image">'
+        for k in range(review['images'])
+    )
+    return (
+        '<li class="BnwL_cs1av"><div class="_2V6vMO_iLm">'
+        f'<em class="_15NU42F3kT">{review["rating"]}</em>'
+        f'<div class="_2FXNMst_ak">제품 선택: {html.escape(product_title)}<dl class="XbGQRlzveO">'
+        f'<dt>색상:</dt><dd>{review["color"]}</dd><dt>사이즈:</dt><dd>{review["size"]}</dd></dl></div>'
+        f'<div class="_1_XCKE2RrJ"><strong>{review["user"]}</strong> <span>키 {review["height"]}cm · 평소 55 착용</span></div>'
+        f'<span class="_2L3vDiadT9">{review["date"].strftime("%y.%m.%d.")}</span></div>'
+        f'<div class="_1kMfD5ErZ6"><span class="_2L3vDiadT9">{html.escape(review["content"])}</span></div>'
+        + (f'<div class="_2389dRohZq">{images}</div>' if images else '')
+        + '</li>'
+    )
+
+def _reviews_api(request, query, path):
+    standin = request.server.standin
+    product_id = int(query.get('product', 0))
+    info = standin.catalog.product(product_id)
+    reviews = standin.catalog.reviews(product_id, query.get('sort', 'ranking'))
+    pages = max(1, (len(reviews) + REVIEWS_PER_PAGE - 1) // REVIEWS_PER_PAGE)
+    page = min(max(1, int(query.get('page', 1))), pages)
+    chunk = reviews[(page - 1) * REVIEWS_PER_PAGE:page * REVIEWS_PER_PAGE]
+    payload = {
+        'page': page,
+        'pages': pages,
+        'total': len(reviews),
+        'html': ''.join(_review_html(request.base_url, info['title'], review) for review in chunk),
+    }
+    return 200, 'application/json; charset=utf-8', json.dumps(payload, ensure_ascii=False)
+
+def _static(request, query, path):
+    return 200, 'image/gif', PIXEL_GIF
+
+class StandInServer:
+    """
+    네이버 쇼핑 대역 서버 (별도 스레드에서 실행)
+
+    Args:
+        host, port: 바인딩 주소 (port=0이면 빈 포트 자동 선택)
+        latency_ms: 응답마다 추가할 지연 시간(ms)
+        jitter_ms: 지연 시간에 더할 0~jitter_ms 사이의 임의 값(ms)
+        failure_rate: 500 오류로 응답할 비율 (0~1, 이미지 요청 제외)
+        seed: 카탈로그와 지연/오류 발생 순서의 시드
+        products_per_category: 카테고리별 상품 수
+        max_reviews: 상품별 최대 리뷰 수
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0, failure_rate=0.0, seed=0,
+                 products_per_category=60, max_reviews=60):
+        if not 0 <= failure_rate < 1:
+            raise ValueError(f"failure_rate는 0 이상 1 미만이어야 합니다: {failure_rate}")
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.catalog = StandInCatalog(seed, products_per_category, max_reviews)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def delay(self):
+        if not self.latency_ms and not self.jitter_ms:
+            return
+        with self._lock:
+            jitter = self._rng.uniform(0, self.jitter_ms)
+        time.sleep((self.latency_ms + jitter) / 1000)
+
+    def should_fail(self):
+        if not self.failure_rate:
+            return False
+        with self._lock:
+            return self._rng.random() < self.failure_rate
+
+    def count(self, route, failed=False):
+        with self._lock:
+            stats = self._counts.setdefault(route, {'requests': 0, 'failures': 0})
+            stats['requests'] += 1
+            if failed:
+                stats['failures'] += 1
+
+    def stats(self):
+        """경로별 요청 수와 주입한 오류 수"""
+        with self._lock:
+            return {route: dict(stats) for route, stats in self._counts.items()}
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), StandInHandler)
+        self._httpd.standin = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='standin-server', daemon=True)
+        self._thread.start()
+        print(
+            f"[INFO] 대역 서버 시작: {self.url} (지연 {self.latency_ms}±{self.jitter_ms}ms, "
+            f"오류율 {self.failure_rate:.1%}, 카테고리별 상품 {self.catalog.products_per_category}개)"
+        )
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+def main():
+    parser = argparse.ArgumentParser(description='네이버 쇼핑 로컬 대역 서버')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+    parser.add_argument('--latency-ms', type=int, default=0, help='응답마다 추가할 지연 시간(ms)')
+    parser.add_argument('--jitter-ms', type=int, default=0, help='지연 시간에 더할 임의 값의 최대치(ms)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='500 오류로 응답할 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0, help='카탈로그와 지연/오류 시드')
+    parser.add_argument('--products-per-category', type=int, default=60, help='카테고리별 상품 수 (기본값: 60)')
+    parser.add_argument('--max-reviews', type=int, default=60, help='상품별 최대 리뷰 수 (기본값: 60)')
+    args = parser.parse_args()
+
+    server = StandInServer(
+        host=args.host, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate, seed=args.seed,
+        products_per_category=args.products_per_category, max_reviews=args.max_reviews,
+    ).start()
+    print(f"[INFO] 카테고리 페이지: {server.url}{category_query()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"[INFO] 요청 통계: {json.dumps(server.stats(), ensure_ascii=False)}")
+        server.stop()
+
+if __name__ == "__main__":
+    main()
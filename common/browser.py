@@ -0,0 +1,192 @@
+# common/browser.py
+import os
+import json
+import threading
+
+# 브라우저 실행 설정 (모든 setup_driver에 공통 적용)
+# - lean: 이미지/미디어/폰트/광고·분석 요청을 DevTools(Network.setBlockedURLs)로 차단
+# - headless: 화면 없이 실행
+# - page_load_strategy: 'normal'(load 이벤트까지 대기) / 'eager'(DOMContentLoaded까지만 대기)
+PAGE_LOAD_STRATEGIES = ('normal', 'eager')
+
+_settings = {
+    'lean': os.environ.get('CRAWLER_LEAN_BROWSER', '') == '1',
+    'headless': os.environ.get('CRAWLER_HEADLESS', '') == '1',
+    'page_load_strategy': os.environ.get('CRAWLER_PAGE_LOAD_STRATEGY', 'normal'),
+    'measure': False,
+}
+
+# lean 모드에서 차단할 리소스 (Network.setBlockedURLs 와일드카드 패턴)
+# 리뷰 이미지는 img 태그의 src 속성만 사용하므로 이미지를 내려받을 필요가 없습니다.
+BLOCKED_EXTENSIONS = (
+    # 이미지
+    'jpg', 'jpeg', 'png', 'gif', 'webp', 'avif', 'bmp', 'ico', 'svg',
+    # 미디어
+    'mp4', 'webm', 'm3u8', 'mp3', 'm4a', 'ogg',
+    # 폰트
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+)
+BLOCKED_HOSTS = (
+    # 광고/분석
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'google-analytics.com',
+    'googletagmanager.com', 'adservice.google.com', 'connect.facebook.net', 'criteo.com', 'criteo.net',
+    'wcs.naver.net', 'lcs.naver.com', 'siape.veta.naver.com', 'nam.veta.naver.com', 'tivan.naver.com',
+)
+
+def blocked_url_patterns():
+    """lean 모드에서 차단할 URL 패턴 목록"""
+    patterns = []
+    for ext in BLOCKED_EXTENSIONS:
+        patterns.append(f'*.{ext}')
+        patterns.append(f'*.{ext}?*')
+    for host in BLOCKED_HOSTS:
+        patterns.append(f'*://{host}/*')
+        patterns.append(f'*://*.{host}/*')
+    return patterns
+
+def configure_browser(lean=None, headless=None, page_load_strategy=None, measure=None):
+    """
+    이후 생성되는 모든 브라우저에 적용할 설정을 변경합니다. (None인 항목은 유지)
+
+    Args:
+        lean (bool): 이미지/미디어/폰트/광고 요청 차단 여부
+        headless (bool): 헤드리스 모드 여부
+        page_load_strategy (str): 'normal' 또는 'eager'
+        measure (bool): 페이지별 전송량/로딩 시간 측정 여부 (performance 로그 사용)
+    """
+    if page_load_strategy is not None and page_load_strategy not in PAGE_LOAD_STRATEGIES:
+        raise ValueError(f"지원하지 않는 페이지 로딩 전략입니다: {page_load_strategy} (사용 가능: {', '.join(PAGE_LOAD_STRATEGIES)})")
+    for key, value in (('lean', lean), ('headless', headless), ('page_load_strategy', page_load_strategy), ('measure', measure)):
+        if value is not None:
+            _settings[key] = value
+    print(
+        f"[INFO] 브라우저 설정: lean={_settings['lean']}, headless={_settings['headless']}, "
+        f"page_load_strategy={_settings['page_load_strategy']}"
+    )
+
+def get_browser_settings():
+    return dict(_settings)
+
+def apply_browser_options(options):
+    """ChromeOptions에 현재 설정(headless, 로딩 전략, 이미지 차단, 측정용 로그)을 적용합니다."""
+    if _settings['headless']:
+        options.add_argument('--headless=new')
+    options.page_load_strategy = _settings['page_load_strategy']
+    if _settings['lean']:
+        # DevTools 차단과 함께 이미지 로딩 자체를 끔 (차단 패턴에 없는 확장자 대비)
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    if _settings['measure']:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+def apply_request_blocking(driver):
+    """lean 모드면 DevTools 요청 차단을 설정합니다. (드라이버 생성 직후 한 번 호출)"""
+    if not _settings['lean']:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns()})
+    except Exception as e:
+        print(f"[WARN] 요청 차단 설정 실패 (lean 모드 미적용): {e}")
+
+# 네비게이션 시작부터 load 이벤트까지의 시간과 Performance API 기준 전송량
+_NAVIGATION_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? (nav.transferSize || 0) : 0;
+performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+var loadEnd = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0;
+return {load_ms: loadEnd, dom_ms: nav ? nav.domContentLoadedEventEnd : 0, bytes: bytes,
+        requests: performance.getEntriesByType('resource').length + 1};
+"""
+
+def _performance_log_bytes(driver):
+    """
+    performance 로그(DevTools 네트워크 이벤트)에서 실제 수신 바이트 합계를 계산합니다.
+    측정 모드가 아니면 None.
+    """
+    if not _settings['measure']:
+        return None
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None
+    total = 0
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        if message.get('method') == 'Network.loadingFinished':
+            total += message.get('params', {}).get('encodedDataLength', 0)
+    return int(total)
+
+class PageMetrics:
+    """페이지별 전송량과 로딩 시간을 기록하는 통계 객체 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = []
+
+    def record(self, url, load_ms, dom_ms, bytes_transferred, requests):
+        """페이지 하나의 측정값을 기록하고 기록한 dict를 반환합니다."""
+        record = {
+            'url': url, 'load_ms': load_ms, 'dom_ms': dom_ms,
+            'bytes': bytes_transferred, 'requests': requests,
+        }
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def summary(self):
+        records = self.records()
+        if not records:
+            return {}
+        count = len(records)
+        return {
+            'pages': count,
+            'mean_load_ms': round(sum(r['load_ms'] for r in records) / count, 1),
+            'mean_kb': round(sum(r['bytes'] for r in records) / count / 1024, 1),
+            'total_mb': round(sum(r['bytes'] for r in records) / 1024 / 1024, 2),
+        }
+
+    def reset(self):
+        with self._lock:
+            self._records = []
+
+page_metrics = PageMetrics()
+
+def start_page_measurement(driver):
+    """측정 모드면 이전 페이지의 performance 로그를 비웁니다. (driver.get 직전에 호출)"""
+    if _settings['measure']:
+        _performance_log_bytes(driver)
+
+def record_page_metrics(driver, url):
+    """
+    측정 모드면 방금 로딩한 페이지의 로딩 시간과 전송량을 기록합니다.
+    전송량은 performance 로그(DevTools) 값을 우선 사용하고, 없으면 Performance API 값을 사용합니다.
+    """
+    if not _settings['measure']:
+        return None
+    try:
+        timing = driver.execute_script(_NAVIGATION_TIMING_SCRIPT) or {}
+    except Exception as e:
+        print(f"[WARN] 페이지 로딩 측정 실패: {e}")
+        return None
+    log_bytes = _performance_log_bytes(driver)
+    bytes_transferred = log_bytes if log_bytes is not None else int(timing.get('bytes', 0))
+    return page_metrics.record(url, round(timing.get('load_ms', 0), 1), round(timing.get('dom_ms', 0), 1),
+                               bytes_transferred, timing.get('requests', 0))
+
+def print_page_metrics_summary():
+    """페이지 로딩 측정 결과를 출력합니다."""
+    summary = page_metrics.summary()
+    if not summary:
+        return
+    print(
+        f"[PAGE] 페이지 {summary['pages']}개: 평균 로딩 {summary['mean_load_ms']:.0f}ms, "
+        f"평균 전송량 {summary['mean_kb']:.1f}KB, 총 {summary['total_mb']:.2f}MB (lean={_settings['lean']})"
+    )
@@ -0,0 +1,160 @@
+# common/driver_factory.py
+import os
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from common.browser import apply_browser_options, apply_request_blocking
+from common.timing import timed
+from common.waits import install_network_tracker
+
+# 상품/리뷰 크롤러 공통 Chrome 실행 인자
+DEFAULT_CHROME_ARGUMENTS = (
+    "window-size=1920x1080",  # 브라우저 크기
+    "disable-gpu",
+    "disable-infobars",
+    "--disable-extensions",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",  # 메모리 관련 오류 방지
+)
+
+# 드라이버 재활용 설정
+# - max_pages: 한 세션에서 이 수만큼 페이지를 열면 다음 작업 전에 브라우저를 새로 띄움 (0이면 사용 안 함)
+# - max_rss_mb: 브라우저 프로세스(드라이버 + Chrome) 메모리 합계가 이 값을 넘으면 새로 띄움 (0이면 사용 안 함, psutil 필요)
+_recycle_settings = {
+    'max_pages': int(os.environ.get('CRAWLER_RECYCLE_PAGES', '200')),
+    'max_rss_mb': int(os.environ.get('CRAWLER_RECYCLE_RSS_MB', '0')),
+}
+
+_driver_path = os.environ.get('CHROMEDRIVER_PATH') or None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path():
+    """
+    chromedriver 경로를 반환합니다.
+    ChromeDriverManager().install()은 버전 확인에 시간이 걸리므로 프로세스에서 한 번만 호출합니다.
+    (CHROMEDRIVER_PATH 환경 변수가 있으면 그대로 사용)
+    """
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = ChromeDriverManager().install()
+                print(f"[INFO] chromedriver 경로: {_driver_path}")
+    return _driver_path
+
+def configure_driver_recycling(max_pages=None, max_rss_mb=None):
+    """
+    드라이버 재활용 기준을 변경합니다. (None인 항목은 유지)
+
+    Args:
+        max_pages (int): 세션당 최대 페이지 수 (0이면 페이지 수로는 재활용하지 않음)
+        max_rss_mb (int): 브라우저 메모리 상한(MB) (0이면 메모리로는 재활용하지 않음)
+    """
+    if max_pages is not None:
+        _recycle_settings['max_pages'] = max(0, int(max_pages))
+    if max_rss_mb is not None:
+        _recycle_settings['max_rss_mb'] = max(0, int(max_rss_mb))
+    print(f"[INFO] 드라이버 재활용 기준: 페이지 {_recycle_settings['max_pages'] or '제한 없음'}, "
+          f"메모리 {_recycle_settings['max_rss_mb'] or '제한 없음'}MB")
+
+def create_driver(implicit_wait=3, arguments=DEFAULT_CHROME_ARGUMENTS):
+    """
+    Chrome 웹드라이버를 생성합니다.
+    headless / 로딩 전략 / lean 모드는 common.browser.configure_browser 설정을 따릅니다.
+
+    Args:
+        implicit_wait (float): 암묵적 대기 시간(초)
+        arguments (tuple): Chrome 실행 인자
+    """
+    options = webdriver.ChromeOptions()
+    for argument in arguments:
+        options.add_argument(argument)
+    apply_browser_options(options)
+
+    with timed('driver_start'):
+        service = Service(get_driver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.implicitly_wait(implicit_wait)
+        apply_request_blocking(driver)
+        install_network_tracker(driver)
+    driver.pages_loaded = 0
+    driver.implicit_wait = implicit_wait  # common.locators.no_implicit_wait가 복원할 값
+    return driver
+
+def note_page_load(driver):
+    """세션에서 연 페이지 수를 기록합니다. (driver.get 호출 위치에서 사용)"""
+    if driver is not None:
+        driver.pages_loaded = getattr(driver, 'pages_loaded', 0) + 1
+
+def is_driver_healthy(driver):
+    """세션이 살아 있고 스크립트를 실행할 수 있는지 확인합니다."""
+    if driver is None:
+        return False
+    try:
+        driver.window_handles
+        return driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+def driver_rss_mb(driver):
+    """
+    chromedriver와 하위 Chrome 프로세스(렌더러 포함)의 메모리(RSS) 합계(MB)를 반환합니다.
+    psutil이 없거나 프로세스 정보를 얻을 수 없으면 None.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / 1024 / 1024
+    except Exception:
+        return None
+
+def recycle_reason(driver):
+    """
+    세션을 새로 띄워야 하는 이유를 반환합니다. 계속 사용해도 되면 None.
+    (작업 사이에 호출 - 작업 도중에는 브라우저를 바꾸지 않음)
+    """
+    if not is_driver_healthy(driver):
+        return "세션 응답 없음"
+    max_pages = _recycle_settings['max_pages']
+    pages = getattr(driver, 'pages_loaded', 0)
+    if max_pages and pages >= max_pages:
+        return f"페이지 {pages}개 처리"
+    max_rss_mb = _recycle_settings['max_rss_mb']
+    if max_rss_mb:
+        rss = driver_rss_mb(driver)
+        if rss is not None and rss > max_rss_mb:
+            return f"메모리 {rss:.0f}MB 사용"
+    return None
+
+def reset_session(driver):
+    """
+    오류 후에도 세션이 살아 있으면 브라우저를 다시 띄우지 않고 빈 페이지로 초기화합니다.
+
+    Returns:
+        bool: 초기화 성공 여부 (False면 새로 띄워야 함)
+    """
+    if not is_driver_healthy(driver):
+        return False
+    try:
+        handles = driver.window_handles
+        # 오류 도중 열린 탭이 있으면 닫고 첫 탭으로 돌아감
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,60 @@
+# common/endpoints.py
+import os
+
+# 크롤링 대상 주소 설정 (모든 크롤러에 공통 적용)
+# - shopping: 카테고리 목록 페이지와 제품 카드 링크의 주소
+# - brand: 상대 경로로 주어진 상품 URL을 붙일 주소
+# CRAWLER_BASE_URL(또는 set_base_url)을 지정하면 두 주소를 모두 그 주소로 바꿉니다.
+# (benchmarks/standin_server.py 같은 로컬 대역 서버로 크롤러 전체를 돌릴 때 사용)
+DEFAULT_SHOPPING_URL = 'https://shopping.naver.com'
+DEFAULT_BRAND_URL = 'https://brand.naver.com'
+
+CATEGORY_PATH = '/window/style/category?menu=20033952'
+PRODUCT_PATH_PREFIX = '/window-products/style/'
+
+_settings = {
+    'shopping': DEFAULT_SHOPPING_URL,
+    'brand': DEFAULT_BRAND_URL,
+}
+
+def set_base_url(url=None):
+    """
+    쇼핑/브랜드 주소를 url 하나로 바꿉니다. (None이면 실제 네이버 주소로 복원)
+
+    Args:
+        url (str): 예) 'http://127.0.0.1:8765'
+    """
+    if url:
+        url = url.rstrip('/')
+        if not url.startswith(('http://', 'https://')):
+            raise ValueError(f"base URL은 http:// 또는 https://로 시작해야 합니다: {url}")
+        _settings['shopping'] = url
+        _settings['brand'] = url
+        print(f"[INFO] 크롤링 대상 주소: {url}")
+    else:
+        _settings['shopping'] = DEFAULT_SHOPPING_URL
+        _settings['brand'] = DEFAULT_BRAND_URL
+
+def get_base_urls():
+    return dict(_settings)
+
+def category_url():
+    """카테고리(여성의류) 목록 페이지 주소"""
+    return _settings['shopping'] + CATEGORY_PATH
+
+def product_url_prefix():
+    """제품 카드 링크 주소의 공통 앞부분"""
+    return _settings['shopping'] + PRODUCT_PATH_PREFIX
+
+def product_card_selector():
+    """목록 페이지의 제품 카드 링크 선택자"""
+    return f"a[href^='{product_url_prefix()}']"
+
+def absolute_url(url):
+    """상대 경로 상품 URL('/store/products/...')을 브랜드 주소 기준의 절대 경로로 바꿉니다."""
+    if isinstance(url, str) and url.startswith('/'):
+        return _settings['brand'] + url
+    return url
+
+if os.environ.get('CRAWLER_BASE_URL'):
+    set_base_url(os.environ['CRAWLER_BASE_URL'])
@@ -0,0 +1,54 @@
+# common/html_parser.py
+import os
+from bs4 import BeautifulSoup
+
+from common.timing import timed
+
+# 사용 가능한 HTML 파서 백엔드
+# - html.parser: 파이썬 기본 파서 (기존 동작)
+# - lxml: BeautifulSoup + lxml 파서
+# - selectolax: lexbor 기반 파서 (BeautifulSoup 호환 어댑터 사용)
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+DEFAULT_PARSER_BACKEND = 'html.parser'
+
+_parser_backend = os.environ.get('CRAWLER_PARSER_BACKEND', DEFAULT_PARSER_BACKEND)
+
+def set_parser_backend(backend):
+    """
+    모든 추출 함수가 사용할 HTML 파서 백엔드를 설정합니다.
+
+    Args:
+        backend (str): PARSER_BACKENDS 중 하나
+    """
+    global _parser_backend
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend} (사용 가능: {', '.join(PARSER_BACKENDS)})")
+    _parser_backend = backend
+    print(f"[INFO] HTML 파서 백엔드: {backend}")
+
+def get_parser_backend():
+    """현재 설정된 HTML 파서 백엔드 이름을 반환합니다."""
+    return _parser_backend
+
+def parse_html(html_source, backend=None):
+    """
+    HTML 문자열을 지정된 백엔드로 파싱합니다.
+
+    반환되는 객체는 백엔드와 관계없이 추출 함수들이 사용하는
+    BeautifulSoup API(select, select_one, find, find_all, get_text 등)를 제공합니다.
+
+    Args:
+        html_source (str): HTML 소스
+        backend (str, optional): 사용할 백엔드 (None이면 현재 설정값)
+
+    Returns:
+        BeautifulSoup | LexborDocument: 파싱된 문서 트리
+    """
+    backend = backend or _parser_backend
+    with timed('html_parse'):
+        if backend == 'selectolax':
+            from common.lexbor_tree import LexborDocument
+            return LexborDocument(html_source)
+        if backend in ('html.parser', 'lxml'):
+            return BeautifulSoup(html_source, backend)
+    raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend}")
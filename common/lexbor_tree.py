@@ -0,0 +1,190 @@
+# common/lexbor_tree.py
+import re
+from selectolax.lexbor import LexborHTMLParser
+
+# BeautifulSoup에서 여러 값을 갖는 속성 (리스트로 반환됨)
+MULTI_VALUED_ATTRIBUTES = ('class', 'rel', 'rev', 'accept-charset', 'headers', 'accesskey', 'dropzone')
+
+# BeautifulSoup의 get_text()가 상위 요소 텍스트에 포함하지 않는 문자열 컨테이너
+STRING_CONTAINER_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+_STRING_CONTAINER_SELECTOR = ', '.join(STRING_CONTAINER_TAGS)
+
+_CONTAINS_PATTERN = re.compile(r':(?:-soup-)?contains\(')
+
+_translated_selectors = {}
+
+def translate_selector(selector):
+    """
+    soupsieve 문법의 선택자를 lexbor 문법으로 변환합니다.
+    (:contains / :-soup-contains → :lexbor-contains)
+    미리 컴파일된 soupsieve 선택자는 원본 문자열을 사용하며, 변환 결과는 선택자별로 한 번만 계산합니다.
+    """
+    selector = getattr(selector, 'pattern', selector)
+    translated = _translated_selectors.get(selector)
+    if translated is None:
+        translated = _translated_selectors[selector] = _CONTAINS_PATTERN.sub(':lexbor-contains(', selector)
+    return translated
+
+def _convert_attributes(attributes):
+    converted = {}
+    for key, value in attributes.items():
+        if value is None:
+            value = ''
+        if key in MULTI_VALUED_ATTRIBUTES:
+            value = value.split()
+        converted[key] = value
+    return converted
+
+def _matches_attrs(node, attrs):
+    """BeautifulSoup find()의 attrs 조건과 동일한 방식으로 속성을 비교합니다."""
+    attributes = node.attributes
+    for key, expected in attrs.items():
+        value = attributes.get(key)
+        if value is None:
+            return False
+        if key in MULTI_VALUED_ATTRIBUTES and ' ' not in expected:
+            # 공백 없는 클래스명은 토큰 단위로 비교
+            if expected not in value.split():
+                return False
+        elif value != expected:
+            return False
+    return True
+
+class LexborNode:
+    """selectolax(lexbor) 노드를 BeautifulSoup Tag와 같은 방식으로 다루기 위한 어댑터"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def __eq__(self, other):
+        return isinstance(other, LexborNode) and self._node.mem_id == other._node.mem_id
+
+    def __hash__(self):
+        return hash(self._node.mem_id)
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return f"<LexborNode {self.name}>"
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def attrs(self):
+        return _convert_attributes(self._node.attributes)
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        return LexborNode(parent) if parent is not None else None
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key):
+        return key in self._node.attributes
+
+    def _css(self, selector):
+        """
+        하위 요소 중 selector와 일치하는 노드 목록
+        (selectolax의 Node.css는 자기 자신도 포함하지만 BeautifulSoup의 select/find_all은 하위 요소만 검색)
+        """
+        nodes = self._node.css(selector)
+        # 결과는 문서 순서이므로 자기 자신이 일치했다면 항상 첫 번째
+        if nodes and nodes[0].mem_id == self._node.mem_id:
+            return nodes[1:]
+        return nodes
+
+    def _css_first(self, selector):
+        node = self._node.css_first(selector)
+        if node is not None and node.mem_id == self._node.mem_id:
+            # 자기 자신이 일치한 경우에만 전체 목록에서 다음 노드를 찾음
+            nodes = self._css(selector)
+            return nodes[0] if nodes else None
+        return node
+
+    def select(self, selector):
+        return [LexborNode(node) for node in self._css(translate_selector(selector))]
+
+    def select_one(self, selector):
+        node = self._css_first(translate_selector(selector))
+        return LexborNode(node) if node is not None else None
+
+    def find_all(self, name=None, attrs=None):
+        nodes = self._css(name or '*')
+        if attrs:
+            nodes = [node for node in nodes if _matches_attrs(node, attrs)]
+        return [LexborNode(node) for node in nodes]
+
+    def find(self, name=None, attrs=None):
+        if not attrs:
+            node = self._css_first(name or '*')
+            return LexborNode(node) if node is not None else None
+        for node in self._css(name or '*'):
+            if _matches_attrs(node, attrs):
+                return LexborNode(node)
+        return None
+
+    def find_parent(self, name=None):
+        parent = self._node.parent
+        while parent is not None:
+            if parent.is_element_node and (name is None or parent.tag == name):
+                return LexborNode(parent)
+            parent = parent.parent
+        return None
+
+    def _iter_strings(self, node, inside_container):
+        for child in node.iter(include_text=True):
+            if child.is_text_node:
+                yield child.text_content or ''
+            elif child.is_element_node:
+                if not inside_container and child.tag in STRING_CONTAINER_TAGS:
+                    continue
+                yield from self._iter_strings(child, inside_container)
+
+    def get_text(self, separator='', strip=False):
+        """BeautifulSoup의 get_text()와 같은 결과를 반환합니다."""
+        node = self._node
+        inside_container = node.tag in STRING_CONTAINER_TAGS
+        if inside_container or node.css_first(_STRING_CONTAINER_SELECTOR) is None:
+            # 제외할 컨테이너가 없으면 lexbor의 네이티브 텍스트 추출 사용
+            # (strip 시 빈 문자열을 건너뛰는 방식이 달라 구분자가 있으면 직접 처리)
+            if not strip or not separator:
+                return node.text(deep=True, separator=separator, strip=strip)
+        strings = self._iter_strings(node, inside_container)
+        if strip:
+            strings = (string.strip() for string in strings)
+            strings = (string for string in strings if string)
+        return separator.join(strings)
+
+class LexborDocument(LexborNode):
+    """HTML 문서 전체를 나타내는 lexbor 어댑터 (BeautifulSoup 객체에 대응)"""
+
+    __slots__ = ('_parser',)
+
+    def __init__(self, html_source):
+        self._parser = LexborHTMLParser(html_source)
+        super().__init__(self._parser.root)
+
+    @property
+    def name(self):
+        return '[document]'
+
+    def _css(self, selector):
+        # 문서 객체는 최상위 요소(html)도 하위 요소로 검색 (BeautifulSoup 객체와 동일)
+        return self._parser.css(selector)
+
+    def _css_first(self, selector):
+        return self._parser.css_first(selector)
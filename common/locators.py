@@ -0,0 +1,100 @@
+# common/locators.py
+import time
+from contextlib import contextmanager
+
+from common.waits import wait_until
+
+# 선택자 후보 목록 중 현재 문서에 요소가 있는 첫 번째 후보를 찾는 스크립트
+# arguments[0]: [{xpath} 또는 {css, text}] 목록, arguments[1]: 검사를 시작할 순번
+# 반환값: [순번, 요소] (없으면 null)
+_PROBE_SCRIPT = """
+var specs = arguments[0];
+for (var i = arguments[1]; i < specs.length; i++) {
+    var spec = specs[i], nodes = [];
+    if (spec.xpath) {
+        var found = document.evaluate(spec.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var j = 0; j < found.snapshotLength; j++) nodes.push(found.snapshotItem(j));
+    } else {
+        nodes = document.querySelectorAll(spec.css);
+    }
+    for (var k = 0; k < nodes.length; k++) {
+        if (spec.text && (nodes[k].textContent || '').indexOf(spec.text) < 0) continue;
+        return [i, nodes[k]];
+    }
+}
+return null;
+"""
+
+@contextmanager
+def no_implicit_wait(driver):
+    """
+    블록 안에서 암묵적 대기를 끕니다. (없는 요소를 찾을 때 find_element(s)가 implicit_wait만큼 멈추지 않음)
+    블록이 끝나면 create_driver에 지정했던 값으로 되돌립니다.
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(getattr(driver, 'implicit_wait', 0))
+
+def parse_selector(selector):
+    """
+    선택자 문자열을 프로브 스크립트용 사양으로 바꿉니다.
+    - '//...': XPath
+    - 'css:contains("텍스트")': CSS 선택자 + 텍스트 포함 조건 (jQuery 문법은 브라우저가 지원하지 않음)
+    - 그 외: CSS 선택자
+    """
+    if selector.startswith('//'):
+        return {'xpath': selector}
+    if ':contains(' in selector:
+        css, rest = selector.split(':contains(', 1)
+        return {'css': css or '*', 'text': rest.rsplit(')', 1)[0].strip('\'"')}
+    return {'css': selector}
+
+def find_any(driver, selectors, condition, timeout=None, description="", start=0):
+    """
+    선택자 후보 중 요소가 있는 첫 번째 후보를 찾을 때까지 대기합니다. (최대 timeout, 조건별 기본값)
+    후보마다 find_element로 implicit_wait를 기다리지 않고 스크립트 한 번으로 모든 후보를 검사합니다.
+
+    Returns:
+        tuple: (순번, 선택자, 요소) - 찾지 못하면 (None, None, None)
+    """
+    specs = [parse_selector(selector) for selector in selectors]
+    found = {}
+
+    def check(d):
+        result = d.execute_script(_PROBE_SCRIPT, specs, start)
+        if result:
+            found['index'], found['element'] = result
+            return True
+        return False
+
+    begin = time.perf_counter()
+    wait_until(driver, condition, check, timeout)
+    elapsed = time.perf_counter() - begin
+    if not found:
+        print(f">> [DEBUG] {description} 선택자 후보 {len(selectors) - start}개 중 일치 없음 ({elapsed:.2f}초)")
+        return None, None, None
+    index = int(found['index'])
+    print(f">> [DEBUG] {description} 선택자 일치: [{index}] {selectors[index]} ({elapsed:.2f}초)")
+    return index, selectors[index], found['element']
+
+def click_any(driver, selectors, click, condition, timeout=None, description=""):
+    """
+    find_any로 찾은 요소를 click(element)으로 클릭합니다.
+    클릭에 실패하면 기다리지 않고 다음 후보부터 다시 찾습니다.
+
+    Returns:
+        str: 클릭한 요소의 선택자 (모두 실패하면 None)
+    """
+    start = 0
+    with no_implicit_wait(driver):
+        while start < len(selectors):
+            index, selector, element = find_any(driver, selectors, condition, timeout, description, start)
+            if element is None:
+                return None
+            if click(element):
+                return selector
+            print(f"[WARN] {description} 클릭 실패: {selector}")
+            start, timeout = index + 1, 0
+    return None
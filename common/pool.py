@@ -0,0 +1,159 @@
+# common/pool.py
+import queue
+import threading
+import time
+import traceback
+
+from common.driver_factory import recycle_reason, reset_session
+
+class CrawlerPool:
+    """
+    여러 개의 브라우저 워커가 작업 목록을 나누어 처리하는 크롤러 풀 (상품/리뷰 크롤러와 URL 크롤러 공용)
+
+    각 워커는 crawler_factory로 만든 자신만의 크롤러 객체(브라우저)를 가지며,
+    실패 시 세션이 살아 있으면 그대로 재사용하고, 응답이 없을 때만 해당 워커의 브라우저를 재시작합니다.
+    작업 사이에는 페이지 수/메모리 기준(common.driver_factory)을 넘은 브라우저를 미리 교체합니다.
+    결과는 완료 순서와 관계없이 입력 순서대로 반환됩니다.
+    """
+
+    def __init__(self, crawler_factory, workers=1, max_retries=3, retry_delay=5, max_pending=None):
+        """
+        Args:
+            crawler_factory (callable): 워커별 크롤러 객체를 생성하는 함수
+                (생성한 객체는 driver 속성과 setup_driver() / close() 메서드를 제공해야 함)
+            workers (int): 동시에 실행할 브라우저 워커 수
+            max_retries (int): 작업당 최대 시도 횟수
+            retry_delay (float): 재시도 전 대기 시간(초)
+            max_pending (int, optional): 아직 반환되지 않은 결과를 최대 몇 개까지 앞서 처리할지
+                (None이면 워커 수의 4배). 느린 작업 하나 때문에 결과가 메모리에 무한히 쌓이지 않도록 합니다.
+        """
+        self.workers = max(1, int(workers or 1))
+        self.max_retries = max(1, int(max_retries or 1))
+        self.retry_delay = retry_delay
+        self.crawler_factory = crawler_factory
+        self.max_pending = max(self.workers, int(max_pending or self.workers * 4))
+
+    def _recycle(self, crawler, worker_id, reason="오류"):
+        """워커의 브라우저를 종료하고 새로 띄웁니다."""
+        print(f"[POOL] 워커 {worker_id}: 드라이버 재설정 ({reason})")
+        try:
+            crawler.close()
+        except Exception as e:
+            print(f"[POOL] 워커 {worker_id}: 드라이버 종료 중 오류: {e}")
+        try:
+            crawler.setup_driver()
+        except Exception as e:
+            # 다음 작업 시도에서 다시 드라이버 생성을 시도합니다.
+            print(f"[POOL] 워커 {worker_id}: 드라이버 재시작 실패: {e}")
+
+    def _prepare(self, crawler, worker_id):
+        """작업 전에 드라이버를 준비합니다. 재활용 기준을 넘었거나 응답이 없는 세션만 새로 띄웁니다."""
+        if crawler.driver is None:
+            crawler.setup_driver()
+            return
+        reason = recycle_reason(crawler.driver)
+        if reason:
+            self._recycle(crawler, worker_id, reason)
+
+    def _recover(self, crawler, worker_id):
+        """오류 후 세션이 살아 있으면 초기화하여 재사용하고, 아니면 브라우저를 재시작합니다."""
+        if reset_session(crawler.driver):
+            print(f"[POOL] 워커 {worker_id}: 세션 정상 - 브라우저를 재시작하지 않고 재사용")
+            return
+        self._recycle(crawler, worker_id, "세션 응답 없음")
+
+    def _process(self, crawler, worker_id, task, handler):
+        """재시도 로직을 포함하여 작업 하나를 처리합니다. 실패 시 None 반환."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self._prepare(crawler, worker_id)
+                return handler(crawler, task)
+            except Exception as e:
+                print(f"[POOL] 워커 {worker_id}: 오류 발생 ({attempt}/{self.max_retries}): {e}")
+                traceback.print_exc()
+                self._recover(crawler, worker_id)
+                if attempt < self.max_retries:
+                    print(f"[POOL] 워커 {worker_id}: {self.retry_delay}초 후 재시도...")
+                    time.sleep(self.retry_delay)
+                else:
+                    print(f"[POOL] 워커 {worker_id}: 최대 재시도 횟수 초과. 다음 작업으로 넘어갑니다.")
+        return None
+
+    def _worker(self, worker_id, task_queue, handler, results, cond, stop_event, progress):
+        crawler = self.crawler_factory()
+        try:
+            while not stop_event.is_set():
+                try:
+                    index, task = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # 소비자가 결과를 가져갈 때까지 너무 앞서 나가지 않도록 대기
+                with cond:
+                    while index >= progress['next'] + self.max_pending and not stop_event.is_set():
+                        cond.wait(timeout=1)
+                if stop_event.is_set():
+                    break
+                result = self._process(crawler, worker_id, task, handler)
+                with cond:
+                    results[index] = result
+                    cond.notify_all()
+        finally:
+            try:
+                crawler.close()
+            except Exception as e:
+                print(f"[POOL] 워커 {worker_id}: 크롤러 종료 중 오류: {e}")
+
+    def run(self, tasks, handler):
+        """
+        작업 목록을 워커들에게 분배하고 결과를 입력 순서대로 반환합니다.
+
+        Args:
+            tasks (list): 처리할 작업 목록
+            handler (callable): handler(crawler, task) 형태로 호출되는 작업 함수
+
+        Yields:
+            tuple: (index, task, result) - 최대 재시도 후에도 실패한 작업의 result는 None
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+
+        task_queue = queue.Queue()
+        for index, task in enumerate(tasks):
+            task_queue.put((index, task))
+
+        results = {}
+        progress = {'next': 0}
+        cond = threading.Condition()
+        stop_event = threading.Event()
+        worker_count = min(self.workers, len(tasks))
+        threads = []
+        for worker_id in range(worker_count):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(worker_id + 1, task_queue, handler, results, cond, stop_event, progress),
+                name=f"crawler-worker-{worker_id + 1}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        print(f"[POOL] 브라우저 워커 {worker_count}개로 {len(tasks)}개 작업 시작")
+
+        try:
+            for index, task in enumerate(tasks):
+                with cond:
+                    while index not in results:
+                        if not any(thread.is_alive() for thread in threads):
+                            # 모든 워커가 비정상 종료된 경우 남은 작업은 실패로 처리
+                            results[index] = None
+                            break
+                        cond.wait(timeout=1)
+                    result = results.pop(index)
+                    progress['next'] = index + 1
+                    cond.notify_all()
+                yield index, task, result
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 작업을 가져가지 않도록 합니다.
+            stop_event.set()
+            for thread in threads:
+                thread.join()
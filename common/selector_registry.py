@@ -0,0 +1,93 @@
+# common/selector_registry.py
+import os
+import json
+import threading
+
+import soupsieve
+
+# 이름 붙은 선택자 그룹을 담은 데이터 파일
+# - soup: 파싱한 문서 트리(soup.select)에 쓰는 CSS 선택자 → 불러올 때 soupsieve로 미리 컴파일
+# - browser: 드라이버(find_elements)나 페이지 안 스크립트에 넘기는 선택자 문자열 (XPath, ':contains' 포함)
+# - state: 페이지에 포함된 상태 JSON(__PRELOADED_STATE__)의 값 경로 ('product.A.name' 형식, reviewcrawler.page_state)
+# 값은 선택자 하나(문자열) 또는 앞에서부터 시도할 대체 선택자 목록입니다.
+# 네이버의 클래스명이 바뀌면 코드 대신 이 파일(또는 CRAWLER_SELECTOR_FILE로 지정한 파일)을 고칩니다.
+DEFAULT_SELECTOR_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'selectors.json')
+
+class SelectorRegistry:
+    """
+    데이터 파일의 선택자 그룹을 한 번 읽어 두고 이름으로 꺼내 쓰는 저장소
+
+    soup 그룹은 미리 컴파일된 soupsieve 객체로 보관하므로 soup.select/select_one에 그대로 넘기면
+    호출마다 선택자 문자열을 다시 해석하지 않습니다. (selectolax 백엔드는 객체의 원본 문자열 사용)
+    """
+
+    def __init__(self, path=DEFAULT_SELECTOR_FILE):
+        self._lock = threading.Lock()
+        self.path = None
+        self._patterns = {}
+        self._compiled = {}
+        self.load(path)
+
+    def load(self, path):
+        """
+        데이터 파일을 읽고 soup 그룹을 모두 컴파일합니다.
+        (잘못된 선택자가 있으면 크롤링 도중이 아니라 여기서 ValueError 발생)
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        patterns = {}
+        compiled = {}
+        for section in ('soup', 'browser', 'state'):
+            for name, value in data.get(section, {}).items():
+                if name in patterns:
+                    raise ValueError(f"선택자 그룹 이름이 중복됩니다: {name} ({path})")
+                patterns[name] = value
+                if section == 'soup':
+                    try:
+                        if isinstance(value, list):
+                            compiled[name] = [soupsieve.compile(pattern) for pattern in value]
+                        else:
+                            compiled[name] = soupsieve.compile(value)
+                    except Exception as e:
+                        raise ValueError(f"선택자 그룹 '{name}'을(를) 컴파일하지 못했습니다: {e}") from e
+        with self._lock:
+            self.path = path
+            self._patterns = patterns
+            self._compiled = compiled
+        return self
+
+    def selectors(self, name):
+        """soup 그룹의 컴파일된 선택자 (목록 그룹이면 목록)"""
+        try:
+            return self._compiled[name]
+        except KeyError:
+            raise KeyError(f"soup 선택자 그룹이 없습니다: {name} ({self.path})") from None
+
+    def patterns(self, name):
+        """선택자 그룹의 원본 문자열 (목록 그룹이면 목록)"""
+        try:
+            return self._patterns[name]
+        except KeyError:
+            raise KeyError(f"선택자 그룹이 없습니다: {name} ({self.path})") from None
+
+    def names(self):
+        return sorted(self._patterns)
+
+registry = SelectorRegistry(os.environ.get('CRAWLER_SELECTOR_FILE', DEFAULT_SELECTOR_FILE))
+
+def load_selector_file(path):
+    """다른 선택자 데이터 파일로 바꿉니다. (모든 추출 함수가 다음 호출부터 사용)"""
+    registry.load(path)
+    print(f"[INFO] 선택자 파일: {path} (그룹 {len(registry.names())}개)")
+
+def selectors(name):
+    """soup.select/select_one에 넘길 컴파일된 선택자"""
+    return registry.selectors(name)
+
+def patterns(name):
+    """드라이버나 페이지 안 스크립트에 넘길 선택자 문자열"""
+    return registry.patterns(name)
+
+def selector_key(selector):
+    """컴파일된 선택자도 원본 문자열로 (통계 기록, 로그 출력용)"""
+    return getattr(selector, 'pattern', selector)
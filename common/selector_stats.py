@@ -0,0 +1,225 @@
+# common/selector_stats.py
+import os
+import json
+import threading
+from datetime import datetime
+
+from common.selector_registry import selector_key
+
+# 대체 선택자 목록의 시도 순서
+# - static: 선택자 파일(common/selectors.json)에 적힌 순서대로 시도
+# - adaptive: 기본 선택자가 클래스명 변경으로 판단될 만큼 일치하지 않으면(ROTATION_LOOKUPS) 마지막으로 일치한
+#             선택자를 먼저 시도하고, 그 전까지는 static과 같이 적힌 순서대로 시도
+# 대체 선택자는 기본 선택자와 같은 요소를 가리키지 않을 수 있으므로(예: 'div[class*="content"]'는 더 넓은 영역)
+# 항목 하나에서 기본 선택자가 빠졌다고 대체 선택자를 앞세우면 이후 항목의 추출 결과가 달라집니다.
+SELECTOR_ORDERS = ('static', 'adaptive')
+DEFAULT_SELECTOR_ORDER = 'static'
+
+# 첫 번째(기본) 선택자가 그룹 조회 이 횟수 동안 한 번도 일치하지 않고 다른 선택자가 일치하면 클래스명이 바뀐 것으로 봅니다.
+# (adaptive 순서에서 바뀐 뒤에는 기본 선택자를 매번 시도하지 않으므로 불일치 횟수 대신 마지막 일치 이후 조회 횟수로 판단)
+ROTATION_LOOKUPS = 20
+
+# adaptive 순서에서 대체 선택자를 앞세운 동안에도 이 횟수의 조회마다 한 번은 적힌 순서(기본 선택자 먼저)로 시도합니다.
+# 넓은 대체 선택자는 항상 일치하므로 기본 선택자를 따로 시도하지 않으면 기본 선택자가 다시 맞아도 순서가 돌아오지 않습니다.
+# (기본 선택자가 일치하면 마지막 일치 이후 조회 횟수가 0이 되어 바로 적힌 순서로 돌아감)
+PRIMARY_PROBE_LOOKUPS = 10
+
+_order = os.environ.get('CRAWLER_SELECTOR_ORDER', DEFAULT_SELECTOR_ORDER)
+
+class SelectorStats:
+    """
+    선택자 그룹(예: review_date)별로 선택자의 일치/불일치 횟수와 마지막으로 일치한 선택자를 기록합니다. (스레드 안전)
+    save/load로 실행 간에 유지하여 다음 실행도 마지막으로 일치한 선택자부터 시도합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._groups = {}
+        self._journal = None
+
+    def _group(self, group, selectors):
+        declared = [selector_key(selector) for selector in selectors]
+        state = self._groups.get(group)
+        if state is None:
+            state = self._groups[group] = {'declared': declared, 'last_hit': None, 'lookups': 0, 'found': 0, 'selectors': {}}
+        elif state['declared'] != declared:
+            # 선택자 파일의 목록이 바뀌면 새 목록 기준으로 기록 (없어진 선택자의 기록은 유지)
+            state['declared'] = declared
+        return state
+
+    @staticmethod
+    def _rotated(state):
+        """기본 선택자가 ROTATION_LOOKUPS회 조회 동안 일치하지 않고 다른 선택자가 마지막으로 일치했는지"""
+        primary = state['declared'][0] if state['declared'] else None
+        primary_idle = state['lookups'] - state['selectors'].get(primary, {}).get('last_hit_lookup', 0)
+        return bool(state['last_hit'] and state['last_hit'] != primary and primary_idle >= ROTATION_LOOKUPS)
+
+    def order(self, group, selectors):
+        """
+        이번에 시도할 선택자 순서를 반환합니다. (컴파일된 선택자는 원본 문자열로 비교)
+        adaptive 순서에서도 기본 선택자의 클래스명이 바뀐 것으로 판단된 그룹만 마지막으로 일치한 선택자를 앞세우며,
+        그 동안에도 PRIMARY_PROBE_LOOKUPS회마다 적힌 순서로 시도하여 기본 선택자가 다시 일치하는지 확인합니다.
+        """
+        if _order == 'static':
+            return selectors
+        state = self._groups.get(group)
+        if state is None or not self._rotated(state) or state['lookups'] % PRIMARY_PROBE_LOOKUPS == 0:
+            return selectors
+        last_hit = state['last_hit']
+        if selector_key(selectors[0]) == last_hit:
+            return selectors
+        for selector in selectors:
+            if selector_key(selector) == last_hit:
+                return [selector] + [other for other in selectors if other is not selector]
+        return selectors
+
+    def record(self, group, selectors, tried, hit):
+        """
+        시도 결과를 기록합니다.
+
+        Args:
+            group (str): 선택자 그룹 이름
+            selectors (list): 선택자 파일에 적힌 선택자 목록 (문자열 또는 컴파일된 선택자)
+            tried (list): 실제로 시도한 선택자 (시도한 순서)
+            hit (str): 일치한 선택자 (없으면 None)
+        """
+        tried = [selector_key(selector) for selector in tried]
+        hit = selector_key(hit)
+        with self._lock:
+            state = self._group(group, selectors)
+            state['lookups'] += 1
+            for selector in tried:
+                counts = state['selectors'].setdefault(selector, {'hits': 0, 'misses': 0, 'last_hit_lookup': 0})
+                if selector == hit:
+                    counts['hits'] += 1
+                    counts['last_hit_lookup'] = state['lookups']
+                else:
+                    counts['misses'] += 1
+            if hit is not None:
+                state['found'] += 1
+                state['last_hit'] = hit
+            if self._journal is not None:
+                self._journal.append((group, state['declared'], tried, hit))
+
+    def summary(self):
+        """그룹별 마지막 일치 선택자, 선택자별 일치/불일치 횟수와 일치율, 클래스명 변경 의심 여부를 반환합니다."""
+        with self._lock:
+            result = {}
+            for group, state in self._groups.items():
+                rows = []
+                for selector in state['declared'] + [s for s in state['selectors'] if s not in state['declared']]:
+                    counts = state['selectors'].get(selector, {'hits': 0, 'misses': 0, 'last_hit_lookup': 0})
+                    total = counts['hits'] + counts['misses']
+                    rows.append({
+                        'selector': selector,
+                        'declared': selector in state['declared'],
+                        'hits': counts['hits'],
+                        'misses': counts['misses'],
+                        'lookups_since_hit': state['lookups'] - counts['last_hit_lookup'],
+                        'hit_rate': round(counts['hits'] / total, 3) if total else None,
+                    })
+                result[group] = {
+                    'last_hit': state['last_hit'],
+                    'lookups': state['lookups'],
+                    'found': state['found'],
+                    'rotated': self._rotated(state),
+                    'selectors': rows,
+                }
+            return result
+
+    def load(self, path):
+        """save로 저장한 파일에서 기록을 불러옵니다. (파일이 없거나 읽을 수 없으면 무시)"""
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 선택자 통계 파일을 읽지 못했습니다: {path} ({e})")
+            return False
+        with self._lock:
+            self._groups = {}
+            for group, saved in data.get('groups', {}).items():
+                self._groups[group] = {
+                    'declared': [row['selector'] for row in saved['selectors'] if row.get('declared')],
+                    'last_hit': saved.get('last_hit'),
+                    'lookups': saved.get('lookups', 0),
+                    'found': saved.get('found', 0),
+                    'selectors': {
+                        row['selector']: {
+                            'hits': row['hits'],
+                            'misses': row['misses'],
+                            'last_hit_lookup': saved.get('lookups', 0) - row.get('lookups_since_hit', 0),
+                        }
+                        for row in saved['selectors']
+                    },
+                }
+        return True
+
+    def save(self, path):
+        """기록을 JSON 파일로 저장합니다. (summary 형식, 다음 실행에서 load)"""
+        data = {'updated_at': datetime.now().isoformat(timespec='seconds'), 'groups': self.summary()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self._groups.clear()
+
+    def start_journal(self):
+        """이후의 record 호출을 기록해 둡니다. (백그라운드 파싱 프로세스의 기록을 메인 프로세스로 옮길 때 사용)"""
+        with self._lock:
+            self._journal = []
+
+    def take_journal(self):
+        """start_journal 이후(또는 마지막 take_journal 이후) 쌓인 기록을 꺼냅니다."""
+        with self._lock:
+            journal = self._journal or []
+            if self._journal is not None:
+                self._journal = []
+            return journal
+
+    def replay(self, journal):
+        """다른 프로세스에서 take_journal로 꺼낸 기록을 이 통계에 반영합니다."""
+        for group, selectors, tried, hit in journal:
+            self.record(group, selectors, tried, hit)
+
+selector_stats = SelectorStats()
+
+def set_selector_order(order):
+    """대체 선택자 시도 순서(static/adaptive)를 설정합니다."""
+    global _order
+    if order not in SELECTOR_ORDERS:
+        raise ValueError(f"지원하지 않는 선택자 순서입니다: {order} (사용 가능: {', '.join(SELECTOR_ORDERS)})")
+    _order = order
+    print(f"[INFO] 선택자 시도 순서: {order}")
+
+def get_selector_order():
+    return _order
+
+def first_match(group, selectors, find):
+    """
+    선택자를 그룹의 시도 순서대로 find(selector)에 넘겨 처음으로 None이 아닌 결과를 반환합니다.
+    (모두 None이면 None, 시도 결과는 selector_stats에 기록)
+    """
+    tried = []
+    for selector in selector_stats.order(group, selectors):
+        tried.append(selector)
+        result = find(selector)
+        if result is not None:
+            selector_stats.record(group, selectors, tried, selector)
+            return result
+    selector_stats.record(group, selectors, tried, None)
+    return None
+
+def print_selector_summary():
+    """선택자 그룹별 마지막 일치 선택자와 클래스명 변경 의심 그룹을 출력합니다."""
+    summary = selector_stats.summary()
+    if not summary:
+        return
+    print("[INFO] 선택자 통계 (그룹: 마지막 일치 선택자, 찾은 횟수/조회 횟수)")
+    for group, state in sorted(summary.items()):
+        print(f"  - {group}: {state['last_hit']} ({state['found']}/{state['lookups']})")
+        if state['rotated']:
+            primary = state['selectors'][0]
+            print(f"[WARN] {group}: 기본 선택자 '{primary['selector']}'가 최근 {primary['lookups_since_hit']}회 조회 동안 불일치 (클래스명 변경 의심)")
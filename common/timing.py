@@ -0,0 +1,264 @@
+# common/timing.py
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+
+# 단계별 소요 시간 계측
+# 단계가 중첩되면(예: 추출 중 지연 파싱) 안쪽 단계 시간은 바깥 단계에서 빠지므로
+# 단계별 합계가 실제 벽시계 시간을 나눈 값이 됩니다.
+STAGES = (
+    'driver_start',      # 브라우저 시작
+    'driver_get',        # driver.get (페이지 이동)
+    'tab_click',         # 상세/리뷰 탭, 정렬, 메뉴 클릭
+    'wait',              # 고정 sleep 또는 조건 대기 (common.waits)
+    'page_source',       # driver.page_source 가져오기
+    'html_parse',        # HTML 파싱
+    'extract',           # 필드 추출
+    'pagination_click',  # 리뷰 페이지 이동 클릭
+    'parse_wait',        # 백그라운드 파싱 결과 대기 (reviewcrawler.parse_pipeline)
+    'output_write',      # 결과 파일 기록
+)
+
+_enabled = os.environ.get('CRAWLER_TIMING', '') == '1'
+_local = threading.local()
+
+class StageTimer:
+    """단계별 소요 시간 표본을 상품/카테고리와 함께 기록하는 객체 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = []
+        self._started = time.perf_counter()
+
+    def record(self, stage, seconds, product=None, category=None):
+        with self._lock:
+            self._samples.append((stage, seconds, product, category))
+
+    def samples(self):
+        with self._lock:
+            return list(self._samples)
+
+    def reset(self):
+        with self._lock:
+            self._samples = []
+            self._started = time.perf_counter()
+
+    def wall_time(self):
+        return time.perf_counter() - self._started
+
+stage_timer = StageTimer()
+
+def set_timing_enabled(enabled):
+    """단계별 계측 여부를 설정합니다. (켜는 시점부터 벽시계 시간을 잽니다)"""
+    global _enabled
+    _enabled = bool(enabled)
+    if _enabled:
+        stage_timer.reset()
+        print("[INFO] 단계별 소요 시간 계측 사용")
+
+def is_timing_enabled():
+    return _enabled
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+def _context():
+    return getattr(_local, 'product', None), getattr(_local, 'category', None)
+
+@contextmanager
+def timing_context(product=None, category=None):
+    """이 스레드에서 기록되는 표본에 상품/카테고리를 붙입니다."""
+    previous = _context()
+    _local.product, _local.category = product, category
+    try:
+        yield
+    finally:
+        _local.product, _local.category = previous
+
+def category_label(depths):
+    """카테고리 depth 값들을 보고서용 이름으로 만듭니다. (예: '여성의류 > 원피스')"""
+    return " > ".join(str(depth) for depth in depths if isinstance(depth, str) and depth) or None
+
+def record_stage(stage, seconds):
+    """이미 잰 시간을 단계 표본으로 기록합니다. (바깥 단계에서는 이 시간을 뺌)"""
+    if not _enabled:
+        return
+    stack = _stack()
+    if stack:
+        stack[-1][1] += seconds
+    product, category = _context()
+    stage_timer.record(stage, seconds, product, category)
+
+@contextmanager
+def timed(stage):
+    """with 블록의 소요 시간(안쪽 단계 제외)을 stage 표본으로 기록합니다."""
+    if not _enabled:
+        yield
+        return
+    stack = _stack()
+    frame = [time.perf_counter(), 0.0]
+    stack.append(frame)
+    try:
+        yield
+    finally:
+        stack.pop()
+        elapsed = time.perf_counter() - frame[0]
+        if stack:
+            stack[-1][1] += elapsed
+        product, category = _context()
+        stage_timer.record(stage, elapsed - frame[1], product, category)
+
+def timed_stage(stage):
+    """함수 호출 전체를 stage로 계측하는 데코레이터"""
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with timed(stage):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
+
+def _percentile(sorted_values, q):
+    """정렬된 값 목록의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def _stats(values):
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'total': round(sum(values), 4),
+        'p50': round(_percentile(values, 0.5), 4),
+        'p95': round(_percentile(values, 0.95), 4),
+        'max': round(values[-1], 4) if values else 0.0,
+    }
+
+def _group_stats(samples):
+    by_stage = {}
+    for stage, seconds, _, _ in samples:
+        by_stage.setdefault(stage, []).append(seconds)
+    return {stage: _stats(values) for stage, values in by_stage.items()}
+
+def build_timing_report():
+    """
+    단계별 통계(p50/p95/최대)를 전체, 상품별, 카테고리별로 집계합니다.
+
+    Returns:
+        dict: wall_time, stages, products, categories 키를 가진 보고서
+    """
+    samples = stage_timer.samples()
+    products = {}
+    categories = {}
+    for sample in samples:
+        _, _, product, category = sample
+        if product is not None:
+            products.setdefault(product, {'category': category, 'samples': []})['samples'].append(sample)
+        if category is not None:
+            categories.setdefault(category, []).append(sample)
+
+    product_report = {}
+    product_totals = {}
+    for product, entry in products.items():
+        stage_totals = {}
+        for stage, seconds, _, _ in entry['samples']:
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+        total = sum(stage_totals.values())
+        product_totals.setdefault(entry['category'], []).append(total)
+        product_report[product] = {
+            'category': entry['category'],
+            'total': round(total, 4),
+            'stages': {stage: round(seconds, 4) for stage, seconds in stage_totals.items()},
+        }
+
+    category_report = {
+        category: {
+            'products': len(product_totals.get(category, [])),
+            'product_total': _stats(product_totals.get(category, [])),
+            'stages': _group_stats(category_samples),
+        }
+        for category, category_samples in categories.items()
+    }
+
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'wall_time': round(stage_timer.wall_time(), 3),
+        'measured_time': round(sum(seconds for _, seconds, _, _ in samples), 3),
+        'stages': _group_stats(samples),
+        'products': product_report,
+        'categories': category_report,
+    }
+
+def _prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+def format_prometheus(report, prefix='crawler'):
+    """보고서의 전체 단계 통계를 Prometheus 텍스트 형식으로 변환합니다. (node_exporter textfile 수집용)"""
+    lines = [
+        f"# HELP {prefix}_stage_seconds 단계별 소요 시간(초)",
+        f"# TYPE {prefix}_stage_seconds summary",
+    ]
+    for stage, stats in sorted(report['stages'].items()):
+        label = _prometheus_label(stage)
+        lines.append(f'{prefix}_stage_seconds{{stage="{label}",quantile="0.5"}} {stats["p50"]}')
+        lines.append(f'{prefix}_stage_seconds{{stage="{label}",quantile="0.95"}} {stats["p95"]}')
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{label}"}} {stats["total"]}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{label}"}} {stats["count"]}')
+    lines.append(f"# HELP {prefix}_stage_seconds_max 단계별 최대 소요 시간(초)")
+    lines.append(f"# TYPE {prefix}_stage_seconds_max gauge")
+    for stage, stats in sorted(report['stages'].items()):
+        lines.append(f'{prefix}_stage_seconds_max{{stage="{_prometheus_label(stage)}"}} {stats["max"]}')
+    lines.append(f"# HELP {prefix}_run_wall_seconds 실행 전체 벽시계 시간(초)")
+    lines.append(f"# TYPE {prefix}_run_wall_seconds gauge")
+    lines.append(f"{prefix}_run_wall_seconds {report['wall_time']}")
+    lines.append(f"# HELP {prefix}_products_total 계측된 상품 수")
+    lines.append(f"# TYPE {prefix}_products_total gauge")
+    lines.append(f"{prefix}_products_total {len(report['products'])}")
+    return "\n".join(lines) + "\n"
+
+def write_timing_report(report_path, prometheus_path=None):
+    """
+    실행 종료 시 단계별 계측 보고서(JSON)와 선택적으로 Prometheus 텍스트 파일을 저장합니다.
+
+    Returns:
+        dict: 저장한 보고서 (계측하지 않았으면 None)
+    """
+    if not _enabled:
+        return None
+    report = build_timing_report()
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[TIMING] 단계별 계측 보고서 저장: {report_path}")
+    if prometheus_path:
+        # 수집기가 쓰는 도중의 파일을 읽지 않도록 임시 파일 후 이동
+        temp_path = f"{prometheus_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(format_prometheus(report))
+        os.replace(temp_path, prometheus_path)
+        print(f"[TIMING] Prometheus 텍스트 파일 저장: {prometheus_path}")
+    return report
+
+def print_timing_summary(report=None):
+    """단계별 소요 시간을 합계가 큰 순서로 출력합니다."""
+    report = report or (build_timing_report() if _enabled else None)
+    if not report or not report['stages']:
+        return
+    print(f"[TIMING] 단계별 소요 시간 (벽시계 {report['wall_time']:.1f}초, 계측 합계 {report['measured_time']:.1f}초)")
+    for stage, stats in sorted(report['stages'].items(), key=lambda item: -item[1]['total']):
+        print(
+            f"  - {stage}: {stats['count']}회, 총 {stats['total']:.2f}초, "
+            f"p50 {stats['p50']:.3f}초, p95 {stats['p95']:.3f}초, 최대 {stats['max']:.3f}초"
+        )
@@ -0,0 +1,296 @@
+# common/waits.py
+import os
+import time
+import threading
+
+from common.timing import record_stage
+
+# 대기 방식
+# - fixed: 기존과 같이 고정 시간 time.sleep
+# - adaptive: 조건(DOM 준비, 목록 변경, 네트워크 유휴 등)이 충족될 때까지만 대기
+WAIT_MODES = ('fixed', 'adaptive')
+DEFAULT_WAIT_MODE = 'fixed'
+
+# 조건별 최대 대기 시간(초) - adaptive 모드에서만 사용
+DEFAULT_TIMEOUTS = {
+    'page_load': 15,
+    'dom_ready': 15,
+    'network_idle': 10,
+    'detail_tab': 10,
+    'review_tab': 10,
+    'scroll_load': 5,
+    'review_list': 10,
+    'pagination': 10,
+    'menu': 10,
+    'product_list': 10,
+    'click': 3,
+    # 선택자 후보 중 하나가 나타날 때까지 (common.locators.find_any)
+    'review_tab_probe': 3,
+    'sort_probe': 3,
+    'detail_tab_probe': 3,
+}
+
+# 네트워크 유휴로 판단할 조용한 구간(초)
+NETWORK_QUIET_PERIOD = 0.5
+# 이 시간(초)보다 오래 응답이 없는 요청(롱 폴링 등)은 진행 중인 요청으로 세지 않음
+NETWORK_REQUEST_MAX_AGE = 5
+# 리소스 타이밍 버퍼 크기 (Chrome 기본값 250개가 차면 완료된 요청 수가 더 늘지 않아 항상 유휴로 판단됨)
+RESOURCE_TIMING_BUFFER_SIZE = 100000
+POLL_INTERVAL = 0.1
+
+_wait_mode = os.environ.get('CRAWLER_WAIT_MODE', DEFAULT_WAIT_MODE)
+_timeouts = dict(DEFAULT_TIMEOUTS)
+
+# 요소 목록의 상태를 문자열로 요약하는 스크립트 (개수 + 클래스/텍스트 일부)
+_SIGNATURE_SCRIPT = """
+var nodes = document.querySelectorAll(arguments[0]);
+var parts = [nodes.length];
+for (var i = 0; i < nodes.length && i < 50; i++) {
+    parts.push((nodes[i].className || '') + ':' + (nodes[i].textContent || '').trim().slice(0, 40));
+}
+return parts.join('|');
+"""
+
+# 문서마다 페이지 스크립트보다 먼저 실행 (install_network_tracker)
+# fetch/XMLHttpRequest를 감싸 진행 중인 요청의 시작 시각을 기록하고, 리소스 타이밍 버퍼를 늘림
+_NETWORK_TRACKER_SCRIPT = """
+(function () {
+    if (window.__crawlerPending) return;
+    var pending = window.__crawlerPending = {};
+    var nextId = 0;
+    try { performance.setResourceTimingBufferSize(%d); } catch (e) {}
+    function start() { var id = ++nextId; pending[id] = performance.now(); return id; }
+    function done(id) { delete pending[id]; }
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            var id = start();
+            try {
+                var result = originalFetch.apply(this, arguments);
+            } catch (e) {
+                done(id);
+                throw e;
+            }
+            result.then(function () { done(id); }, function () { done(id); });
+            return result;
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var id = start();
+        this.addEventListener('loadend', function () { done(id); });
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            done(id);
+            throw e;
+        }
+    };
+})();
+""" % RESOURCE_TIMING_BUFFER_SIZE
+
+# 문서 상태, 로딩 완료된 리소스 수 (새 요청이 끝날 때마다 증가), 진행 중인 fetch/XHR 수
+# 추적 스크립트가 없는 문서(설치 실패 등)도 버퍼는 늘리고 진행 중인 요청은 0으로 봄
+_RESOURCE_COUNT_SCRIPT = """
+if (!window.__crawlerBufferSized) {
+    window.__crawlerBufferSized = true;
+    try { performance.setResourceTimingBufferSize(arguments[1]); } catch (e) {}
+}
+var pending = window.__crawlerPending || {};
+var now = performance.now();
+var inflight = 0;
+for (var id in pending) {
+    if (now - pending[id] < arguments[0]) inflight++;
+}
+return [document.readyState, performance.getEntriesByType('resource').length, inflight];
+"""
+
+class WaitStats:
+    """조건별 실제 대기 시간을 기록하는 통계 객체 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def record(self, condition, elapsed, timed_out=False):
+        with self._lock:
+            stats = self._records.setdefault(condition, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            stats['count'] += 1
+            stats['total'] += elapsed
+            stats['max'] = max(stats['max'], elapsed)
+            if timed_out:
+                stats['timeouts'] += 1
+
+    def summary(self):
+        """조건별 횟수, 총/평균/최대 대기 시간, 타임아웃 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                condition: {
+                    'count': stats['count'],
+                    'total': round(stats['total'], 3),
+                    'mean': round(stats['total'] / stats['count'], 3) if stats['count'] else 0.0,
+                    'max': round(stats['max'], 3),
+                    'timeouts': stats['timeouts'],
+                }
+                for condition, stats in self._records.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+wait_stats = WaitStats()
+
+def set_wait_mode(mode):
+    """대기 방식(fixed/adaptive)을 설정합니다."""
+    global _wait_mode
+    if mode not in WAIT_MODES:
+        raise ValueError(f"지원하지 않는 대기 방식입니다: {mode} (사용 가능: {', '.join(WAIT_MODES)})")
+    _wait_mode = mode
+    print(f"[INFO] 대기 방식: {mode}")
+
+def get_wait_mode():
+    return _wait_mode
+
+def set_wait_timeout(condition, seconds):
+    """조건별 최대 대기 시간을 변경합니다."""
+    _timeouts[condition] = seconds
+
+def wait_for(driver, condition, fixed_delay, check=None, timeout=None):
+    """
+    fixed 모드에서는 fixed_delay 만큼 sleep하고,
+    adaptive 모드에서는 check(driver)가 참이 될 때까지(최대 timeout) 대기합니다.
+    adaptive 모드에서 check가 없으면 대기하지 않습니다.
+
+    Args:
+        driver: WebDriver 인스턴스
+        condition (str): 조건 이름 (통계 및 기본 타임아웃 키)
+        fixed_delay (float): fixed 모드의 대기 시간(초)
+        check (callable, optional): check(driver) -> bool
+        timeout (float, optional): 최대 대기 시간 (None이면 조건별 기본값)
+
+    Returns:
+        bool: 조건 충족 여부 (타임아웃 시 False)
+    """
+    start = time.perf_counter()
+    satisfied = True
+    if _wait_mode == 'fixed':
+        if fixed_delay:
+            time.sleep(fixed_delay)
+    elif check is not None:
+        satisfied = _poll(driver, condition, check, timeout, start)
+    elapsed = time.perf_counter() - start
+    wait_stats.record(condition, elapsed, timed_out=not satisfied)
+    record_stage('wait', elapsed)
+    return satisfied
+
+def wait_until(driver, condition, check, timeout=None):
+    """
+    대기 방식과 관계없이 check(driver)가 참이 될 때까지(최대 timeout) 대기합니다.
+    (무한 스크롤의 새 카드처럼 고정 시간보다 조건 확인이 항상 정확한 경우에 사용)
+    """
+    start = time.perf_counter()
+    satisfied = _poll(driver, condition, check, timeout, start)
+    elapsed = time.perf_counter() - start
+    wait_stats.record(condition, elapsed, timed_out=not satisfied)
+    record_stage('wait', elapsed)
+    return satisfied
+
+def _poll(driver, condition, check, timeout, start):
+    timeout = timeout if timeout is not None else _timeouts.get(condition, 10)
+    deadline = start + timeout
+    while True:
+        try:
+            if check(driver):
+                return True
+        except Exception:
+            # 페이지 전환 중 스크립트 실행 실패 등은 미충족으로 간주
+            pass
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+def is_dom_ready(driver):
+    return driver.execute_script("return document.readyState") == 'complete'
+
+def wait_dom_ready(driver, fixed_delay=3, timeout=None):
+    """문서 로딩(document.readyState == 'complete')을 기다립니다."""
+    return wait_for(driver, 'dom_ready', fixed_delay, is_dom_ready, timeout)
+
+def install_network_tracker(driver):
+    """
+    이후 열리는 모든 문서에 진행 중인 요청 추적 스크립트를 설치합니다. (드라이버 생성 직후 한 번 호출)
+    설치하지 못하면 wait_network_idle은 완료된 리소스 수만으로 판단합니다.
+    """
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _NETWORK_TRACKER_SCRIPT})
+    except Exception as e:
+        print(f"[WARN] 요청 추적 스크립트 설치 실패 (완료된 요청 수로만 네트워크 유휴 판단): {e}")
+
+def wait_network_idle(driver, fixed_delay=2, timeout=None, condition='network_idle', quiet_period=NETWORK_QUIET_PERIOD):
+    """
+    DOM 로딩이 끝나고 진행 중인 fetch/XHR 요청이 없으며,
+    quiet_period 동안 새로 완료된 리소스 요청이 없을 때까지 기다립니다.
+    """
+    state = {'count': None, 'since': None}
+
+    def check(d):
+        ready_state, resource_count, inflight = d.execute_script(
+            _RESOURCE_COUNT_SCRIPT, NETWORK_REQUEST_MAX_AGE * 1000, RESOURCE_TIMING_BUFFER_SIZE
+        )
+        now = time.perf_counter()
+        if ready_state != 'complete' or resource_count != state['count'] or inflight:
+            state['count'] = resource_count
+            state['since'] = now
+            return False
+        return now - state['since'] >= quiet_period
+
+    return wait_for(driver, condition, fixed_delay, check, timeout)
+
+def wait_page_loaded(driver, fixed_delay=3, timeout=None):
+    """driver.get 이후 페이지 로딩 및 초기 비동기 요청 완료를 기다립니다."""
+    return wait_network_idle(driver, fixed_delay, timeout, condition='page_load')
+
+def get_signature(driver, css_selector):
+    """
+    css_selector에 해당하는 요소 목록의 현재 상태 요약 문자열을 반환합니다.
+    (wait_for_change와 함께 클릭 전 상태를 기록할 때 사용)
+    fixed 모드에서는 비교할 일이 없으므로 스크립트를 실행하지 않습니다.
+    """
+    if _wait_mode == 'fixed':
+        return None
+    try:
+        return driver.execute_script(_SIGNATURE_SCRIPT, css_selector)
+    except Exception:
+        return None
+
+def wait_for_change(driver, css_selector, before, condition, fixed_delay, timeout=None):
+    """
+    css_selector 요소 목록의 상태가 before(get_signature 결과)와 달라질 때까지 기다립니다.
+    (리뷰 목록 교체, 페이지네이션 상태 변경, 메뉴 선택 상태 변경 등)
+    """
+    def check(d):
+        current = d.execute_script(_SIGNATURE_SCRIPT, css_selector)
+        # 목록이 비어 있는 동안은 아직 교체 중인 것으로 간주
+        return current != before and current != '0'
+
+    return wait_for(driver, condition, fixed_delay, check, timeout)
+
+def wait_for_element(driver, css_selector, condition, fixed_delay, timeout=None):
+    """css_selector에 해당하는 요소가 하나 이상 나타날 때까지 기다립니다."""
+    def check(d):
+        return d.execute_script("return document.querySelector(arguments[0]) !== null", css_selector)
+
+    return wait_for(driver, condition, fixed_delay, check, timeout)
+
+def print_wait_summary():
+    """조건별 대기 시간 통계를 출력합니다."""
+    summary = wait_stats.summary()
+    if not summary:
+        return
+    print(f"[WAIT] 대기 통계 (모드: {_wait_mode})")
+    for condition, stats in sorted(summary.items(), key=lambda item: -item[1]['total']):
+        print(
+            f"  - {condition}: {stats['count']}회, 총 {stats['total']:.2f}초, "
+            f"평균 {stats['mean']:.2f}초, 최대 {stats['max']:.2f}초, 타임아웃 {stats['timeouts']}회"
+        )
@@ -16,7 +16,24 @@ sys.path.append('./reviewcrawler')
 # urlcrawler와 reviewcrawler에서 필요한 모듈 import
 from urlcrawler.driver import setup_driver as setup_url_driver
 from urlcrawler.main import run_url_crawler
+from scraper import HARVEST_MODES, set_harvest_mode  # urlcrawler 모듈과 같은 모듈 객체를 쓰도록 경로 기준 import
+from common.pool import CrawlerPool
 from reviewcrawler.crawler import NaverShoppingCrawler
+from reviewcrawler.checkpoint import CheckpointStore
+from reviewcrawler.watermark import ReviewWatermarkStore, PendingWatermarks
+from reviewcrawler.archive import SnapshotArchive, set_archive
+from reviewcrawler.sinks import OUTPUT_FORMATS, DEFAULT_BATCH_SIZE, create_sink, stream_csv_to_excel
+from common.html_parser import PARSER_BACKENDS, set_parser_backend
+from reviewcrawler.review_crawler import REVIEW_EXTRACTORS, set_review_extractor
+from reviewcrawler.parse_pipeline import configure_parse_pool, shutdown_parse_pool
+from reviewcrawler.product_info import SUMMARY_SOURCES, set_summary_source
+from common.waits import WAIT_MODES, set_wait_mode, print_wait_summary
+from common.browser import PAGE_LOAD_STRATEGIES, configure_browser, print_page_metrics_summary
+from common.endpoints import set_base_url
+from common.selector_stats import SELECTOR_ORDERS, set_selector_order, selector_stats, print_selector_summary
+from common.selector_registry import load_selector_file
+from common.driver_factory import configure_driver_recycling
+from common.timing import set_timing_enabled, timing_context, category_label, write_timing_report, print_timing_summary
 
 def convert_csv_to_excel(csv_path, excel_path=None):
     """
@@ -33,21 +50,22 @@ def convert_csv_to_excel(csv_path, excel_path=None):
         excel_path = csv_path.replace('.csv', '.xlsx')
     
     try:
-        df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        df.to_excel(excel_path, index=False, engine='openpyxl')
+        stream_csv_to_excel(csv_path, excel_path)
         print(f"Excel 파일 생성 완료: {excel_path}")
         return excel_path
     except Exception as e:
         print(f"Excel 파일 생성 중 오류 발생: {e}")
         return None
 
-def crawl_urls(max_depth=None, product_limit=None):
+def crawl_urls(max_depth=None, product_limit=None, refresh_tree=False, workers=1):
     """
     URL 크롤링 단계 실행
     
     Args:
         max_depth: 크롤링할 최대 depth (1-4)
         product_limit: 각 depth에서 크롤링할 제품 수
+        refresh_tree: True면 캐시된 카테고리 트리를 무시하고 다시 탐색
+        workers: 카테고리별 제품 URL 수집에 사용할 브라우저 워커 수
     
     Returns:
         DataFrame: 크롤링된 URL과 depth 정보가 포함된 DataFrame
@@ -80,7 +98,7 @@ def crawl_urls(max_depth=None, product_limit=None):
                 print("숫자를 입력하세요.")
     
     # url_crawler의 run_url_crawler 함수 호출
-    run_url_crawler(max_depth=max_depth, product_limit=product_limit)
+    run_url_crawler(max_depth=max_depth, product_limit=product_limit, refresh_tree=refresh_tree, workers=workers)
     
     # 생성된 CSV 확인 및 로드
     csv_filename = 'all_category_product_urls.csv'
@@ -111,7 +129,84 @@ def crawl_urls(max_depth=None, product_limit=None):
     print(f"URL 크롤링 완료. 총 {len(url_df)}개의 URL이 수집되었습니다.")
     return url_df
 
-def crawl_product_info_and_reviews(url_df, max_pages=5, max_products=None, max_retries=3):
+def apply_category_info(row, product_info, reviews_df):
+    """URL 행의 카테고리(depth) 정보를 상품 정보와 리뷰에 기록합니다."""
+    for col in ['1st_depth', '2nd_depth', '3rd_depth', '4th_depth']:
+        if product_info:
+            product_info[col] = row.get(col, '')
+        if reviews_df is not None:
+            reviews_df[col] = row.get(col, '')
+
+def crawl_single_product(crawler, index, row, total, max_pages=5, watermarks=None):
+    """
+    제품 한 개의 정보와 리뷰를 크롤링 (워커 풀의 각 워커에서 호출)
+    
+    Args:
+        crawler: 워커 전용 NaverShoppingCrawler 인스턴스
+        index: URL DataFrame 내 순번
+        row: URL DataFrame의 한 행 (dict 형태)
+        total: 전체 제품 수
+        max_pages: 크롤링할 최대 리뷰 페이지 수
+        watermarks: 증분 리뷰 수집용 ReviewWatermarkStore (None이면 전체 수집)
+    
+    Returns:
+        tuple: (product_info, reviews_df, new_watermark) - 수집 실패 항목은 None
+            new_watermark는 리뷰를 반영한 기준점으로, 리뷰가 결과 파일에 기록된 뒤에 저장합니다.
+    """
+    product_code = row['PRODUCT_CODE']
+    url = row['제품_URL']
+    
+    # 카테고리 정보 추출
+    depth1 = row.get('1st_depth', '')
+    depth2 = row.get('2nd_depth', '')
+    depth3 = row.get('3rd_depth', '')
+    depth4 = row.get('4th_depth', '')
+    
+    print(f"\n처리 중: {index+1}/{total} - {url}")
+    print(f"카테고리: {depth1} > {depth2} > {depth3} > {depth4}")
+    print(f"상품 코드: {product_code}")
+    
+    # 제품 정보 크롤링
+    product_info = crawler.crawl_product_info(target_url=url)
+    
+    if product_info:
+        # 카테고리 정보 추가
+        apply_category_info(row, product_info, None)
+        
+        # 상품 코드 확인/설정
+        if 'PRODUCT_CODE' not in product_info or not product_info['PRODUCT_CODE']:
+            product_info['PRODUCT_CODE'] = product_code
+        print("  - 제품 정보 수집 완료")
+    else:
+        print("  - 제품 정보 수집 실패")
+    
+    # 리뷰 크롤링 (증분 모드면 이전 실행의 기준점 이후 리뷰만 수집)
+    watermark = watermarks.get(product_code) if watermarks is not None else None
+    if watermark is not None:
+        print(f"  - 증분 수집 기준 작성일: {watermark.write_dt}")
+    reviews_df = crawler.crawl_reviews(
+        target_url=url,
+        max_pages=max_pages,
+        return_df=True,
+        watermark=watermark
+    )
+    
+    if reviews_df is not None and not reviews_df.empty:
+        # 카테고리 정보 추가
+        apply_category_info(row, None, reviews_df)
+        print(f"  - 리뷰 수집: {len(reviews_df)}개")
+    else:
+        reviews_df = None
+        print("  - 리뷰 없음 또는 수집 실패")
+    
+    # 리뷰 기준점 (저장은 결과 파일에 기록된 뒤 crawl_product_info_and_reviews에서)
+    new_watermark = watermarks.propose(product_code, reviews_df) if watermarks is not None else None
+    
+    return product_info, reviews_df, new_watermark
+
+def crawl_product_info_and_reviews(url_df, max_pages=5, max_products=None, max_retries=3, workers=1,
+                                   checkpoint=None, resume=False, watermarks=None, batch_size=DEFAULT_BATCH_SIZE,
+                                   output_format='csv'):
     """
     URL 데이터프레임을 받아 각 제품의 정보와 리뷰를 크롤링
     
@@ -120,166 +215,183 @@ def crawl_product_info_and_reviews(url_df, max_pages=5, max_products=None, max_r
         max_pages: 각 제품에서 크롤링할 최대 리뷰 페이지 수
         max_products: 최대 처리할 제품 수 (None이면 모두 처리)
         max_retries: 실패 시 최대 재시도 횟수
+        workers: 동시에 실행할 브라우저 워커 수
+        checkpoint: 제품별 진행 상태를 기록할 CheckpointStore (None이면 기록하지 않음)
+        resume: True면 체크포인트에서 완료된 제품은 다시 크롤링하지 않고 저장된 결과 사용
+        watermarks: 증분 리뷰 수집용 ReviewWatermarkStore (None이면 전체 리뷰 페이지 수집)
+        batch_size: 결과 파일에 한 번에 기록할 행 수 (메모리에 모아 두는 최대 행 수)
+        output_format: 결과 파일 형식 ('csv' 또는 'parquet')
     
     Returns:
-        tuple: (product_info_df, reviews_df) - 수집된 제품 정보와 리뷰 DataFrame
+        tuple: (product_count, review_count) - 결과 파일에 기록된 제품 정보와 리뷰 수
+            (결과는 배치 단위로 product_info_all / review_all 파일에 기록하며 DataFrame은 반환하지 않음)
     """
     print("="*80)
     print("2단계: 제품 정보 및 리뷰 크롤링 시작")
     print("="*80)
     
-    # 결과를 저장할 DataFrame 생성
-    product_info_list = []
-    review_dfs = []
-    
     # 처리할 제품 수 제한
     if max_products and max_products < len(url_df):
         url_df = url_df.head(max_products)
         print(f"처리할 제품 수를 {max_products}개로 제한합니다.")
     
-    # 네이버 쇼핑 크롤러 초기화
-    crawler = NaverShoppingCrawler()
+    # 워커에 전달할 작업 목록 (입력 순서 유지)
+    tasks = list(enumerate(url_df.to_dict('records')))
+    
+    # 체크포인트 확인: 이어하기 모드면 완료된 제품은 건너뜀, 아니면 새로 시작
+    completed_codes = set()
+    if checkpoint is not None:
+        if resume:
+            completed_codes = checkpoint.completed_codes()
+            skipped = sum(1 for _, row in tasks if row['PRODUCT_CODE'] in completed_codes)
+            print(f"[RESUME] 체크포인트 상태: {checkpoint.summary()}")
+            print(f"[RESUME] 완료된 제품 {skipped}개를 건너뛰고 {len(tasks) - skipped}개를 크롤링합니다.")
+        else:
+            checkpoint.reset()
+    pending_tasks = [task for task in tasks if task[1]['PRODUCT_CODE'] not in completed_codes]
+    
+    def handler(crawler, task):
+        index, row = task
+        if checkpoint is not None:
+            checkpoint.mark_running(row['PRODUCT_CODE'], row['제품_URL'])
+        category = category_label(row.get(key, '') for key in ('1st_depth', '2nd_depth', '3rd_depth', '4th_depth'))
+        with timing_context(product=row['PRODUCT_CODE'], category=category):
+            result = crawl_single_product(crawler, index, row, len(tasks), max_pages=max_pages, watermarks=watermarks)
+        if checkpoint is not None:
+            checkpoint.mark_done(row['PRODUCT_CODE'], *result[:2])
+        return result
+    
+    # 브라우저 워커 풀 초기화 (워커마다 별도의 NaverShoppingCrawler 사용)
+    pool = CrawlerPool(NaverShoppingCrawler, workers=workers, max_retries=max_retries, retry_delay=5)
+    pool_results = pool.run(pending_tasks, handler)
     
+    # 결과는 제품이 끝날 때마다 배치 단위로 파일에 기록
+    product_sink = create_sink('product_info_all.csv', output_format, batch_size=batch_size)
+    review_sink = create_sink('review_all.csv', output_format, batch_size=batch_size)
+    # 리뷰 기준점은 리뷰가 결과 파일에 기록된 뒤에 저장 (중단되어도 기록되지 않은 리뷰를 다음 실행에서 다시 수집)
+    pending_watermarks = PendingWatermarks(watermarks) if watermarks is not None else None
+    
+    # 각 URL에 대해 크롤링 수행 (결과는 입력 순서대로 기록)
     try:
-        # 각 URL에 대해 크롤링 수행
-        for index, row in tqdm(url_df.iterrows(), total=len(url_df), desc="제품 크롤링 진행"):
-            product_code = row['PRODUCT_CODE']
-            url = row['제품_URL']
-            
-            # 카테고리 정보 추출
-            depth1 = row.get('1st_depth', '')
-            depth2 = row.get('2nd_depth', '')
-            depth3 = row.get('3rd_depth', '')
-            depth4 = row.get('4th_depth', '')
-            
-            print(f"\n처리 중: {index+1}/{len(url_df)} - {url}")
-            print(f"카테고리: {depth1} > {depth2} > {depth3} > {depth4}")
-            print(f"상품 코드: {product_code}")
+        for index, row in tqdm(tasks, desc="제품 크롤링 진행"):
+            if row['PRODUCT_CODE'] in completed_codes:
+                # 이전 실행에서 완료된 제품은 저장된 결과 사용
+                product_info, reviews_df = checkpoint.load_result(row['PRODUCT_CODE'])
+                apply_category_info(row, product_info, reviews_df)
+                new_watermark = watermarks.propose(row['PRODUCT_CODE'], reviews_df) if watermarks is not None else None
+                result = (product_info, reviews_df, new_watermark)
+            else:
+                _, _, result = next(pool_results)
             
-            retry_count = 0
-            success = False
-            
-            while retry_count < max_retries and not success:
-                try:
-                    # 제품 정보 크롤링
-                    temp_product_file = f"temp_product_{product_code}.csv"
-                    product_info = crawler.crawl_product_info(
-                        target_url=url,
-                        output_csv=temp_product_file
-                    )
-                    
-                    if product_info:
-                        # 카테고리 정보 추가
-                        product_info['1st_depth'] = depth1
-                        product_info['2nd_depth'] = depth2 
-                        product_info['3rd_depth'] = depth3
-                        product_info['4th_depth'] = depth4
-                        
-                        # 상품 코드 확인/설정
-                        if 'PRODUCT_CODE' not in product_info or not product_info['PRODUCT_CODE']:
-                            product_info['PRODUCT_CODE'] = product_code
-                        
-                        # 결과 리스트에 추가
-                        product_info_list.append(product_info)
-                        print("  - 제품 정보 수집 완료")
-                    else:
-                        print("  - 제품 정보 수집 실패")
-                    
-                    # 리뷰 크롤링
-                    temp_review_file = f"temp_review_{product_code}.csv"
-                    reviews_df = crawler.crawl_reviews(
-                        target_url=url,
-                        max_pages=max_pages,
-                        output_csv=temp_review_file,
-                        return_df=True
-                    )
-                    
-                    if reviews_df is not None and not reviews_df.empty:
-                        # 카테고리 정보 추가
-                        reviews_df['1st_depth'] = depth1
-                        reviews_df['2nd_depth'] = depth2
-                        reviews_df['3rd_depth'] = depth3
-                        reviews_df['4th_depth'] = depth4
-                        
-                        # 결과 리스트에 추가
-                        review_dfs.append(reviews_df)
-                        print(f"  - 리뷰 수집: {len(reviews_df)}개")
-                    else:
-                        print("  - 리뷰 없음 또는 수집 실패")
-                    
-                    # 임시 파일 삭제
-                    if os.path.exists(temp_product_file):
-                        os.remove(temp_product_file)
-                    if os.path.exists(temp_review_file):
-                        os.remove(temp_review_file)
-                    
-                    success = True
-                
-                except Exception as e:
-                    retry_count += 1
-                    print(f"오류 발생 ({retry_count}/{max_retries}): {e}")
-                    
-                    # 재시도 전 대기
-                    if retry_count < max_retries:
-                        print(f"5초 후 재시도...")
-                        time.sleep(5)
-                        
-                        # 드라이버 재설정
-                        crawler.close()
-                        crawler.setup_driver()
-                    else:
-                        print(f"최대 재시도 횟수 초과. 다음 제품으로 넘어갑니다.")
-        
-        # 결과 DataFrame 생성
-        product_info_df = None
-        reviews_df = None
-        
-        if product_info_list:
-            product_info_df = pd.DataFrame(product_info_list)
-            product_info_csv = 'product_info_all.csv'
-            product_info_excel = 'product_info_all.xlsx'
-            
-            product_info_df.to_csv(product_info_csv, index=False, encoding='utf-8-sig')
-            print(f"\n제품 정보 저장 완료: {product_info_csv} ({len(product_info_df)}개)")
-            
-            # CSV를 엑셀로 변환
-            convert_csv_to_excel(product_info_csv, product_info_excel)
-        else:
-            print("\n수집된 제품 정보가 없습니다.")
+            if result is None:
+                print(f"[WARN] {row['제품_URL']} 크롤링 실패 (상품 코드: {row['PRODUCT_CODE']})")
+                if checkpoint is not None:
+                    checkpoint.mark_failed(row['PRODUCT_CODE'], "최대 재시도 횟수 초과")
+                continue
+            product_info, reviews_df, new_watermark = result
+            if product_info:
+                product_sink.write(product_info)
+            if reviews_df is not None:
+                review_sink.write(reviews_df)
+            if pending_watermarks is not None:
+                pending_watermarks.add(row['PRODUCT_CODE'], new_watermark)
+                if not review_sink.buffered:
+                    pending_watermarks.commit()
+    finally:
+        pool_results.close()
+        product_sink.close()
+        review_sink.close()
+        # 싱크를 닫아 남은 리뷰가 모두 기록된 경우에만 저장
+        if pending_watermarks is not None:
+            pending_watermarks.commit()
+    
+    if product_sink.count:
+        print(f"\n제품 정보 저장 완료: {product_sink.path} ({product_sink.count}개)")
         
-        if review_dfs:
-            reviews_df = pd.concat(review_dfs, ignore_index=True)
-            review_csv = 'review_all.csv'
-            review_excel = 'review_all.xlsx'
-            
-            reviews_df.to_csv(review_csv, index=False, encoding='utf-8-sig')
-            print(f"리뷰 정보 저장 완료: {review_csv} ({len(reviews_df)}개)")
-            
-            # CSV를 엑셀로 변환
-            convert_csv_to_excel(review_csv, review_excel)
-        else:
-            print("수집된 리뷰가 없습니다.")
+        # CSV를 엑셀로 변환
+        if output_format == 'csv':
+            convert_csv_to_excel(product_sink.path, 'product_info_all.xlsx')
+    else:
+        print("\n수집된 제품 정보가 없습니다.")
+    
+    if review_sink.count:
+        print(f"리뷰 정보 저장 완료: {review_sink.path} ({review_sink.count}개)")
         
-        return product_info_df, reviews_df
+        # CSV를 엑셀로 변환
+        if output_format == 'csv':
+            convert_csv_to_excel(review_sink.path, 'review_all.xlsx')
+    else:
+        print("수집된 리뷰가 없습니다.")
     
-    finally:
-        # 크롤러 종료
-        crawler.close()
+    return product_sink.count, review_sink.count
 
 def main():
     parser = argparse.ArgumentParser(description='네이버 쇼핑 통합 크롤러')
     parser.add_argument('--skip-url-crawl', action='store_true', help='URL 크롤링 단계 건너뛰기')
     parser.add_argument('--max-depth', type=int, help='크롤링할 최대 depth (1-4) (미지정 시 터미널에서 입력)')
     parser.add_argument('--product-limit', type=int, help='각 depth에서 크롤링할 제품 수 (미지정 시 터미널에서 입력)')
+    parser.add_argument('--refresh-category-tree', action='store_true', help='캐시된 카테고리 트리(category_tree.json)를 무시하고 다시 탐색')
+    parser.add_argument('--url-workers', type=int, default=1, help='카테고리별 제품 URL 수집에 사용할 브라우저 워커 수')
+    parser.add_argument('--harvest-mode', choices=HARVEST_MODES, default='incremental', help='제품 URL 수집 방식: incremental(스크롤마다 새 카드만) / snapshot(스크롤마다 전체 파싱) (기본값: incremental)')
     parser.add_argument('--max-products', type=int, default=None, help='처리할 최대 제품 수')
+    parser.add_argument('--review-extractor', choices=REVIEW_EXTRACTORS, default='html', help='리뷰 추출 방식: html(page_source 파싱) / script(페이지 안 스크립트로 리뷰 필드만 추출) (기본값: html)')
+    parser.add_argument('--parse-processes', type=int, default=None, help='리뷰 페이지 HTML을 파싱할 백그라운드 프로세스 수, 브라우저가 다음 페이지로 이동하는 동안 이전 페이지를 파싱 (html 추출 방식만, 기본값: 환경 변수 CRAWLER_PARSE_PROCESSES 또는 0=사용 안 함)')
+    parser.add_argument('--summary-source', choices=SUMMARY_SOURCES, default='state', help='상품 요약 정보 추출 방식: state(페이지 상태 JSON 우선, 없는 필드만 CSS 선택자) / css(CSS 선택자만) (기본값: state)')
     parser.add_argument('--max-pages', type=int, default=5, help='각 제품에서 크롤링할 최대 리뷰 페이지 수')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 실행할 브라우저 워커 수')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default='html.parser', help='HTML 파서 백엔드 (기본값: html.parser)')
+    parser.add_argument('--wait-mode', choices=WAIT_MODES, default='fixed', help='대기 방식: fixed(고정 sleep) / adaptive(조건 기반) (기본값: fixed)')
+    parser.add_argument('--checkpoint', type=str, default='crawl_checkpoint.db', help='제품별 진행 상태를 저장할 체크포인트 DB 파일')
+    parser.add_argument('--resume', action='store_true', help='체크포인트에서 완료된 제품은 건너뛰고 미완료/실패 제품만 크롤링')
+    parser.add_argument('--incremental', action='store_true', help='이전 실행 이후 새로 작성된 리뷰만 수집 (상품별 기준점 사용)')
+    parser.add_argument('--watermark-db', type=str, default='review_watermarks.db', help='상품별 리뷰 기준점을 저장할 DB 파일')
+    parser.add_argument('--lean', action='store_true', help='이미지/미디어/폰트/광고·분석 요청을 차단하여 전송량을 줄임')
+    parser.add_argument('--headless', action='store_true', help='브라우저를 화면 없이 실행')
+    parser.add_argument('--page-load-strategy', choices=PAGE_LOAD_STRATEGIES, default='normal', help='페이지 로딩 전략: normal / eager (기본값: normal)')
+    parser.add_argument('--base-url', type=str, default=None, help='네이버 대신 접속할 주소 (예: 로컬 대역 서버 http://127.0.0.1:8765, 캐시된 카테고리 트리는 같은 주소에서 탐색한 경우에만 사용)')
+    parser.add_argument('--measure-pages', action='store_true', help='상품 페이지별 전송량과 로딩 시간을 측정하여 출력')
+    parser.add_argument('--recycle-pages', type=int, default=None, help='브라우저 하나로 처리할 최대 페이지 수, 넘으면 작업 사이에 재시작 (기본값: 200, 0이면 제한 없음)')
+    parser.add_argument('--recycle-rss-mb', type=int, default=None, help='브라우저 메모리(MB)가 이 값을 넘으면 작업 사이에 재시작 (psutil 필요, 기본값: 제한 없음)')
+    parser.add_argument('--timing-report', type=str, default=None, help='단계별 소요 시간(p50/p95/최대, 상품·카테고리별) JSON 보고서 파일 (미지정 시 계측 안 함)')
+    parser.add_argument('--prometheus-file', type=str, default=None, help='단계별 소요 시간을 Prometheus 텍스트 형식으로 저장할 파일 (--timing-report와 함께 사용)')
+    parser.add_argument('--archive', type=str, default=None, help='page_source 스냅샷을 저장할 HTML 아카이브 디렉터리 (오프라인 재파싱용, 미지정 시 저장 안 함)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help='결과 파일 형식: csv(+엑셀) / parquet (기본값: csv)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'결과 파일에 한 번에 기록할 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--selector-order', choices=SELECTOR_ORDERS, default='static', help='대체 선택자 시도 순서: static(선택자 파일 순서) / adaptive(기본 선택자가 계속 불일치하면 마지막으로 일치한 선택자 우선) (기본값: static)')
+    parser.add_argument('--selector-file', type=str, default=None, help='선택자 그룹 데이터 파일 (기본값: 환경 변수 CRAWLER_SELECTOR_FILE 또는 common/selectors.json)')
+    parser.add_argument('--selector-stats', type=str, default='selector_stats.json', help='선택자별 일치/불일치 통계를 실행 간에 유지할 JSON 파일 (빈 문자열이면 저장 안 함)')
     args = parser.parse_args()
     
+    set_parser_backend(args.parser)
+    set_wait_mode(args.wait_mode)
+    set_review_extractor(args.review_extractor)
+    configure_parse_pool(args.parse_processes)
+    set_summary_source(args.summary_source)
+    set_harvest_mode(args.harvest_mode)
+    if args.selector_file:
+        load_selector_file(args.selector_file)
+    set_selector_order(args.selector_order)
+    if args.selector_stats and selector_stats.load(args.selector_stats):
+        print(f"[INFO] 선택자 통계 불러옴: {args.selector_stats}")
+    if args.base_url:
+        set_base_url(args.base_url)
+    configure_browser(lean=args.lean, headless=args.headless, page_load_strategy=args.page_load_strategy, measure=args.measure_pages)
+    configure_driver_recycling(max_pages=args.recycle_pages, max_rss_mb=args.recycle_rss_mb)
+    set_timing_enabled(bool(args.timing_report))
+    archive = SnapshotArchive(args.archive) if args.archive else None
+    set_archive(archive)
+    
     start_time = time.time()
     
+    if args.resume and not args.skip_url_crawl:
+        # 이어하기는 기존 URL 목록을 기준으로 해야 하므로 URL 크롤링을 건너뜀
+        print("[RESUME] 이어하기 모드: 기존 URL 파일을 사용합니다.")
+        args.skip_url_crawl = True
+    
     if not args.skip_url_crawl:
         # URL 크롤링 실행 (인자가 없으면 터미널에서 입력 받음)
-        url_df = crawl_urls(max_depth=args.max_depth, product_limit=args.product_limit)
+        url_df = crawl_urls(max_depth=args.max_depth, product_limit=args.product_limit, refresh_tree=args.refresh_category_tree,
+                            workers=args.url_workers)
     else:
         # 기존 URL CSV 파일 로드
         if not os.path.exists('all_category_product_urls.csv'):
@@ -289,20 +401,43 @@ def main():
         print(f"기존 URL 파일을 로드했습니다. 총 {len(url_df)}개의 URL.")
     
     # 제품 정보 및 리뷰 크롤링
-    product_info_df, reviews_df = crawl_product_info_and_reviews(
-        url_df, 
-        max_pages=args.max_pages,
-        max_products=args.max_products
-    )
+    checkpoint = CheckpointStore(args.checkpoint)
+    watermarks = ReviewWatermarkStore(args.watermark_db) if args.incremental else None
+    try:
+        product_count, review_count = crawl_product_info_and_reviews(
+            url_df, 
+            max_pages=args.max_pages,
+            max_products=args.max_products,
+            workers=args.workers,
+            checkpoint=checkpoint,
+            resume=args.resume,
+            watermarks=watermarks,
+            batch_size=args.batch_size,
+            output_format=args.format
+        )
+    finally:
+        checkpoint.close()
+        shutdown_parse_pool()
+        if watermarks is not None:
+            watermarks.close()
+        if archive is not None:
+            print(f"[ARCHIVE] 저장된 스냅샷: {archive.summary()}")
+            archive.close()
+        if args.selector_stats:
+            selector_stats.save(args.selector_stats)
+            print(f"[INFO] 선택자 통계 저장: {args.selector_stats}")
     
     elapsed_time = time.time() - start_time
     print("="*80)
     print(f"크롤링 완료! 총 소요 시간: {elapsed_time:.2f}초")
     
-    if product_info_df is not None:
-        print(f"수집된 제품 정보: {len(product_info_df)}개")
-    if reviews_df is not None:
-        print(f"수집된 리뷰: {len(reviews_df)}개")
+    print(f"수집된 제품 정보: {product_count}개")
+    print(f"수집된 리뷰: {review_count}개")
+    print_wait_summary()
+    print_page_metrics_summary()
+    print_selector_summary()
+    if args.timing_report:
+        print_timing_summary(write_timing_report(args.timing_report, args.prometheus_file))
     print("="*80)
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+# reviewcrawler/archive.py
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from reviewcrawler.document import ParsedDocument, hash_html
+
+# 스냅샷 종류
+# - product: driver.get 직후의 상품 페이지 (제목/가격/테이블)
+# - detail: 상세 정보 탭 클릭 및 스크롤 이후의 상품 페이지 (요약/텍스트/테이블/제품설명)
+# - review: 리뷰 목록 페이지 (page = 리뷰 페이지 번호)
+KIND_PRODUCT = 'product'
+KIND_DETAIL = 'detail'
+KIND_REVIEW = 'review'
+
+DEFAULT_ARCHIVE_DIR = 'html_archive'
+DEFAULT_COMPRESSION_LEVEL = 10
+
+class SnapshotArchive:
+    """
+    크롤러가 가져온 page_source 스냅샷을 저장하는 내용 주소 기반(content-addressed) 저장소
+
+    HTML은 내용 해시를 이름으로 zstd 압축하여 objects/ 아래에 한 번만 저장하고,
+    스냅샷마다 PRODUCT_CODE, URL, 종류, 페이지 번호, 수집 시각을 SQLite 색인에 기록합니다.
+    브라우저 없이 저장된 HTML에 파서를 다시 실행할 수 있습니다. (reviewcrawler/reparse.py)
+    여러 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, root=DEFAULT_ARCHIVE_DIR, level=DEFAULT_COMPRESSION_LEVEL):
+        """
+        Args:
+            root (str): 아카이브 디렉터리
+            level (int): zstd 압축 레벨
+        """
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("HTML 아카이브에는 zstandard가 필요합니다: pip install zstandard") from e
+        self._zstd = zstandard
+        self.root = root
+        self.level = level
+        self.objects_dir = os.path.join(root, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, 'index.db'), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                product_code TEXT,
+                url TEXT,
+                kind TEXT NOT NULL,
+                page INTEGER NOT NULL DEFAULT 0,
+                captured_at TEXT NOT NULL,
+                content_hash TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_product ON snapshots (product_code, kind, page)")
+        self._conn.commit()
+
+    def _object_path(self, content_hash):
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.html.zst")
+
+    def put(self, html_source):
+        """
+        HTML을 저장하고 내용 해시를 반환합니다. (같은 내용은 한 번만 저장)
+
+        Args:
+            html_source (str | ParsedDocument): HTML 소스 또는 파싱된 문서
+        """
+        if isinstance(html_source, ParsedDocument):
+            content_hash, html_source = html_source.content_hash, html_source.html
+        else:
+            content_hash = hash_html(html_source)
+        path = self._object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = self._zstd.ZstdCompressor(level=self.level).compress(html_source.encode('utf-8'))
+            # 다른 워커가 같은 내용을 동시에 쓰더라도 완성된 파일만 보이도록 임시 파일 후 이동
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        return content_hash
+
+    def get(self, content_hash):
+        """내용 해시로 저장된 HTML을 불러옵니다."""
+        with open(self._object_path(content_hash), 'rb') as f:
+            return self._zstd.ZstdDecompressor().decompress(f.read()).decode('utf-8')
+
+    def save(self, html_source, product_code, url, kind, page=0):
+        """
+        스냅샷을 저장하고 색인에 기록합니다.
+
+        Args:
+            html_source (str | ParsedDocument): page_source 스냅샷
+            product_code (str): 상품 코드
+            url (str): 페이지 URL
+            kind (str): KIND_PRODUCT / KIND_DETAIL / KIND_REVIEW
+            page (int): 리뷰 페이지 번호 (상품 페이지는 0)
+
+        Returns:
+            str: 내용 해시
+        """
+        content_hash = self.put(html_source)
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO snapshots (product_code, url, kind, page, captured_at, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (product_code, url, kind, page, datetime.now().isoformat(timespec='seconds'), content_hash))
+            self._conn.commit()
+        return content_hash
+
+    def snapshots(self, kind=None, product_code=None):
+        """
+        색인에서 스냅샷 목록을 수집 순서대로 반환합니다.
+
+        Returns:
+            list: product_code, url, kind, page, captured_at, content_hash 키를 가진 dict 목록
+        """
+        sql = "SELECT product_code, url, kind, page, captured_at, content_hash FROM snapshots"
+        conditions, params = [], []
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if product_code:
+            conditions.append("product_code = ?")
+            params.append(product_code)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        keys = ('product_code', 'url', 'kind', 'page', 'captured_at', 'content_hash')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def summary(self):
+        """종류별 스냅샷 수와 저장된 고유 HTML 수를 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, COUNT(*), COUNT(DISTINCT content_hash) FROM snapshots GROUP BY kind").fetchall()
+        return {kind: {'snapshots': total, 'unique': unique} for kind, total, unique in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+# 크롤러 전체에서 사용할 아카이브 (None이면 저장하지 않음)
+_archive = None
+
+def set_archive(archive):
+    """크롤러가 스냅샷을 저장할 아카이브를 설정합니다. (None이면 저장 중지)"""
+    global _archive
+    _archive = archive
+    if archive is not None:
+        print(f"[INFO] HTML 스냅샷 아카이브: {archive.root}")
+
+def get_archive():
+    return _archive
+
+def archive_snapshot(html_source, product_code, url, kind, page=0):
+    """아카이브가 설정된 경우에만 스냅샷을 저장합니다. 저장 실패는 크롤링을 중단시키지 않습니다."""
+    if _archive is None:
+        return None
+    try:
+        return _archive.save(html_source, product_code, url, kind, page)
+    except Exception as e:
+        print(f"[WARN] 스냅샷 저장 실패 ({kind}, {url}): {e}")
+        return None
@@ -0,0 +1,112 @@
+# reviewcrawler/checkpoint.py
+import json
+import sqlite3
+import threading
+from datetime import datetime
+import pandas as pd
+
+# 제품별 처리 상태
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+class CheckpointStore:
+    """
+    제품(PRODUCT_CODE)별 크롤링 상태, 시도 횟수, 수집 결과를 SQLite에 저장하는 체크포인트 저장소
+
+    제품 하나가 끝날 때마다 결과가 기록되므로, 실행이 중단되어도
+    --resume 으로 완료된 제품을 건너뛰고 나머지만 다시 크롤링할 수 있습니다.
+    여러 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, db_path='crawl_checkpoint.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                product_code TEXT PRIMARY KEY,
+                url TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at TEXT,
+                product_info TEXT,
+                reviews TEXT
+            )
+        """)
+        self._conn.commit()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.fetchall()
+
+    def reset(self):
+        """저장된 모든 체크포인트를 삭제합니다. (새 실행 시작 시)"""
+        self._execute("DELETE FROM products")
+
+    def mark_running(self, product_code, url):
+        """제품 처리 시작을 기록하고 시도 횟수를 1 증가시킵니다."""
+        self._execute("""
+            INSERT INTO products (product_code, url, status, attempts, updated_at)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(product_code) DO UPDATE SET
+                url = excluded.url,
+                status = excluded.status,
+                attempts = products.attempts + 1,
+                updated_at = excluded.updated_at
+        """, (product_code, url, STATUS_RUNNING, datetime.now().isoformat(timespec='seconds')))
+
+    def mark_done(self, product_code, product_info, reviews_df):
+        """제품 처리 완료와 수집 결과(상품 정보, 리뷰)를 기록합니다."""
+        product_info_json = json.dumps(product_info, ensure_ascii=False) if product_info else None
+        reviews_json = None
+        if reviews_df is not None and not reviews_df.empty:
+            reviews_json = reviews_df.to_json(orient='records', force_ascii=False)
+        self._execute("""
+            UPDATE products
+            SET status = ?, last_error = NULL, updated_at = ?, product_info = ?, reviews = ?
+            WHERE product_code = ?
+        """, (STATUS_DONE, datetime.now().isoformat(timespec='seconds'), product_info_json, reviews_json, product_code))
+
+    def mark_failed(self, product_code, error=None):
+        """최대 재시도 후에도 실패한 제품을 기록합니다."""
+        self._execute("""
+            UPDATE products SET status = ?, last_error = ?, updated_at = ?
+            WHERE product_code = ?
+        """, (STATUS_FAILED, str(error) if error else None, datetime.now().isoformat(timespec='seconds'), product_code))
+
+    def completed_codes(self):
+        """처리가 완료된 PRODUCT_CODE 집합을 반환합니다."""
+        rows = self._execute("SELECT product_code FROM products WHERE status = ?", (STATUS_DONE,))
+        return {row[0] for row in rows}
+
+    def load_result(self, product_code):
+        """
+        완료된 제품의 저장된 결과를 불러옵니다.
+
+        Returns:
+            tuple: (product_info, reviews_df) - 저장된 결과가 없으면 None
+        """
+        rows = self._execute(
+            "SELECT product_info, reviews FROM products WHERE product_code = ? AND status = ?",
+            (product_code, STATUS_DONE)
+        )
+        if not rows:
+            return None, None
+        product_info_json, reviews_json = rows[0]
+        product_info = json.loads(product_info_json) if product_info_json else None
+        reviews_df = pd.DataFrame(json.loads(reviews_json)) if reviews_json else None
+        return product_info, reviews_df
+
+    def summary(self):
+        """상태별 제품 수를 반환합니다."""
+        rows = self._execute("SELECT status, COUNT(*) FROM products GROUP BY status")
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,21 @@
 # reviewcrawler/crawler.py
-import re
-import time
 import pandas as pd
-from bs4 import BeautifulSoup
 from datetime import datetime
 import os
 
 # Selenium 관련
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
 
-# webdriver-manager로 크롬드라이버 버전 자동 관리
-from webdriver_manager.chrome import ChromeDriverManager
-
 # 유틸리티 함수 가져오기
-from reviewcrawler.utils import safe_click, extract_product_info_from_html, parse_product_info_tables, generate_product_code
+from reviewcrawler.utils import safe_click, extract_product_info_from_html, generate_product_code
+from reviewcrawler.document import get_document
+from reviewcrawler.archive import archive_snapshot, KIND_PRODUCT, KIND_DETAIL
+from common.waits import wait_page_loaded
+from common.browser import start_page_measurement, record_page_metrics
+from common.driver_factory import create_driver, note_page_load
+from common.timing import timed
+from common.endpoints import absolute_url
 
 class NaverShoppingCrawler:
     """네이버 쇼핑몰 크롤러 클래스"""
@@ -28,20 +27,8 @@ class NaverShoppingCrawler:
         
     def setup_driver(self):
         """Chrome 웹드라이버 설정"""
-        options = webdriver.ChromeOptions()
-        # options.add_argument("--headless")  # 헤드리스 모드 활성화
-        options.add_argument("window-size=1920x1080")  # 브라우저 크기
-        options.add_argument("disable-gpu")
-        options.add_argument("disable-infobars")
-        options.add_argument("--disable-extensions")
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')  # 메모리 관련 오류 방지
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.implicitly_wait(3)
-        self.driver = driver
-        return driver
+        self.driver = create_driver(implicit_wait=3)
+        return self.driver
     
     def close(self):
         """드라이버 종료"""
@@ -64,59 +51,28 @@ class NaverShoppingCrawler:
         print("[INFO] 상품 정보 수집 시작...")
         
         if target_url.startswith('/'):
-            target_url = 'https://brand.naver.com' + target_url
+            target_url = absolute_url(target_url)
             
         try:
             if not self.driver:
                 self.setup_driver()
-            self.driver.get(target_url)
-            time.sleep(3)
-            
-            html_source = self.driver.page_source
-            soup = BeautifulSoup(html_source, 'html.parser')
-            
-            product_info = {}
-            product_info['상품URL'] = target_url
+            start_page_measurement(self.driver)
+            with timed('driver_get'):
+                self.driver.get(target_url)
+            note_page_load(self.driver)
+            wait_page_loaded(self.driver, fixed_delay=3)
+            record_page_metrics(self.driver, target_url)
             
-            # 상품 제목 추출
-            title_selectors = [
-                'h3._22kNQuEXmb',
-                'h3[class*="product_title"]',
-                'div[class*="headingArea"] h2',
-                'h2[class*="product_title"]'
-            ]
-            for selector in title_selectors:
-                title_element = soup.select_one(selector)
-                if title_element:
-                    product_info['상품명'] = title_element.get_text(strip=True)
-                    break
-            
-            # 가격 정보 추출
-            price_selectors = [
-                'span[class*="price_num"]',
-                'span.price_num__OMokY',
-                'div[class*="price"] strong',
-                'em[class*="price"]'
-            ]
-            for selector in price_selectors:
-                price_element = soup.select_one(selector)
-                if price_element:
-                    price_text = price_element.get_text(strip=True)
-                    price_value = re.sub(r'[^\d]', '', price_text)
-                    if price_value:
-                        product_info['가격'] = price_value
-                        break
-            
-            # 테이블 파싱
-            tables_info = parse_product_info_tables(html_source)
-            product_info.update(tables_info)
-            print("[DEBUG] 테이블에서 파싱한 정보:")
-            for k, v in tables_info.items():
-                print(f"- {k}: {v}")
+            # 첫 로딩 스냅샷은 한 번만 파싱하여 제목/가격/테이블 추출에 공유
+            with timed('page_source'):
+                html_source = self.driver.page_source
+            document = get_document(html_source)
             
             # 상세 상품 정보 수집 및 표준화
-            from reviewcrawler.product_info import crawl_detailed_product_info, standardize_product_info
-            product_info = crawl_detailed_product_info(self.driver, product_info)
+            from reviewcrawler.product_info import parse_basic_product_info, crawl_detailed_product_info, standardize_product_info
+            product_info = parse_basic_product_info(document, target_url)
+            detail_snapshots = []
+            product_info = crawl_detailed_product_info(self.driver, product_info, snapshots=detail_snapshots)
             standardized_info = standardize_product_info(product_info)
             
             # 상품 코드 저장
@@ -129,6 +85,11 @@ class NaverShoppingCrawler:
             standardized_info['PRODUCT_CODE'] = product_code
             self.product_code = product_code  # 클래스 변수에 저장하여 이후 리뷰에서 재사용
             
+            # 오프라인 재파싱용 스냅샷 저장 (아카이브가 설정된 경우)
+            archive_snapshot(document, product_code, target_url, KIND_PRODUCT)
+            for detail_document in detail_snapshots:
+                archive_snapshot(detail_document, product_code, target_url, KIND_DETAIL)
+            
             if output_csv and standardized_info:
                 df = pd.DataFrame([standardized_info])
                 cols = df.columns.tolist()
@@ -147,7 +108,7 @@ class NaverShoppingCrawler:
             from reviewcrawler.product_info import standardize_product_info
             return standardize_product_info(product_info if 'product_info' in locals() else {})
     
-    def crawl_reviews(self, target_url, max_pages=None, output_csv=None, return_df=False, append_mode=False, product_code=None):
+    def crawl_reviews(self, target_url, max_pages=None, output_csv=None, return_df=False, append_mode=False, product_code=None, watermark=None):
         """
         스마트스토어 상품의 리뷰 데이터 수집
         
@@ -158,6 +119,7 @@ class NaverShoppingCrawler:
             return_df (bool, optional): 데이터프레임 반환 여부
             append_mode (bool, optional): 기존 CSV에 결과 추가 여부
             product_code (str, optional): 미리 생성된 상품 코드. 없으면 객체에 저장된 코드 사용
+            watermark (ReviewWatermark, optional): 증분 수집용 리뷰 기준점
             
         Returns:
             DataFrame: return_df True 시 데이터프레임 반환
@@ -175,5 +137,6 @@ class NaverShoppingCrawler:
             output_csv=output_csv,
             return_df=return_df,
             append_mode=append_mode,
-            product_code=product_code  # 상품 코드 전달
+            product_code=product_code,  # 상품 코드 전달
+            watermark=watermark
         )
\ No newline at end of file
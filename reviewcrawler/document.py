@@ -0,0 +1,86 @@
+# reviewcrawler/document.py
+import hashlib
+import threading
+from collections import OrderedDict
+from common.html_parser import parse_html, get_parser_backend
+
+# 최근 파싱한 문서를 보관할 개수 (문서 하나가 수 MB이므로 작게 유지)
+DOCUMENT_CACHE_SIZE = 4
+
+_document_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def hash_html(html_source):
+    """HTML 문자열의 내용 해시(MD5)를 반환합니다."""
+    return hashlib.md5(html_source.encode('utf-8')).hexdigest()
+
+class ParsedDocument:
+    """
+    page_source 스냅샷 하나를 한 번만 파싱하여 여러 추출 함수가 공유하는 문서 객체
+
+    추출 함수들은 트리를 읽기만 하므로 같은 객체를 그대로 전달해도 안전합니다.
+    """
+
+    def __init__(self, html_source, content_hash=None, backend=None):
+        self.html = html_source
+        self.content_hash = content_hash or hash_html(html_source)
+        self.backend = backend or get_parser_backend()
+        self._soup = None
+        self._page_state = None
+        self._page_state_decoded = False
+        self._lock = threading.Lock()
+
+    @property
+    def soup(self):
+        """BeautifulSoup 호환 트리 (처음 접근할 때 설정된 백엔드로 한 번만 파싱)"""
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = parse_html(self.html, self.backend)
+        return self._soup
+
+    @property
+    def page_state(self):
+        """페이지에 포함된 상태 JSON(__PRELOADED_STATE__, 없으면 None) - 처음 접근할 때 한 번만 해석"""
+        if not self._page_state_decoded:
+            from reviewcrawler.page_state import decode_page_state
+            with self._lock:
+                if not self._page_state_decoded:
+                    self._page_state = decode_page_state(self.html)
+                    self._page_state_decoded = True
+        return self._page_state
+
+def get_document(source):
+    """
+    HTML 문자열 또는 ParsedDocument를 받아 ParsedDocument를 반환합니다.
+
+    같은 내용의 HTML은 내용 해시로 캐시된 문서를 재사용하므로
+    동일한 스냅샷을 여러 추출 함수에 넘겨도 파싱은 한 번만 일어납니다.
+
+    Args:
+        source (str | ParsedDocument): HTML 소스 또는 이미 파싱된 문서
+
+    Returns:
+        ParsedDocument: 파싱된 문서 객체
+    """
+    if isinstance(source, ParsedDocument):
+        return source
+
+    content_hash = hash_html(source)
+    backend = get_parser_backend()
+    cache_key = (backend, content_hash)
+    with _cache_lock:
+        document = _document_cache.get(cache_key)
+        if document is not None:
+            _document_cache.move_to_end(cache_key)
+            return document
+        document = ParsedDocument(source, content_hash, backend)
+        _document_cache[cache_key] = document
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+    return document
+
+def clear_document_cache():
+    """문서 캐시를 비웁니다."""
+    with _cache_lock:
+        _document_cache.clear()
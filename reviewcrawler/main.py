@@ -4,7 +4,22 @@ import time
 import pandas as pd
 import os
 from tqdm import tqdm
+from common.pool import CrawlerPool
 from reviewcrawler.crawler import NaverShoppingCrawler
+from reviewcrawler.watermark import ReviewWatermarkStore, PendingWatermarks
+from reviewcrawler.archive import SnapshotArchive, set_archive
+from reviewcrawler.sinks import OUTPUT_FORMATS, DEFAULT_BATCH_SIZE, create_sink, stream_csv_to_excel
+from common.html_parser import PARSER_BACKENDS, set_parser_backend
+from reviewcrawler.review_crawler import REVIEW_EXTRACTORS, set_review_extractor
+from reviewcrawler.parse_pipeline import configure_parse_pool, shutdown_parse_pool
+from reviewcrawler.product_info import SUMMARY_SOURCES, set_summary_source
+from common.waits import WAIT_MODES, set_wait_mode, print_wait_summary
+from common.browser import PAGE_LOAD_STRATEGIES, configure_browser, print_page_metrics_summary
+from common.endpoints import set_base_url, absolute_url
+from common.selector_stats import SELECTOR_ORDERS, set_selector_order, selector_stats, print_selector_summary
+from common.selector_registry import load_selector_file
+from common.driver_factory import configure_driver_recycling
+from common.timing import set_timing_enabled, timing_context, category_label, write_timing_report, print_timing_summary
 
 def convert_csv_to_excel(csv_path, excel_path=None):
     """
@@ -21,17 +36,109 @@ def convert_csv_to_excel(csv_path, excel_path=None):
         excel_path = csv_path.replace('.csv', '.xlsx')
     
     try:
-        df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        df.to_excel(excel_path, index=False, engine='openpyxl')
+        stream_csv_to_excel(csv_path, excel_path)
         print(f"Excel 파일 생성 완료: {excel_path}")
         return excel_path
     except Exception as e:
         print(f"Excel 파일 생성 중 오류 발생: {e}")
         return None
 
+def crawl_single_url(crawler, idx, task, total, max_pages=5, reviews_only=False, product_only=False, watermarks=None):
+    """
+    URL 한 개의 상품 정보와 리뷰를 크롤링 (워커 풀의 각 워커에서 호출)
+    
+    Args:
+        crawler: 워커 전용 NaverShoppingCrawler 인스턴스
+        idx: URL 목록 내 순번
+        task: (url, product_code, (depth1, depth2, depth3, depth4)) 튜플
+        total: 전체 URL 수
+        max_pages: 수집할 리뷰 최대 페이지 수
+        reviews_only: 리뷰만 수집 여부
+        product_only: 상품 정보만 수집 여부
+        watermarks: 증분 리뷰 수집용 ReviewWatermarkStore (None이면 전체 수집)
+        
+    Returns:
+        tuple: (product_info, reviews_df, new_watermark) - 수집되지 않은 항목은 None
+            new_watermark는 (상품 코드, 리뷰를 반영한 기준점)으로, 리뷰가 결과 파일에 기록된 뒤에 저장합니다.
+    """
+    url, product_code, (depth1, depth2, depth3, depth4) = task
+    print(f"\n처리 중: {idx+1}/{total} - {url}")
+    if any([depth1, depth2, depth3, depth4]):
+        print(f"카테고리: {depth1 or ''} > {depth2 or ''} > {depth3 or ''} > {depth4 or ''}")
+    
+    start_time = time.time()
+    product_info = None
+    reviews_df = None
+    new_watermark = None
+    
+    # 제품 정보 크롤링
+    if not reviews_only:
+        product_info = crawler.crawl_product_info(
+            target_url=url,
+            external_product_code=product_code
+        )
+        
+        # 상품 코드 업데이트 (외부 코드가 없었던 경우)
+        if not product_code:
+            product_code = crawler.product_code
+        
+        if product_info:
+            # 카테고리 정보 추가
+            if depth1:
+                product_info['1st_depth'] = depth1
+            if depth2:
+                product_info['2nd_depth'] = depth2
+            if depth3:
+                product_info['3rd_depth'] = depth3
+            if depth4:
+                product_info['4th_depth'] = depth4
+        
+    # 리뷰 크롤링
+    if not product_only:
+        # 증분 모드면 이전 실행의 기준점 이후 리뷰만 수집
+        watermark = None
+        if watermarks is not None:
+            if product_code:
+                watermark = watermarks.get(product_code)
+            else:
+                print("  - [WARN] 상품 코드가 없어 증분 수집을 적용할 수 없습니다.")
+        reviews_df = crawler.crawl_reviews(
+            target_url=url,
+            max_pages=max_pages,
+            return_df=True,
+            product_code=product_code,
+            watermark=watermark
+        )
+        
+        if reviews_df is not None and not reviews_df.empty:
+            # 카테고리 정보 추가
+            if depth1:
+                reviews_df['1st_depth'] = depth1
+            if depth2:
+                reviews_df['2nd_depth'] = depth2
+            if depth3:
+                reviews_df['3rd_depth'] = depth3
+            if depth4:
+                reviews_df['4th_depth'] = depth4
+            
+            print(f"  - 수집된 리뷰 수: {len(reviews_df)}개")
+        else:
+            reviews_df = None
+            print("  - 수집된 리뷰가 없습니다.")
+        
+        # 리뷰 기준점 (저장은 결과 파일에 기록된 뒤 run_review_crawler에서)
+        if watermarks is not None and product_code:
+            new_watermark = (product_code, watermarks.propose(product_code, reviews_df))
+    
+    # 처리 시간 출력
+    elapsed_time = time.time() - start_time
+    print(f"  - 처리 시간: {elapsed_time:.2f}초")
+    return product_info, reviews_df, new_watermark
+
 def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_all.csv', 
                       product_output_csv='product_info_all.csv', reviews_only=False, 
-                      product_only=False, max_products=None, use_tqdm=True):
+                      product_only=False, max_products=None, use_tqdm=True, workers=1, max_retries=1,
+                      watermark_db=None, batch_size=DEFAULT_BATCH_SIZE, output_format='csv'):
     """
     리뷰 크롤러 실행 함수
     
@@ -45,9 +152,16 @@ def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_
         product_only: 상품 정보만 수집 여부
         max_products: 최대 처리할 제품 수
         use_tqdm: tqdm 진행 표시줄 사용 여부
+        workers: 동시에 실행할 브라우저 워커 수
+        max_retries: URL당 최대 시도 횟수 (실패 시 해당 워커의 드라이버만 재설정)
+        watermark_db: 증분 리뷰 수집용 기준점 DB 파일 (None이면 전체 수집)
+        batch_size: 결과 파일에 한 번에 기록할 행 수 (메모리에 모아 두는 최대 행 수)
+        output_format: 결과 파일 형식 ('csv' 또는 'parquet' - parquet이면 확장자를 .parquet으로 변경)
         
     Returns:
-        tuple: (product_info_df, reviews_df) 수집된 제품 정보와 리뷰 데이터프레임
+        tuple: (product_count, review_count) 결과 파일에 기록된 제품 정보와 리뷰 수
+            (결과는 배치 단위로 파일에 기록하므로 DataFrame은 반환하지 않음, 결과가 필요하면 output_csv 파일을 읽음.
+            URL 파일을 읽지 못하면 (0, 0))
     """
     
     # 단일 URL 또는 URL 파일 확인
@@ -60,7 +174,7 @@ def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_
         # CSV 파일에서 URL 목록 불러오기
         if not os.path.exists(url_file):
             print(f"[ERROR] URL 파일이 존재하지 않습니다: {url_file}")
-            return None, None
+            return 0, 0
         
         try:
             url_df = pd.read_csv(url_file)
@@ -69,7 +183,7 @@ def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_
             missing_cols = [col for col in required_cols if col not in url_df.columns]
             if missing_cols:
                 print(f"[ERROR] URL 파일에 필요한 컬럼이 누락되었습니다: {missing_cols}")
-                return None, None
+                return 0, 0
             
             # PRODUCT_CODE 컬럼이 없으면 None으로 초기화
             if 'PRODUCT_CODE' not in url_df.columns:
@@ -98,10 +212,10 @@ def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_
             print(f"[INFO] URL 파일에서 {len(target_urls)}개의 URL을 읽었습니다.")
         except Exception as e:
             print(f"[ERROR] URL 파일 읽기 오류: {e}")
-            return None, None
+            return 0, 0
     else:
         # 기본 URL 설정
-        target_urls = ['https://brand.naver.com/onnon/products/8045986719']
+        target_urls = [absolute_url('/onnon/products/8045986719')]
         product_codes = [None]
         depth_info = [(None, None, None, None)]
         print(f"[INFO] URL이 제공되지 않아 기본 URL을 사용합니다: {target_urls[0]}")
@@ -110,142 +224,88 @@ def run_review_crawler(url=None, url_file=None, max_pages=5, output_csv='review_
     print("네이버 스마트스토어 상품 정보 및 리뷰 크롤러")
     print("="*50)
     
-    # 결과를 저장할 리스트 초기화
-    product_info_list = []
-    review_dfs = []
+    # 결과는 URL 처리가 끝날 때마다 배치 단위로 파일에 기록
+    product_sink = None
+    review_sink = None
+    if product_output_csv and not reviews_only:
+        product_sink = create_sink(product_output_csv, output_format, batch_size=batch_size)
+    if output_csv and not product_only:
+        review_sink = create_sink(output_csv, output_format, batch_size=batch_size)
+    product_count = 0
+    review_count = 0
+    run_start_time = time.time()
+    
+    # 브라우저 워커 풀 초기화 (워커마다 별도의 NaverShoppingCrawler 사용)
+    pool = CrawlerPool(NaverShoppingCrawler, workers=workers, max_retries=max_retries, retry_delay=5)
+    tasks = list(enumerate(zip(target_urls, product_codes, depth_info)))
+    watermarks = ReviewWatermarkStore(watermark_db) if watermark_db else None
+    # 리뷰 기준점은 리뷰가 결과 파일에 기록된 뒤에 저장 (중단되어도 기록되지 않은 리뷰를 다음 실행에서 다시 수집)
+    pending_watermarks = PendingWatermarks(watermarks) if watermarks is not None else None
+    
+    def handler(crawler, task):
+        idx, (url, product_code, depths) = task
+        with timing_context(product=product_code or url, category=category_label(depths)):
+            return crawl_single_url(
+                crawler, idx, task[1], len(tasks), max_pages=max_pages,
+                reviews_only=reviews_only, product_only=product_only, watermarks=watermarks
+            )
     
-    # 네이버 쇼핑 크롤러 초기화
-    crawler = NaverShoppingCrawler()
+    # 각 URL에 대해 크롤링 수행 (결과는 입력 순서대로 기록)
+    pool_results = pool.run(tasks, handler)
+    iterator = pool_results
+    if use_tqdm:
+        iterator = tqdm(iterator, total=len(tasks), desc="제품 크롤링 진행")
     
     try:
-        # 각 URL에 대해 크롤링 수행
-        iterator = enumerate(zip(target_urls, product_codes, depth_info))
-        if use_tqdm:
-            iterator = tqdm(iterator, total=len(target_urls), desc="제품 크롤링 진행")
-        
-        for idx, (url, product_code, (depth1, depth2, depth3, depth4)) in iterator:
-            print(f"\n처리 중: {idx+1}/{len(target_urls)} - {url}")
-            if any([depth1, depth2, depth3, depth4]):
-                print(f"카테고리: {depth1 or ''} > {depth2 or ''} > {depth3 or ''} > {depth4 or ''}")
-            
-            start_time = time.time()
-            
-            try:
-                # 제품 정보 크롤링
-                if not reviews_only:
-                    temp_product_file = f"temp_product_{idx}.csv" if product_output_csv else None
-                    product_info = crawler.crawl_product_info(
-                        target_url=url,
-                        output_csv=temp_product_file,
-                        external_product_code=product_code
-                    )
-                    
-                    # 상품 코드 업데이트 (외부 코드가 없었던 경우)
-                    if not product_code:
-                        product_code = crawler.product_code
-                    
-                    if product_info:
-                        # 카테고리 정보 추가
-                        if depth1:
-                            product_info['1st_depth'] = depth1
-                        if depth2:
-                            product_info['2nd_depth'] = depth2
-                        if depth3:
-                            product_info['3rd_depth'] = depth3
-                        if depth4:
-                            product_info['4th_depth'] = depth4
-                        
-                        # 결과 리스트에 추가
-                        product_info_list.append(product_info)
-                        
-                        # 임시 파일 삭제
-                        if temp_product_file and os.path.exists(temp_product_file):
-                            os.remove(temp_product_file)
-                    
-                # 리뷰 크롤링
-                if not product_only:
-                    temp_review_file = f"temp_review_{idx}.csv" if output_csv else None
-                    reviews_df = crawler.crawl_reviews(
-                        target_url=url,
-                        max_pages=max_pages,
-                        output_csv=temp_review_file,
-                        return_df=True,
-                        product_code=product_code
-                    )
-                    
-                    if reviews_df is not None and not reviews_df.empty:
-                        # 카테고리 정보 추가
-                        if depth1:
-                            reviews_df['1st_depth'] = depth1
-                        if depth2:
-                            reviews_df['2nd_depth'] = depth2
-                        if depth3:
-                            reviews_df['3rd_depth'] = depth3
-                        if depth4:
-                            reviews_df['4th_depth'] = depth4
-                        
-                        # 결과 리스트에 추가
-                        review_dfs.append(reviews_df)
-                        
-                        print(f"  - 수집된 리뷰 수: {len(reviews_df)}개")
-                        
-                        # 임시 파일 삭제
-                        if temp_review_file and os.path.exists(temp_review_file):
-                            os.remove(temp_review_file)
-                    else:
-                        print("  - 수집된 리뷰가 없습니다.")
-                
-                # 처리 시간 출력
-                elapsed_time = time.time() - start_time
-                print(f"  - 처리 시간: {elapsed_time:.2f}초")
-                
-            except Exception as e:
-                print(f"[ERROR] URL 처리 중 오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                # 드라이버 재설정
-                crawler.close()
-                crawler.setup_driver()
+        for _, (idx, (url, _, _)), result in iterator:
+            if result is None:
+                print(f"[ERROR] URL 처리 실패: {url}")
                 continue
-    
+            product_info, reviews_df, new_watermark = result
+            if product_info:
+                product_count += 1
+                if product_sink is not None:
+                    product_sink.write(product_info)
+            if reviews_df is not None:
+                review_count += len(reviews_df)
+                if review_sink is not None:
+                    review_sink.write(reviews_df)
+            if pending_watermarks is not None and new_watermark is not None:
+                pending_watermarks.add(*new_watermark)
+                if review_sink is None or not review_sink.buffered:
+                    pending_watermarks.commit()
     finally:
-        # 크롤러 종료
-        crawler.close()
+        pool_results.close()
+        if product_sink is not None:
+            product_sink.close()
+        if review_sink is not None:
+            review_sink.close()
+        if watermarks is not None:
+            # 싱크를 닫아 남은 리뷰가 모두 기록된 경우에만 저장
+            pending_watermarks.commit()
+            watermarks.close()
     
-    # 결과 DataFrame 생성 및 저장
-    product_info_df = None
-    reviews_df = None
-    
-    if product_info_list and not reviews_only:
-        product_info_df = pd.DataFrame(product_info_list)
-        if product_output_csv:
-            csv_path = product_output_csv
-            excel_path = product_output_csv.replace('.csv', '.xlsx')
-            
-            product_info_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            print(f"\n제품 정보 CSV 저장 완료: {csv_path} ({len(product_info_df)}개)")
-            
-            # Excel 파일로 변환
-            convert_csv_to_excel(csv_path, excel_path)
+    if product_sink is not None and product_sink.count:
+        print(f"\n제품 정보 저장 완료: {product_sink.path} ({product_sink.count}개)")
+        
+        # Excel 파일로 변환
+        if output_format == 'csv':
+            convert_csv_to_excel(product_sink.path, product_sink.path.replace('.csv', '.xlsx'))
     
-    if review_dfs and not product_only:
-        reviews_df = pd.concat(review_dfs, ignore_index=True) if review_dfs else None
-        if output_csv and reviews_df is not None:
-            csv_path = output_csv
-            excel_path = output_csv.replace('.csv', '.xlsx')
-            
-            reviews_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            print(f"리뷰 정보 CSV 저장 완료: {csv_path} ({len(reviews_df)}개)")
-            
-            # Excel 파일로 변환
-            convert_csv_to_excel(csv_path, excel_path)
+    if review_sink is not None and review_sink.count:
+        print(f"리뷰 정보 저장 완료: {review_sink.path} ({review_sink.count}개)")
+        
+        # Excel 파일로 변환
+        if output_format == 'csv':
+            convert_csv_to_excel(review_sink.path, review_sink.path.replace('.csv', '.xlsx'))
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.time() - run_start_time
     print(f"\n총 소요 시간: {elapsed_time:.2f}초")
+    print_wait_summary()
+    print_page_metrics_summary()
     print("="*50)
     
-    return product_info_df, reviews_df
+    return product_count, review_count
 
 def main():
     parser = argparse.ArgumentParser(description='네이버 스마트스토어 상품 정보 및 리뷰 크롤러')
@@ -254,25 +314,85 @@ def main():
     parser.add_argument('--pages', type=int, default=5, help='수집할 최대 페이지 수 (기본값: 5)')
     parser.add_argument('--output', type=str, default='review_all.csv', help='통합 리뷰 결과를 저장할 CSV 파일명')
     parser.add_argument('--product-output', type=str, default='product_info_all.csv', help='통합 상품 정보를 저장할 CSV 파일명')
+    parser.add_argument('--review-extractor', choices=REVIEW_EXTRACTORS, default='html', help='리뷰 추출 방식: html(page_source 파싱) / script(페이지 안 스크립트로 리뷰 필드만 추출) (기본값: html)')
+    parser.add_argument('--parse-processes', type=int, default=None, help='리뷰 페이지 HTML을 파싱할 백그라운드 프로세스 수, 브라우저가 다음 페이지로 이동하는 동안 이전 페이지를 파싱 (html 추출 방식만, 기본값: 환경 변수 CRAWLER_PARSE_PROCESSES 또는 0=사용 안 함)')
+    parser.add_argument('--summary-source', choices=SUMMARY_SOURCES, default='state', help='상품 요약 정보 추출 방식: state(페이지 상태 JSON 우선, 없는 필드만 CSS 선택자) / css(CSS 선택자만) (기본값: state)')
     parser.add_argument('--reviews-only', action='store_true', help='리뷰만 수집합니다 (상품 정보 수집 건너뜀)')
     parser.add_argument('--product-only', action='store_true', help='상품 정보만 수집합니다 (리뷰 수집 건너뜀)')
     parser.add_argument('--max-products', type=int, default=None, help='처리할 최대 제품 수')
     parser.add_argument('--use-tqdm', action='store_true', help='tqdm을 사용하여 진행 상황 표시')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 실행할 브라우저 워커 수 (기본값: 1)')
+    parser.add_argument('--max-retries', type=int, default=1, help='URL당 최대 시도 횟수 (기본값: 1)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default='html.parser', help='HTML 파서 백엔드 (기본값: html.parser)')
+    parser.add_argument('--wait-mode', choices=WAIT_MODES, default='fixed', help='대기 방식: fixed(고정 sleep) / adaptive(조건 기반) (기본값: fixed)')
+    parser.add_argument('--incremental', action='store_true', help='이전 실행 이후 새로 작성된 리뷰만 수집 (상품별 기준점 사용)')
+    parser.add_argument('--watermark-db', type=str, default='review_watermarks.db', help='상품별 리뷰 기준점을 저장할 DB 파일')
+    parser.add_argument('--lean', action='store_true', help='이미지/미디어/폰트/광고·분석 요청을 차단하여 전송량을 줄임')
+    parser.add_argument('--headless', action='store_true', help='브라우저를 화면 없이 실행')
+    parser.add_argument('--page-load-strategy', choices=PAGE_LOAD_STRATEGIES, default='normal', help='페이지 로딩 전략: normal / eager (기본값: normal)')
+    parser.add_argument('--base-url', type=str, default=None, help='네이버 대신 접속할 주소 (예: 로컬 대역 서버 http://127.0.0.1:8765, 기본값: 환경 변수 CRAWLER_BASE_URL 또는 네이버)')
+    parser.add_argument('--measure-pages', action='store_true', help='상품 페이지별 전송량과 로딩 시간을 측정하여 출력')
+    parser.add_argument('--recycle-pages', type=int, default=None, help='브라우저 하나로 처리할 최대 페이지 수, 넘으면 작업 사이에 재시작 (기본값: 200, 0이면 제한 없음)')
+    parser.add_argument('--recycle-rss-mb', type=int, default=None, help='브라우저 메모리(MB)가 이 값을 넘으면 작업 사이에 재시작 (psutil 필요, 기본값: 제한 없음)')
+    parser.add_argument('--timing-report', type=str, default=None, help='단계별 소요 시간(p50/p95/최대, 상품·카테고리별) JSON 보고서 파일 (미지정 시 계측 안 함)')
+    parser.add_argument('--prometheus-file', type=str, default=None, help='단계별 소요 시간을 Prometheus 텍스트 형식으로 저장할 파일 (--timing-report와 함께 사용)')
+    parser.add_argument('--archive', type=str, default=None, help='page_source 스냅샷을 저장할 HTML 아카이브 디렉터리 (오프라인 재파싱용, 미지정 시 저장 안 함)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help='결과 파일 형식: csv(+엑셀) / parquet (기본값: csv)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'결과 파일에 한 번에 기록할 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--selector-order', choices=SELECTOR_ORDERS, default='static', help='대체 선택자 시도 순서: static(선택자 파일 순서) / adaptive(기본 선택자가 계속 불일치하면 마지막으로 일치한 선택자 우선) (기본값: static)')
+    parser.add_argument('--selector-file', type=str, default=None, help='선택자 그룹 데이터 파일 (기본값: 환경 변수 CRAWLER_SELECTOR_FILE 또는 common/selectors.json)')
+    parser.add_argument('--selector-stats', type=str, default='selector_stats.json', help='선택자별 일치/불일치 통계를 실행 간에 유지할 JSON 파일 (빈 문자열이면 저장 안 함)')
 
     args = parser.parse_args()
     
+    set_parser_backend(args.parser)
+    set_wait_mode(args.wait_mode)
+    set_review_extractor(args.review_extractor)
+    configure_parse_pool(args.parse_processes)
+    set_summary_source(args.summary_source)
+    if args.selector_file:
+        load_selector_file(args.selector_file)
+    set_selector_order(args.selector_order)
+    if args.selector_stats and selector_stats.load(args.selector_stats):
+        print(f"[INFO] 선택자 통계 불러옴: {args.selector_stats}")
+    if args.base_url:
+        set_base_url(args.base_url)
+    configure_browser(lean=args.lean, headless=args.headless, page_load_strategy=args.page_load_strategy, measure=args.measure_pages)
+    configure_driver_recycling(max_pages=args.recycle_pages, max_rss_mb=args.recycle_rss_mb)
+    set_timing_enabled(bool(args.timing_report))
+    archive = SnapshotArchive(args.archive) if args.archive else None
+    set_archive(archive)
+    
     # 크롤러 실행
-    run_review_crawler(
-        url=args.url,
-        url_file=args.url_file,
-        max_pages=args.pages,
-        output_csv=args.output,
-        product_output_csv=args.product_output,
-        reviews_only=args.reviews_only,
-        product_only=args.product_only,
-        max_products=args.max_products,
-        use_tqdm=args.use_tqdm
-    )
+    try:
+        run_review_crawler(
+            url=args.url,
+            url_file=args.url_file,
+            max_pages=args.pages,
+            output_csv=args.output,
+            product_output_csv=args.product_output,
+            reviews_only=args.reviews_only,
+            product_only=args.product_only,
+            max_products=args.max_products,
+            use_tqdm=args.use_tqdm,
+            workers=args.workers,
+            max_retries=args.max_retries,
+            watermark_db=args.watermark_db if args.incremental else None,
+            batch_size=args.batch_size,
+            output_format=args.format
+        )
+    finally:
+        shutdown_parse_pool()
+        if archive is not None:
+            print(f"[ARCHIVE] 저장된 스냅샷: {archive.summary()}")
+            archive.close()
+        if args.selector_stats:
+            selector_stats.save(args.selector_stats)
+            print(f"[INFO] 선택자 통계 저장: {args.selector_stats}")
+    print_selector_summary()
+    
+    if args.timing_report:
+        print_timing_summary(write_timing_report(args.timing_report, args.prometheus_file))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,107 @@
+# reviewcrawler/page_state.py
+import re
+import json
+
+from common.selector_stats import first_match
+from common.selector_registry import patterns
+
+# 스마트스토어 상품 페이지는 화면에 그리는 상품 상태 전체를 스크립트 안의 JSON으로 포함합니다.
+# (window.__PRELOADED_STATE__ = {...};) 이 값을 한 번 해석해 두면 난독화된 클래스명을 찾지 않고 요약 정보를 얻을 수 있습니다.
+_STATE_PATTERN = re.compile(r'__PRELOADED_STATE__\s*=\s*(?=\{)')
+
+_decoder = json.JSONDecoder()
+
+def decode_page_state(html_source):
+    """
+    HTML 문자열에서 __PRELOADED_STATE__ JSON을 찾아 해석합니다.
+    (트리를 파싱하지 않고 원본 문자열에서 바로 찾음, 없거나 해석할 수 없으면 None)
+    """
+    for match in _STATE_PATTERN.finditer(html_source):
+        try:
+            state, _ = _decoder.raw_decode(html_source, match.end())
+        except ValueError as e:
+            print(f"[WARN] 페이지 상태 JSON 해석 실패: {e}")
+            continue
+        if isinstance(state, dict):
+            return state
+    return None
+
+def state_value(state, path):
+    """
+    'product.A.name' 형식의 경로로 상태 JSON의 값을 꺼냅니다. (숫자 부분은 목록 순번)
+
+    Returns:
+        값 (경로가 없거나 값이 null/빈 문자열이면 None)
+    """
+    value = state
+    for key in path.split('.'):
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+        if value is None:
+            return None
+    return None if value == '' else value
+
+def _count(value):
+    return str(int(value))
+
+def _price(value):
+    return f"{int(value):,}"
+
+def _rating(value):
+    return f"{float(value):.1f}"
+
+def _percent(value):
+    # 할인이 없는 상품은 화면에 할인율이 없으므로 CSS 경로와 같게 필드를 만들지 않음
+    return f"{int(value)}%" if int(value) > 0 else None
+
+def _shipping(value):
+    # 무료배송만 상태 값으로 결정 (조건부 무료/유료 배송은 화면 문구에 조건이 함께 있으므로 CSS 경로에 맡김)
+    return "무료배송" if value == 'FREE' else None
+
+# 요약 정보 필드 → (상태 경로 그룹 이름, 값 변환)
+# 변환 결과는 parse_summary_info의 CSS 경로가 화면 텍스트에서 얻는 형식(예: 가격 '39,200', 할인 '20%')이며,
+# 변환이 None을 반환하면 상태에서 정할 수 없는 값으로 보고 해당 필드는 CSS 경로로 찾습니다.
+# (평점은 CSS 경로가 '최근 6개월 4.8'에서 첫 숫자를 읽으므로 값이 다를 수 있음)
+STATE_FIELDS = {
+    '상품명': ('state_title', str),
+    '관심고객수': ('state_interest', _count),
+    '전체리뷰수': ('state_review_count', _count),
+    '평점': ('state_rating', _rating),
+    '할인정보': ('state_discount', _percent),
+    '할인전가격': ('state_original_price', _price),
+    '상품가격': ('state_price', _price),
+    '배송정보': ('state_shipping_fee_type', _shipping),
+}
+
+def parse_state_summary(state):
+    """
+    해석한 페이지 상태에서 요약 정보 필드를 추출합니다. (경로 그룹은 common/selectors.json의 state 영역)
+
+    Args:
+        state (dict | None): decode_page_state의 결과
+
+    Returns:
+        dict: 찾은 필드만 담은 요약 정보 (상태가 없으면 빈 dict)
+    """
+    if not state:
+        return {}
+    summary_info = {}
+    for field, (group, convert) in STATE_FIELDS.items():
+        value = first_match(group, patterns(group), lambda path: state_value(state, path))
+        if value is None:
+            continue
+        try:
+            converted = convert(value)
+        except (TypeError, ValueError):
+            print(f"[WARN] 페이지 상태 값 변환 실패: {field}={value!r}")
+            continue
+        if converted is not None:
+            summary_info[field] = converted
+    # 할인하지 않는 상품은 화면에 정상가(할인전가격)가 따로 없음
+    if summary_info.get('할인전가격') and summary_info.get('할인전가격') == summary_info.get('상품가격'):
+        del summary_info['할인전가격']
+    return summary_info
@@ -0,0 +1,131 @@
+# reviewcrawler/parse_pipeline.py
+import os
+import time
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from common.html_parser import get_parser_backend, set_parser_backend
+from common.selector_registry import registry, load_selector_file
+from common.selector_stats import selector_stats, get_selector_order, set_selector_order
+from common.timing import record_stage
+
+# 리뷰 페이지 HTML을 파싱/추출할 백그라운드 프로세스 수 (0이면 브라우저 스레드에서 바로 파싱, 기존 동작)
+# 프로세스를 쓰면 브라우저가 다음 페이지로 이동하는 동안 이전 페이지를 파싱합니다.
+_settings = {
+    'processes': int(os.environ.get('CRAWLER_PARSE_PROCESSES', '0') or 0),
+    # 상품 하나에서 결과를 기다리지 않고 앞서 보낼 수 있는 페이지 수
+    'depth': 2,
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def configure_parse_pool(processes=None, depth=None):
+    """
+    리뷰 페이지 백그라운드 파싱 설정
+
+    Args:
+        processes (int): 파싱 프로세스 수 (0이면 사용 안 함)
+        depth (int): 상품 하나에서 동시에 파싱 중일 수 있는 최대 페이지 수
+    """
+    if processes is not None:
+        _settings['processes'] = max(0, int(processes))
+    if depth is not None:
+        _settings['depth'] = max(1, int(depth))
+    if _settings['processes']:
+        print(f"[INFO] 리뷰 페이지 백그라운드 파싱: 프로세스 {_settings['processes']}개, 상품별 최대 {_settings['depth']}페이지")
+
+def is_parse_pool_enabled():
+    return _settings['processes'] > 0
+
+def _init_worker(backend, selector_file, selector_order):
+    """파싱 프로세스 초기화: 메인 프로세스의 파서 백엔드/선택자 설정을 그대로 사용"""
+    set_parser_backend(backend)
+    if selector_file != registry.path:
+        load_selector_file(selector_file)
+    set_selector_order(selector_order)
+    selector_stats.start_journal()
+
+def _get_executor():
+    """
+    공유 프로세스 풀 (여러 브라우저 워커 스레드가 함께 사용, 처음 사용할 때 생성)
+    브라우저 스레드가 떠 있는 상태에서 fork하지 않도록 spawn 방식으로 프로세스를 띄웁니다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=_settings['processes'],
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(get_parser_backend(), registry.path, get_selector_order()),
+            )
+        return _executor
+
+def shutdown_parse_pool():
+    """프로세스 풀을 종료합니다. (다음 사용 시 다시 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+def parse_review_snapshot(html_source):
+    """
+    파싱 프로세스에서 실행: 리뷰 페이지 HTML에서 리뷰 행과 총 리뷰 수 텍스트를 추출합니다.
+
+    Returns:
+        tuple: (찾은 리뷰 항목 수, 사용된 선택자, 리뷰 행 목록, 총 리뷰 수 텍스트, 선택자 통계 기록)
+    """
+    from reviewcrawler.review_crawler import extract_review_page
+    reviews_found, selector, page_rows, total_text = extract_review_page(html_source)
+    return reviews_found, selector, page_rows, total_text, selector_stats.take_journal()
+
+class ReviewParsePipeline:
+    """
+    상품 하나의 리뷰 페이지 HTML을 파싱 프로세스로 보내고, 결과를 페이지 순서대로 돌려주는 객체
+
+    브라우저 스레드는 submit 후 곧바로 다음 페이지로 이동하고,
+    보낸 페이지가 depth개를 넘으면 가장 오래된 페이지의 결과를 기다려 반환합니다.
+    """
+
+    def __init__(self, depth=None):
+        self.depth = depth or _settings['depth']
+        self._pending = deque()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def submit(self, page_num, html_source):
+        """
+        페이지 HTML을 파싱 프로세스로 보냅니다.
+
+        Returns:
+            list: 보낸 페이지가 depth개를 넘어 먼저 받은 결과 [(page_num, result)] (없으면 빈 목록)
+        """
+        self._pending.append((page_num, _get_executor().submit(parse_review_snapshot, html_source)))
+        ready = []
+        while len(self._pending) > self.depth:
+            ready.append(self._take())
+        return ready
+
+    def drain(self):
+        """남은 페이지의 결과를 페이지 순서대로 모두 받습니다."""
+        while self._pending:
+            yield self._take()
+
+    def cancel(self):
+        """아직 받지 않은 결과를 버립니다. (수집 종료 조건이 먼저 충족된 경우)"""
+        while self._pending:
+            _, future = self._pending.popleft()
+            future.cancel()
+
+    def _take(self):
+        page_num, future = self._pending.popleft()
+        start = time.perf_counter()
+        reviews_found, selector, page_rows, total_text, journal = future.result()
+        record_stage('parse_wait', time.perf_counter() - start)
+        selector_stats.replay(journal)
+        return page_num, (reviews_found, selector, page_rows, total_text)
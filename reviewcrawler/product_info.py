@@ -1,15 +1,42 @@
 # reviewcrawler/product_info.py
 import re
-import time
 import pandas as pd
-from bs4 import BeautifulSoup
 import os
 
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-
 from reviewcrawler.utils import safe_click, extract_product_info_from_html, parse_product_info_tables
+from reviewcrawler.document import get_document
+from common.waits import wait_network_idle
+from common.timing import timed, timed_stage
+from common.locators import click_any
+from common.selector_stats import first_match
+from common.selector_registry import selectors, patterns
+from reviewcrawler.page_state import parse_state_summary
+
+# 요약 정보(관심고객수, 리뷰 수, 평점, 가격, 할인, 배송) 추출 방식
+# - state: 페이지에 포함된 상태 JSON(__PRELOADED_STATE__)에서 먼저 꺼내고, 없는 필드만 CSS 선택자로 찾음 (기본값)
+# - css: 화면의 CSS 선택자로만 찾음 (기존 방식)
+SUMMARY_SOURCES = ('state', 'css')
+
+_summary_source = os.environ.get('CRAWLER_SUMMARY_SOURCE', 'state')
+
+def set_summary_source(source):
+    """요약 정보 추출 방식(state/css)을 설정합니다."""
+    global _summary_source
+    if source not in SUMMARY_SOURCES:
+        raise ValueError(f"지원하지 않는 요약 정보 추출 방식입니다: {source} (사용 가능: {', '.join(SUMMARY_SOURCES)})")
+    _summary_source = source
+    print(f"[INFO] 요약 정보 추출 방식: {source}")
 
+def get_summary_source():
+    return _summary_source
+
+def _page_state_summary(document):
+    """state 방식이면 페이지 상태 JSON에서 찾은 요약 정보, 아니면 빈 dict"""
+    if _summary_source != 'state':
+        return {}
+    return parse_state_summary(document.page_state)
+
+@timed_stage('extract')
 def standardize_product_info(product_info):
     """
     상품 정보를 표준화하고 논리적인 순서로 정렬합니다.
@@ -63,17 +90,80 @@ def standardize_product_info(product_info):
     
     return standardized_info
 
+@timed_stage('extract')
+def parse_basic_product_info(html_source, target_url):
+    """
+    상품 페이지 첫 로딩 스냅샷에서 기본 정보(상품명, 가격, 정보 테이블)를 추출합니다.
+    
+    Args:
+        html_source (str | ParsedDocument): HTML 소스 또는 파싱된 문서
+        target_url (str): 상품 페이지 URL
+        
+    Returns:
+        dict: 상품 정보 딕셔너리
+    """
+    document = get_document(html_source)
+    soup = document.soup
+    
+    product_info = {}
+    product_info['상품URL'] = target_url
+    state_info = _page_state_summary(document)
+    
+    # 상품 제목 추출 (페이지 상태에 없으면 선택자로 찾음)
+    if state_info.get('상품명'):
+        product_info['상품명'] = state_info['상품명']
+    else:
+        title_element = first_match('product_title', selectors('product_title'), soup.select_one)
+        if title_element:
+            product_info['상품명'] = title_element.get_text(strip=True)
+    
+    # 가격 정보 추출
+    def find_price(selector):
+        price_element = soup.select_one(selector)
+        if price_element:
+            return re.sub(r'[^\d]', '', price_element.get_text(strip=True)) or None
+        return None
+    if state_info.get('상품가격'):
+        price_value = re.sub(r'[^\d]', '', state_info['상품가격'])
+    else:
+        price_value = first_match('product_price', selectors('product_price'), find_price)
+    if price_value:
+        product_info['가격'] = price_value
+    
+    # 테이블 파싱
+    tables_info = parse_product_info_tables(document)
+    product_info.update(tables_info)
+    print("[DEBUG] 테이블에서 파싱한 정보:")
+    for k, v in tables_info.items():
+        print(f"- {k}: {v}")
+    return product_info
+
 def parse_summary_info(html_source):
-    soup = BeautifulSoup(html_source, 'html.parser')
+    """
+    상품 페이지 스냅샷에서 요약 정보를 추출합니다.
+    state 방식이면 페이지 상태 JSON에서 찾은 필드는 CSS 선택자로 다시 찾지 않습니다.
+    """
+    document = get_document(html_source)
+    soup = document.soup
     summary_info = {}
+    state_info = _page_state_summary(document)
+    if state_info:
+        print(f"[DEBUG] 페이지 상태에서 추출: {', '.join(state_info)}")
+
+    def from_state(field):
+        """페이지 상태에 있는 필드면 CSS 경로와 같은 위치(필드 순서)에 기록하고 True"""
+        if field in state_info:
+            summary_info[field] = state_info[field]
+            return True
+        return False
     
     # 상품명 추출
-    title_elem = soup.select_one("div._1eddO7u4UC h3._22kNQuEXmb")
+    title_elem = soup.select_one(selectors('summary_title')) if not from_state('상품명') else None
     if title_elem:
         summary_info['상품명'] = title_elem.get_text(strip=True)
     
     # 관심고객수 추출
-    interest_customer_elem = soup.select_one("span._2muLN5Fzlb")
+    interest_customer_elem = soup.select_one(selectors('summary_interest')) if not from_state('관심고객수') else None
     if interest_customer_elem:
         interest_text = interest_customer_elem.get_text(strip=True)
         if "관심고객수" in interest_text:
@@ -83,7 +173,7 @@ def parse_summary_info(html_source):
             print(f"[DEBUG] 관심고객수 추출: {interest_count}")
     
     # 전체 리뷰 수 추출
-    review_count_elem = soup.select_one("div._3GSqlAZeJb span.blind")
+    review_count_elem = soup.select_one(selectors('summary_review_count')) if not from_state('전체리뷰수') else None
     if review_count_elem:
         review_text = review_count_elem.get_text().strip()
         # "1,814개" 형태에서 숫자만 추출
@@ -94,7 +184,7 @@ def parse_summary_info(html_source):
             print(f"[DEBUG] 전체리뷰수 추출: {review_count}")
     
     # 평점 정보 추출
-    rating_elem = soup.select_one("div._1T5uchuSaW")
+    rating_elem = soup.select_one(selectors('summary_rating')) if not from_state('평점') else None
     if rating_elem:
         rating_text = rating_elem.get_text().strip()
         # "최근 6개월 5.0" 형태에서 숫자만 추출
@@ -106,7 +196,7 @@ def parse_summary_info(html_source):
             print(f"[DEBUG] 평점 추출: {rating}")
     
     # 5점 비율 추출
-    star5_elem = soup.select_one("li._2Vmt6-4BvP._3d-jESzl9J em._1JW7r9h1sP")
+    star5_elem = soup.select_one(selectors('summary_star5'))
     if star5_elem:
         star5_text = star5_elem.get_text().strip()
         # "1,206명" 형태에서 숫자만 추출
@@ -117,11 +207,11 @@ def parse_summary_info(html_source):
             print(f"[DEBUG] 5점리뷰수 추출: {star5_count}")
     
     # 사이즈, 두께, 핏 정보 추출
-    evaluation_elems = soup.select("li.nm0BTjARAv")
+    evaluation_elems = soup.select(selectors('summary_evaluation'))
     for elem in evaluation_elems:
-        category_elem = elem.select_one("em._1ehAE1FZXP")
-        value_elem = elem.select_one("span._3TuFT_dyR9")
-        percent_elem = elem.select_one("span._1j8ap1C9-S")
+        category_elem = elem.select_one(selectors('summary_evaluation_category'))
+        value_elem = elem.select_one(selectors('summary_evaluation_value'))
+        percent_elem = elem.select_one(selectors('summary_evaluation_percent'))
         
         if category_elem and value_elem and percent_elem:
             category = category_elem.get_text().strip()
@@ -135,7 +225,7 @@ def parse_summary_info(html_source):
     
     # AI 리뷰요약 태그 추출
     review_tags = []
-    tag_elems = soup.select("ul._3nvipoK9DW li._2NAGswzFgY button._33Rpy54LBS")
+    tag_elems = soup.select(selectors('summary_review_tags'))
     for tag_elem in tag_elems:
         tag_text = tag_elem.get_text().strip()
         review_tags.append(tag_text)
@@ -145,118 +235,124 @@ def parse_summary_info(html_source):
         print(f"[DEBUG] 리뷰요약태그 추출: {review_tags}")
     
     # 생산방식 추출
-    custom_elem = soup.select_one("div._1eddO7u4UC em._1SHgFqYghw.gvkucAUfCS")
+    custom_elem = soup.select_one(selectors('summary_custom'))
     if custom_elem:
         summary_info['생산방식'] = custom_elem.get_text(strip=True)
     
     # 배송옵션 추출
-    nextday_elem = soup.select_one("div._1eddO7u4UC em._1SHgFqYghw._1NXyF7xfLC span.blind")
+    nextday_elem = soup.select_one(selectors('summary_nextday'))
     if nextday_elem:
         summary_info['배송옵션'] = nextday_elem.get_text(strip=True)
     
     # 할인정보 추출
-    discount_elem = soup.select_one("div.WrkQhIlUY0 span._1G-IvlyANt span.blind")
+    discount_elem = soup.select_one(selectors('summary_discount')) if not from_state('할인정보') else None
     if discount_elem:
         summary_info['할인정보'] = discount_elem.get_text(strip=True)
     
     # 할인전가격 추출
-    original_price_elem = soup.select_one("div._3my-5FC8OB del.Xdhdpm0BD9 span._1LY7DqCnwR")
+    original_price_elem = soup.select_one(selectors('summary_original_price')) if not from_state('할인전가격') else None
     if original_price_elem:
         summary_info['할인전가격'] = original_price_elem.get_text(strip=True)
     
     # 상품가격 추출
-    discounted_price_elem = soup.select_one("div._3my-5FC8OB strong.aICRqgP9zw._2oBq11Xp7s span._1LY7DqCnwR")
+    discounted_price_elem = soup.select_one(selectors('summary_price')) if not from_state('상품가격') else None
     if discounted_price_elem:
         summary_info['상품가격'] = discounted_price_elem.get_text(strip=True)
     
     # 배송정보 추출
-    shipping_elem = soup.select_one("div._3my-5FC8OB div._1bJwyyeSAa span._2LwlYHFpvU")
+    shipping_elem = soup.select_one(selectors('summary_shipping')) if not from_state('배송정보') else None
     if shipping_elem:
         summary_info['배송정보'] = shipping_elem.get_text(strip=True)
     
     return summary_info
 
-def crawl_detailed_product_info(driver, product_info=None):
+def crawl_detailed_product_info(driver, product_info=None, snapshots=None):
+    """
+    상세 정보 탭을 열고 스크롤한 뒤 상세 상품 정보를 수집합니다.
+    snapshots 목록이 주어지면 파싱한 문서를 추가합니다. (아카이브 저장용)
+    """
     if product_info is None:
         product_info = {}
     try:
-        detail_tab_selectors = [
-            'a[href="#INTRODUCE"]', 'a[href="#DETAIL"]', 'a:contains("상세정보")',
-            'a:contains("상품정보")', '//a[contains(text(), "상세정보")]',
-            '//a[contains(text(), "상품정보")]'
-        ]
-        detail_tab_clicked = False
-        for selector in detail_tab_selectors:
-            try:
-                if selector.startswith('a['):
-                    detail_tab = driver.find_element(By.CSS_SELECTOR, selector)
-                    if safe_click(driver, detail_tab):
-                        detail_tab_clicked = True
-                        print("[INFO] 상세 정보 탭 클릭 완료.")
-                        break
-                elif selector.startswith('//'):
-                    detail_tabs = driver.find_elements(By.XPATH, selector)
-                    if detail_tabs and safe_click(driver, detail_tabs[0]):
-                        detail_tab_clicked = True
-                        print("[INFO] 상세 정보 탭 클릭 완료 (XPath).")
-                        break
-                elif ':contains' in selector:
-                    text = selector.split('contains("')[1].split('")')[0]
-                    tabs = driver.find_elements(By.XPATH, f"//a[contains(text(), '{text}')]")
-                    for tab in tabs:
-                        if safe_click(driver, tab):
-                            detail_tab_clicked = True
-                            print(f"[INFO] 상세 정보 탭 클릭 완료 (텍스트: {text}).")
-                            break
-                    if detail_tab_clicked:
-                        break
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                print(f"[WARN] 상세 정보 탭 클릭 오류: {e}")
-        if not detail_tab_clicked:
+        detail_tab_selector = click_any(driver, patterns('detail_tab'), lambda tab: safe_click(driver, tab),
+                                        'detail_tab_probe', description="상세 정보 탭")
+        if detail_tab_selector is not None:
+            print(f"[INFO] 상세 정보 탭 클릭 완료. ({detail_tab_selector})")
+        else:
             print("[WARN] 상세 정보 탭을 찾거나 클릭하지 못함.")
-        time.sleep(2)
+        wait_network_idle(driver, fixed_delay=2, condition='detail_tab')
         driver.execute_script("window.scrollBy(0, 500);")
-        time.sleep(1)
+        wait_network_idle(driver, fixed_delay=1, condition='scroll_load')
         driver.execute_script("window.scrollBy(0, 500);")
-        time.sleep(1)
+        wait_network_idle(driver, fixed_delay=1, condition='scroll_load')
         
-        html_source = driver.page_source
-        summary_info = parse_summary_info(html_source)
-        from reviewcrawler.text_based_parser import parse_product_info_by_text
-        text_based_info = parse_product_info_by_text(html_source)
-        for key, value in text_based_info.items():
-            if key not in summary_info or not summary_info[key]:
-                summary_info[key] = value
-        table_info = parse_product_info_tables(html_source)
-        for key, value in table_info.items():
-            if key not in summary_info or not summary_info[key]:
-                summary_info[key] = value
-        soup = BeautifulSoup(html_source, 'html.parser')
-        detail_containers = [
-            '#INTRODUCE', '#DETAIL', 'div.detail_area', 'div[class*="detail_content"]',
-            'div[class*="product_detail"]', 'div[class*="goods_detail"]'
-        ]
-        for container_selector in detail_containers:
-            container = soup.select_one(container_selector)
-            if container:
-                text_blocks = container.select('div[class*="text"], p[class*="desc"], div[class*="description"]')
-                if text_blocks:
-                    combined_text = " ".join([block.get_text(strip=True) for block in text_blocks])
-                    summary_info['제품설명'] = combined_text
-                break
-        combined_info = summary_info
-        print("[DEBUG] 수집된 최종 상품 정보:")
-        for k, v in combined_info.items():
-            print(f"- {k}: {v}")
-        return combined_info
+        # 스크롤 이후의 스냅샷을 한 번만 파싱하여 모든 추출 함수가 공유
+        with timed('page_source'):
+            html_source = driver.page_source
+        document = get_document(html_source)
+        if snapshots is not None:
+            snapshots.append(document)
+        return parse_detailed_product_info(document)
     except Exception as e:
         print(f"[ERROR] 상세 상품 정보 수집 오류: {e}")
         import traceback
         traceback.print_exc()
         return product_info
 
+@timed_stage('extract')
+def parse_detailed_product_info(html_source):
+    """
+    상세 정보 탭 스냅샷에서 요약 정보, 상품정보 테이블, 제품설명을 추출합니다.
+    
+    Args:
+        html_source (str | ParsedDocument): HTML 소스 또는 파싱된 문서
+        
+    Returns:
+        dict: 병합된 상품 정보
+    """
+    document = get_document(html_source)
+    summary_info = parse_summary_info(document)
+    from reviewcrawler.text_based_parser import parse_product_info_by_text
+    text_based_info = parse_product_info_by_text(document)
+    for key, value in text_based_info.items():
+        if key not in summary_info or not summary_info[key]:
+            summary_info[key] = value
+    table_info = parse_product_info_tables(document)
+    for key, value in table_info.items():
+        if key not in summary_info or not summary_info[key]:
+            summary_info[key] = value
+    soup = document.soup
+    for container_selector in selectors('detail_container'):
+        container = soup.select_one(container_selector)
+        if container:
+            text_blocks = container.select(selectors('detail_text_blocks'))
+            if text_blocks:
+                combined_text = " ".join([block.get_text(strip=True) for block in text_blocks])
+                summary_info['제품설명'] = combined_text
+            break
+    combined_info = summary_info
+    print("[DEBUG] 수집된 최종 상품 정보:")
+    for k, v in combined_info.items():
+        print(f"- {k}: {v}")
+    return combined_info
+
+def parse_product_snapshots(product_html, detail_html, target_url):
+    """
+    저장된 스냅샷으로 crawl_product_info와 같은 순서의 추출을 재현합니다. (브라우저 없이 재파싱)
+    
+    Args:
+        product_html (str | ParsedDocument): 상품 페이지 첫 로딩 스냅샷
+        detail_html (str | ParsedDocument | None): 상세 정보 탭 스냅샷 (없으면 기본 정보만 사용)
+        target_url (str): 상품 페이지 URL
+        
+    Returns:
+        dict: 표준화된 상품 정보 (PRODUCT_CODE 제외)
+    """
+    product_info = parse_basic_product_info(product_html, target_url)
+    if detail_html is not None:
+        product_info = parse_detailed_product_info(detail_html)
+    return standardize_product_info(product_info)
+
 def save_product_info_to_csv(product_info, output_csv):
     order_keys = ['상품명', '할인전가격', '할인정보', '배송옵션', '배송정보']
     other_keys = [key for key in product_info.keys() if key not in order_keys]
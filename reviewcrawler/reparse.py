@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# reviewcrawler/reparse.py - HTML 아카이브에 저장된 스냅샷을 브라우저 없이 다시 파싱
+#
+# 사용법:
+#   python -m reviewcrawler.reparse --archive html_archive --url-file all_category_product_urls.csv
+#
+# 파서(선택자)를 수정한 뒤 크롤링 없이 product_info_all / review_all 결과를 다시 만듭니다.
+# 상품 하나(상품 페이지 + 상세 탭 + 리뷰 페이지들)를 작업 하나로 하여 CPU 코어 수만큼의 프로세스에서 처리합니다.
+
+import io
+import os
+import time
+import argparse
+import contextlib
+from multiprocessing import Pool
+
+import pandas as pd
+from tqdm import tqdm
+
+from common.html_parser import PARSER_BACKENDS, set_parser_backend, get_parser_backend
+from common.selector_registry import registry, load_selector_file
+from common.selector_stats import SELECTOR_ORDERS, get_selector_order, set_selector_order
+from common.endpoints import absolute_url
+from reviewcrawler.archive import SnapshotArchive, DEFAULT_ARCHIVE_DIR, KIND_PRODUCT, KIND_DETAIL, KIND_REVIEW
+from reviewcrawler.product_info import SUMMARY_SOURCES, parse_product_snapshots, get_summary_source, set_summary_source
+from reviewcrawler.review_crawler import extract_reviews, parse_product_title, build_review_dataframe
+from reviewcrawler.sinks import OUTPUT_FORMATS, DEFAULT_BATCH_SIZE, create_sink, stream_csv_to_excel
+
+DEPTH_COLUMNS = ['1st_depth', '2nd_depth', '3rd_depth', '4th_depth']
+
+# 워커 프로세스별 상태 (initializer에서 설정)
+_worker_archive = None
+_worker_verbose = False
+
+def normalize_url(url):
+    """크롤러와 같은 규칙으로 상대 경로 URL을 절대 경로로 바꿉니다."""
+    return absolute_url(url)
+
+def collect_tasks(archive, product_codes=None):
+    """
+    색인에서 상품별 재파싱 작업 목록을 만듭니다. (처음 수집된 순서 유지)
+
+    같은 상품이 여러 번 수집된 경우 가장 최근 스냅샷을 사용하며,
+    리뷰 페이지는 마지막 1페이지 수집 이후의 페이지만 사용합니다.
+
+    Returns:
+        list: product_code, url, product, detail, reviews(내용 해시 목록) 키를 가진 dict 목록
+    """
+    tasks = {}
+    for snapshot in archive.snapshots():
+        code = snapshot['product_code']
+        if not code or (product_codes and code not in product_codes):
+            continue
+        task = tasks.setdefault(code, {
+            'product_code': code, 'url': snapshot['url'], 'product': None, 'detail': None, 'reviews': []
+        })
+        if snapshot['kind'] == KIND_PRODUCT:
+            task['product'] = snapshot['content_hash']
+            task['url'] = snapshot['url']
+        elif snapshot['kind'] == KIND_DETAIL:
+            task['detail'] = snapshot['content_hash']
+        elif snapshot['kind'] == KIND_REVIEW:
+            if snapshot['page'] == 1:
+                # 새 리뷰 수집이 시작되면 이전 수집의 페이지는 버림
+                task['reviews'] = []
+            task['reviews'].append((snapshot['page'], snapshot['content_hash']))
+    for task in tasks.values():
+        task['reviews'] = [content_hash for _, content_hash in sorted(task['reviews'], key=lambda item: item[0])]
+    return list(tasks.values())
+
+def _init_worker(archive_root, parser_backend, selector_file, selector_order, summary_source, verbose):
+    """워커 프로세스마다 메인 프로세스의 파서 백엔드/선택자/요약 정보 설정을 적용하고 아카이브를 엽니다."""
+    global _worker_archive, _worker_verbose
+    with contextlib.redirect_stdout(io.StringIO()):
+        set_parser_backend(parser_backend)
+        if selector_file != registry.path:
+            load_selector_file(selector_file)
+        set_selector_order(selector_order)
+        set_summary_source(summary_source)
+    _worker_archive = SnapshotArchive(archive_root)
+    _worker_verbose = verbose
+
+def reparse_product(task, reviews_only=False, product_only=False):
+    """
+    상품 하나의 스냅샷을 다시 파싱합니다. (워커 프로세스에서 실행)
+
+    Returns:
+        tuple: (product_info, reviews_df, error) - 수집되지 않은 항목은 None
+    """
+    output = None if _worker_verbose else io.StringIO()
+    product_info = None
+    reviews_df = None
+    try:
+        with contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext():
+            url = normalize_url(task['url'])
+            if not reviews_only and task['product']:
+                detail_html = _worker_archive.get(task['detail']) if task['detail'] else None
+                product_info = parse_product_snapshots(_worker_archive.get(task['product']), detail_html, url)
+                product_info['PRODUCT_CODE'] = task['product_code']
+
+            if not product_only and task['reviews']:
+                review_rows = []
+                product_title = None
+                previous_hash = None
+                for content_hash in task['reviews']:
+                    # 크롤러와 같이 이전 페이지와 동일한 스냅샷이면 중단
+                    if content_hash == previous_hash:
+                        break
+                    previous_hash = content_hash
+                    html_source = _worker_archive.get(content_hash)
+                    if product_title is None:
+                        product_title = parse_product_title(html_source)
+                    review_rows.extend(extract_reviews(html_source))
+                if review_rows:
+                    reviews_df = build_review_dataframe(review_rows, product_title, task['product_code'])
+    except Exception as e:
+        return product_info, reviews_df, f"{type(e).__name__}: {e}"
+    return product_info, reviews_df, None
+
+def _reparse_star(args):
+    return reparse_product(*args)
+
+def load_depth_info(url_file):
+    """URL 파일에서 URL별 카테고리(depth) 정보를 읽습니다."""
+    if not url_file or not os.path.exists(url_file):
+        return {}
+    url_df = pd.read_csv(url_file)
+    if '제품_URL' not in url_df.columns:
+        print(f"[WARN] URL 파일에 '제품_URL' 컬럼이 없어 카테고리 정보를 사용하지 않습니다: {url_file}")
+        return {}
+    for col in DEPTH_COLUMNS:
+        if col not in url_df.columns:
+            url_df[col] = ''
+    url_df[DEPTH_COLUMNS] = url_df[DEPTH_COLUMNS].fillna('')
+    return {
+        normalize_url(row['제품_URL']): {col: row[col] for col in DEPTH_COLUMNS}
+        for row in url_df.to_dict('records')
+    }
+
+def run_reparse(archive_dir=DEFAULT_ARCHIVE_DIR, url_file=None, output_csv='review_all.csv',
+                product_output_csv='product_info_all.csv', reviews_only=False, product_only=False,
+                workers=None, output_format='csv', batch_size=DEFAULT_BATCH_SIZE, verbose=False):
+    """
+    아카이브의 모든 상품 스냅샷을 프로세스 풀에서 다시 파싱하여 결과 파일을 생성합니다.
+
+    Args:
+        archive_dir: HTML 아카이브 디렉터리
+        url_file: 카테고리(depth) 정보를 가져올 URL CSV 파일 (없으면 카테고리 컬럼 없음)
+        output_csv: 리뷰 결과 파일명
+        product_output_csv: 상품 정보 결과 파일명
+        reviews_only: 리뷰만 재파싱 여부
+        product_only: 상품 정보만 재파싱 여부
+        workers: 프로세스 수 (None이면 CPU 코어 수)
+        output_format: 결과 파일 형식 ('csv' 또는 'parquet')
+        batch_size: 결과 파일에 한 번에 기록할 행 수
+        verbose: 추출 함수의 디버그 출력 표시 여부
+
+    Returns:
+        tuple: (product_count, review_count) 결과 파일에 기록된 상품 정보와 리뷰 수
+    """
+    if not os.path.exists(os.path.join(archive_dir, 'index.db')):
+        print(f"[ERROR] HTML 아카이브를 찾을 수 없습니다: {archive_dir}")
+        return 0, 0
+
+    archive = SnapshotArchive(archive_dir)
+    try:
+        tasks = collect_tasks(archive)
+        print(f"[INFO] 아카이브 스냅샷: {archive.summary()}")
+    finally:
+        archive.close()
+    if not tasks:
+        print("[INFO] 재파싱할 상품이 없습니다.")
+        return 0, 0
+
+    depth_info = load_depth_info(url_file)
+    workers = max(1, int(workers or os.cpu_count() or 1))
+    print(f"[INFO] 상품 {len(tasks)}개를 프로세스 {workers}개로 재파싱합니다. (파서: {get_parser_backend()})")
+
+    product_sink = create_sink(product_output_csv, output_format, batch_size=batch_size) if not reviews_only else None
+    review_sink = create_sink(output_csv, output_format, batch_size=batch_size) if not product_only else None
+    failures = 0
+    start_time = time.time()
+
+    initargs = (archive_dir, get_parser_backend(), registry.path, get_selector_order(), get_summary_source(), verbose)
+    with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        results = pool.imap(_reparse_star, ((task, reviews_only, product_only) for task in tasks), chunksize=4)
+        try:
+            # 결과는 아카이브에 처음 수집된 순서대로 기록
+            for task, (product_info, reviews_df, error) in tqdm(zip(tasks, results), total=len(tasks), desc="재파싱 진행"):
+                if error:
+                    failures += 1
+                    print(f"[WARN] 재파싱 실패: {task['url']} ({task['product_code']}) - {error}")
+                depth = depth_info.get(normalize_url(task['url']), {})
+                if product_info and product_sink is not None:
+                    product_info.update(depth)
+                    product_sink.write(product_info)
+                if reviews_df is not None and review_sink is not None:
+                    for col, value in depth.items():
+                        reviews_df[col] = value
+                    review_sink.write(reviews_df)
+        finally:
+            for sink in (product_sink, review_sink):
+                if sink is not None:
+                    sink.close()
+
+    for sink, label in ((product_sink, '제품 정보'), (review_sink, '리뷰 정보')):
+        if sink is None or not sink.count:
+            continue
+        print(f"{label} 저장 완료: {sink.path} ({sink.count}개)")
+        if output_format == 'csv':
+            excel_path = sink.path.replace('.csv', '.xlsx')
+            stream_csv_to_excel(sink.path, excel_path)
+            print(f"Excel 파일 생성 완료: {excel_path}")
+
+    elapsed_time = time.time() - start_time
+    print(f"\n재파싱 완료: 상품 {len(tasks)}개, 실패 {failures}개, 소요 시간 {elapsed_time:.2f}초")
+    return (
+        product_sink.count if product_sink is not None else 0,
+        review_sink.count if review_sink is not None else 0,
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 아카이브 오프라인 재파싱')
+    parser.add_argument('--archive', type=str, default=DEFAULT_ARCHIVE_DIR, help=f'HTML 아카이브 디렉터리 (기본값: {DEFAULT_ARCHIVE_DIR})')
+    parser.add_argument('--url-file', type=str, default='all_category_product_urls.csv', help='카테고리(depth) 정보를 가져올 URL 목록 CSV 파일')
+    parser.add_argument('--output', type=str, default='review_all.csv', help='통합 리뷰 결과를 저장할 파일명')
+    parser.add_argument('--product-output', type=str, default='product_info_all.csv', help='통합 상품 정보를 저장할 파일명')
+    parser.add_argument('--reviews-only', action='store_true', help='리뷰만 재파싱합니다')
+    parser.add_argument('--product-only', action='store_true', help='상품 정보만 재파싱합니다')
+    parser.add_argument('--workers', type=int, default=None, help='재파싱 프로세스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default='html.parser', help='HTML 파서 백엔드 (기본값: html.parser)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help='결과 파일 형식: csv(+엑셀) / parquet (기본값: csv)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'결과 파일에 한 번에 기록할 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--summary-source', choices=SUMMARY_SOURCES, default='state', help='상품 요약 정보 추출 방식: state(페이지 상태 JSON 우선, 없는 필드만 CSS 선택자) / css(CSS 선택자만) (기본값: state)')
+    parser.add_argument('--selector-order', choices=SELECTOR_ORDERS, default='static', help='대체 선택자 시도 순서: static(선택자 파일 순서) / adaptive(기본 선택자가 계속 불일치하면 마지막으로 일치한 선택자 우선) (기본값: static)')
+    parser.add_argument('--selector-file', type=str, default=None, help='선택자 그룹 데이터 파일 (기본값: 환경 변수 CRAWLER_SELECTOR_FILE 또는 common/selectors.json)')
+    parser.add_argument('--verbose', action='store_true', help='추출 함수의 디버그 출력 표시')
+    args = parser.parse_args()
+
+    set_parser_backend(args.parser)
+    set_summary_source(args.summary_source)
+    if args.selector_file:
+        load_selector_file(args.selector_file)
+    set_selector_order(args.selector_order)
+    run_reparse(
+        archive_dir=args.archive,
+        url_file=args.url_file,
+        output_csv=args.output,
+        product_output_csv=args.product_output,
+        reviews_only=args.reviews_only,
+        product_only=args.product_only,
+        workers=args.workers,
+        output_format=args.format,
+        batch_size=args.batch_size,
+        verbose=args.verbose
+    )
+
+if __name__ == "__main__":
+    main()
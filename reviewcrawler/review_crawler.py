@@ -1,20 +1,318 @@
 # reviewcrawler/review_crawler.py
 import re
-import time
+import json
 import pandas as pd
-from bs4 import BeautifulSoup
 from datetime import datetime
 import os
 
 # Selenium 관련
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
+from selenium.common.exceptions import ElementNotInteractableException, TimeoutException
 
 # 유틸리티 함수 가져오기
 from reviewcrawler.utils import safe_click, setup_driver
+from reviewcrawler.document import get_document
+from reviewcrawler.archive import archive_snapshot, get_archive, KIND_REVIEW
+from reviewcrawler.review_script import extract_reviews_in_page
+from reviewcrawler.parse_pipeline import ReviewParsePipeline, is_parse_pool_enabled
+from common.waits import wait_for, wait_page_loaded, wait_network_idle, get_signature, wait_for_change, wait_for_element
+from common.driver_factory import note_page_load
+from common.timing import timed, timed_stage
+from common.endpoints import absolute_url
+from common.locators import click_any, no_implicit_wait
+from common.selector_stats import first_match, selector_stats
+from common.selector_registry import selectors, patterns, selector_key
 
-def crawl_product_reviews(target_url, driver=None, max_pages=None, output_csv=None, return_df=False, append_mode=False, product_code=None):
+# 리뷰 페이지 추출 방식
+# - html: page_source 전체를 가져와 파싱 (기본값, 아카이브 재파싱과 같은 경로)
+# - script: 페이지 안 스크립트 한 번으로 리뷰 항목별 필드 텍스트만 JSON으로 가져옴
+REVIEW_EXTRACTORS = ('html', 'script')
+
+_review_extractor = os.environ.get('CRAWLER_REVIEW_EXTRACTOR', 'html')
+
+# 리뷰 결과 컬럼 순서
+REVIEW_COLUMNS = [
+    'PRODUCT_CODE', 'PRODUCT_TITLE', 'RD_WRITE_DT', 'RD_RATING', 'RD_ITEM_NM', 'RD_CONTENT',
+    'RD_OPTION_SIZE', 'RD_OPTION_COLOR', 'RD_REVIEWER_INFO', 'RD_REVIEW_IMAGES'
+]
+
+# 리뷰 항목 안 필드 (선택자 그룹 이름은 'review_' + 필드, common/selectors.json)
+# 그룹마다 앞에서부터 시도하며, HTML 파싱과 페이지 내 스크립트 추출이 같은 선택자 목록을 사용합니다.
+REVIEW_FIELDS = ('date', 'rating', 'option', 'option_dl', 'content', 'reviewer', 'image')
+
+def review_field_patterns():
+    """페이지 내 스크립트 추출에 넘길 필드별 선택자 문자열"""
+    return {field: patterns('review_' + field) for field in REVIEW_FIELDS}
+
+def find_review_elements(soup):
+    """
+    리뷰 페이지 트리에서 리뷰 항목 요소들을 찾습니다.
+    
+    Returns:
+        tuple: (리뷰 요소 리스트, 사용된 선택자)
+    """
+    def find(selector):
+        reviews = soup.select(selector)
+        return (reviews, selector_key(selector)) if reviews else None
+    return first_match('review_item', selectors('review_item'), find) or ([], None)
+
+def parse_write_date(date_text):
+    """작성일 텍스트(yy.mm.dd. / yyyy.mm.dd / yyyy-mm-dd)를 YYYYMMDD로 바꿉니다. (형식이 다르면 None)"""
+    try:
+        date_text = date_text.strip()
+        if re.match(r'\d{2}\.\d{2}\.\d{2}', date_text) or re.match(r'\d{2}\.\d{2}\.\d{2}\.', date_text):
+            date_text = date_text.rstrip('.')
+            return datetime.strptime(date_text, '%y.%m.%d').strftime('%Y%m%d')
+        elif re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
+            return date_text.replace('.', '')
+        elif re.match(r'\d{4}-\d{2}-\d{2}', date_text):
+            return date_text.replace('-', '')
+    except (ValueError, IndexError):
+        pass
+    return None
+
+def parse_item_option(item_text, dl_text, option_pairs):
+    """
+    옵션 영역 텍스트와 옵션 목록(dt/dd 쌍)에서 상품명, 사이즈, 색상을 구합니다.
+
+    Args:
+        item_text (str): 옵션 영역 전체 텍스트 ('제품 선택: 상품명' + 옵션 목록)
+        dl_text (str): 옵션 목록(dl) 텍스트 (없으면 "")
+        option_pairs (list): [(옵션명, 값)] 목록
+
+    Returns:
+        tuple: (item_nm, option_size, option_color)
+    """
+    options_dict = {}
+    for option_name, option_value in option_pairs:
+        options_dict[option_name.strip().replace(':', '')] = option_value.strip()
+    option_size = ""
+    option_color = ""
+    for key in ['사이즈', 'size', 'SIZE', '크기']:
+        if key in options_dict:
+            option_size = options_dict[key]
+            break
+    for key in ['색상', '컬러', 'color', 'COLOR']:
+        if key in options_dict:
+            option_color = options_dict[key]
+            break
+    item_nm_info = re.sub(dl_text, '', item_text)
+    str_start_idx = item_nm_info.find('제품 선택: ')
+    if str_start_idx != -1:
+        item_nm = item_nm_info[str_start_idx + 6:].strip()
+    else:
+        item_nm = item_nm_info.strip()
+    return item_nm, option_size, option_color
+
+def clean_review_content(content_raw):
+    return re.sub(' +', ' ', re.sub('\n', ' ', content_raw)).strip()
+
+def build_review_row(write_dt, rating, item_nm, review_content, option_size, option_color, reviewer_info, review_images):
+    """RD_* 컬럼 딕셔너리 (내용과 평점이 모두 없으면 None)"""
+    if review_content or rating:
+        return {
+            'RD_WRITE_DT': write_dt,
+            'RD_RATING': rating,
+            'RD_ITEM_NM': item_nm,
+            'RD_CONTENT': review_content,
+            'RD_OPTION_SIZE': option_size,
+            'RD_OPTION_COLOR': option_color,
+            'RD_REVIEWER_INFO': reviewer_info,
+            'RD_REVIEW_IMAGES': "|".join(review_images) if review_images else ""
+        }
+    return None
+
+def _first_text(r, selector):
+    """selector의 첫 번째 요소의 공백 제거 텍스트 (요소가 없거나 텍스트가 비었으면 None)"""
+    elements = r.select(selector)
+    if elements:
+        text = elements[0].get_text().strip()
+        if text:
+            return text
+    return None
+
+def _review_date(r, selector):
+    elements = r.select(selector)
+    return parse_write_date(elements[0].get_text()) if elements else None
+
+def _review_option(r, selector):
+    option_elements = r.select(selector)
+    if not option_elements:
+        return None
+    try:
+        item_div = option_elements[0]
+        dl_tag = first_match('review_option_dl', selectors('review_option_dl'),
+                             lambda dl_selector: (item_div.select(dl_selector) or [None])[0])
+        if dl_tag:
+            option_pairs = list(zip(
+                [dt.get_text() for dt in dl_tag.find_all('dt')],
+                [dd.get_text() for dd in dl_tag.find_all('dd')]
+            ))
+            dl_text = dl_tag.get_text()
+        else:
+            option_pairs, dl_text = [], ""
+        return parse_item_option(item_div.get_text(), dl_text, option_pairs)
+    except (IndexError, AttributeError):
+        return None
+
+def _review_content(r, selector):
+    content_elements = r.select(selector)
+    if content_elements:
+        return clean_review_content(content_elements[0].get_text()) or None
+    return None
+
+def _review_images(r, selector):
+    review_images = [img['src'] for img in r.select(selector) if 'src' in img.attrs]
+    return review_images or None
+
+def parse_review_element(r):
+    """
+    리뷰 항목 요소 하나에서 작성일, 평점, 옵션, 내용, 작성자, 이미지를 추출합니다.
+    필드마다 대체 선택자는 selector_stats의 시도 순서(--selector-order)를 따릅니다.
+    
+    Returns:
+        dict: RD_* 컬럼 딕셔너리 (내용과 평점이 모두 없으면 None)
+    """
+    write_dt = first_match('review_date', selectors('review_date'), lambda selector: _review_date(r, selector)) or ""
+    rating = first_match('review_rating', selectors('review_rating'), lambda selector: _first_text(r, selector)) or ""
+    item_nm, option_size, option_color = first_match(
+        'review_option', selectors('review_option'), lambda selector: _review_option(r, selector)
+    ) or ("", "", "")
+    review_content = first_match('review_content', selectors('review_content'), lambda selector: _review_content(r, selector)) or ""
+    reviewer_info = first_match('review_reviewer', selectors('review_reviewer'), lambda selector: _first_text(r, selector)) or ""
+    review_images = first_match('review_image', selectors('review_image'), lambda selector: _review_images(r, selector)) or []
+    return build_review_row(write_dt, rating, item_nm, review_content, option_size, option_color, reviewer_info, review_images)
+
+def parse_review_record(record):
+    """
+    페이지 내 스크립트(review_script.REVIEW_EXTRACT_SCRIPT)가 반환한 리뷰 항목 하나를
+    parse_review_element와 같은 규칙으로 RD_* 컬럼 딕셔너리로 바꿉니다.
+
+    record의 각 필드는 선택자별 첫 번째 요소의 텍스트 목록(선택자 순서)입니다.
+    """
+    write_dt = ""
+    for date_text in record.get('dates', []):
+        parsed = parse_write_date(date_text)
+        if parsed is not None:
+            write_dt = parsed
+            break
+    rating = ""
+    for rating_text in record.get('ratings', []):
+        rating = rating_text.strip()
+        if rating:
+            break
+    item_nm, option_size, option_color = "", "", ""
+    option = record.get('option')
+    if option:
+        item_nm, option_size, option_color = parse_item_option(option['text'], option.get('dl_text') or "", option.get('pairs') or [])
+    review_content = ""
+    for content_text in record.get('contents', []):
+        review_content = clean_review_content(content_text)
+        if review_content:
+            break
+    reviewer_info = ""
+    for reviewer_text in record.get('reviewers', []):
+        reviewer_info = reviewer_text.strip()
+        if reviewer_info:
+            break
+    return build_review_row(write_dt, rating, item_nm, review_content, option_size, option_color, reviewer_info, record.get('images') or [])
+
+@timed_stage('extract')
+def extract_reviews(html_source):
+    """
+    리뷰 페이지 스냅샷 하나에서 리뷰 목록을 추출합니다.
+    
+    Args:
+        html_source (str | ParsedDocument): HTML 소스 또는 파싱된 문서
+        
+    Returns:
+        list: 리뷰 딕셔너리 리스트
+    """
+    soup = get_document(html_source).soup
+    reviews, _ = find_review_elements(soup)
+    review_rows = []
+    for r in reviews:
+        row = parse_review_element(r)
+        if row:
+            review_rows.append(row)
+    return review_rows
+
+@timed_stage('extract')
+def parse_product_title(html_source):
+    """상품 페이지 스냅샷에서 리뷰 결과에 기록할 상품 제목을 추출합니다."""
+    soup = get_document(html_source).soup
+    title_tag = soup.select_one(selectors('review_product_title'))
+    if title_tag:
+        return title_tag.get_text(strip=True)
+    return "Unknown Product"
+
+def build_review_dataframe(review_rows, product_title, product_code):
+    """
+    수집한 리뷰 목록을 결과 컬럼 순서의 DataFrame으로 만들고 중복(작성일 + 내용)을 제거합니다.
+    """
+    result_df = pd.DataFrame(review_rows, columns=REVIEW_COLUMNS[2:])
+    result_df.insert(0, 'PRODUCT_TITLE', product_title)
+    result_df.insert(0, 'PRODUCT_CODE', product_code)
+    if len(result_df) > 0:
+        result_df = result_df.drop_duplicates(subset=['RD_WRITE_DT', 'RD_CONTENT'], keep='first')
+    return result_df
+
+def set_review_extractor(mode):
+    """리뷰 페이지 추출 방식(html/script)을 설정합니다."""
+    global _review_extractor
+    if mode not in REVIEW_EXTRACTORS:
+        raise ValueError(f"지원하지 않는 리뷰 추출 방식입니다: {mode} (사용 가능: {', '.join(REVIEW_EXTRACTORS)})")
+    _review_extractor = mode
+    print(f"[INFO] 리뷰 추출 방식: {mode}")
+
+def get_review_extractor():
+    return _review_extractor
+
+def read_review_page(driver, product_code, target_url, page_num):
+    """
+    현재 리뷰 페이지에서 리뷰를 추출합니다.
+    html 방식은 page_source 전체를 파싱하고, script 방식은 페이지 안에서 리뷰 영역의 필드 텍스트만 가져옵니다.
+    (script 방식에서도 아카이브가 설정되어 있으면 재파싱용으로 page_source를 저장)
+
+    Returns:
+        tuple: (페이지 비교용 값, 찾은 리뷰 항목 수, 사용된 선택자, 리뷰 행 목록, 총 리뷰 수 텍스트)
+    """
+    if _review_extractor == 'script':
+        if get_archive() is not None:
+            with timed('page_source'):
+                archive_snapshot(driver.page_source, product_code, target_url, KIND_REVIEW, page=page_num)
+        item_selectors = selector_stats.order('review_item', patterns('review_item'))
+        page = extract_reviews_in_page(driver, item_selectors, review_field_patterns(), patterns('review_total'))
+        records = page['records']
+        tried = item_selectors[:item_selectors.index(page['selector']) + 1] if page['selector'] else item_selectors
+        selector_stats.record('review_item', patterns('review_item'), tried, page['selector'])
+        with timed('extract'):
+            page_rows = [row for row in map(parse_review_record, records) if row]
+        return json.dumps(records, sort_keys=True), len(records), page['selector'], page_rows, page['total_text']
+
+    with timed('page_source'):
+        html_source = driver.page_source
+    document = get_document(html_source)
+    archive_snapshot(document, product_code, target_url, KIND_REVIEW, page=page_num)
+    return (html_source,) + extract_review_page(document)
+
+def extract_review_page(source):
+    """
+    리뷰 페이지 HTML(또는 ParsedDocument)에서 리뷰 행과 총 리뷰 수 텍스트를 추출합니다.
+    (백그라운드 파싱 프로세스에서도 이 함수를 호출, reviewcrawler.parse_pipeline)
+
+    Returns:
+        tuple: (찾은 리뷰 항목 수, 사용된 선택자, 리뷰 행 목록, 총 리뷰 수 텍스트)
+    """
+    soup = get_document(source).soup
+    with timed('extract'):
+        reviews, selector = find_review_elements(soup)
+        page_rows = [row for row in map(parse_review_element, reviews) if row]
+        total_tag = soup.select_one(selectors('review_total'))
+    return len(reviews), selector, page_rows, total_tag.get_text() if total_tag else None
+
+def crawl_product_reviews(target_url, driver=None, max_pages=None, output_csv=None, return_df=False, append_mode=False, product_code=None, watermark=None):
     """
     스마트스토어 상품의 리뷰 데이터 수집
     
@@ -26,12 +324,15 @@ def crawl_product_reviews(target_url, driver=None, max_pages=None, output_csv=No
         return_df (bool, optional): 데이터프레임 반환 여부
         append_mode (bool, optional): 기존 CSV에 결과 추가 여부
         product_code (str, optional): 미리 생성된 상품 코드. 없으면 새로 생성.
+        watermark (ReviewWatermark, optional): 이전 실행의 리뷰 기준점.
+            지정하면 이미 수집한 리뷰는 제외하고, 최신순 정렬 상태에서
+            이미 수집한 리뷰만 있는 페이지를 만나면 수집을 중단합니다.
         
     Returns:
         DataFrame: 리뷰 데이터프레임(옵션에 따라 반환)
     """
     if target_url.startswith('/'):
-        target_url = 'https://brand.naver.com' + target_url
+        target_url = absolute_url(target_url)
     
     close_driver_after = False
     if driver is None:
@@ -39,16 +340,14 @@ def crawl_product_reviews(target_url, driver=None, max_pages=None, output_csv=No
         close_driver_after = True
     
     try:
-        driver.get(target_url)
-        time.sleep(3)
+        with timed('driver_get'):
+            driver.get(target_url)
+        note_page_load(driver)
+        wait_page_loaded(driver, fixed_delay=3)
 
-        html_source = driver.page_source
-        soup = BeautifulSoup(html_source, 'html.parser')
-        title_tag = soup.find('h3', {'class': '_22kNQuEXmb _copyable'})
-        if title_tag:
-            product_title = title_tag.get_text(strip=True)
-        else:
-            product_title = "Unknown Product"
+        with timed('page_source'):
+            html_source = driver.page_source
+        product_title = parse_product_title(html_source)
         print(f"[INFO] 상품 제목: {product_title}")
 
         # 상품 코드 재생성 없이 전달된 값 사용 (없다면 생성)
@@ -57,390 +356,187 @@ def crawl_product_reviews(target_url, driver=None, max_pages=None, output_csv=No
             product_code = generate_product_code({'상품URL': target_url, '상품명': product_title})
         
         # 리뷰 탭 클릭 시도
-        review_tab_selectors = [
-            '#content > div > div.z7cS6-TO7X > div._27jmWaPaKy > ul > li:nth-child(2) > a',
-            '#content > div > div._2-I30XS1lA > div._25tOXGEYJK > ul > li:nth-child(2) > a',
-            'a[href="#REVIEW"]',
-            'a[aria-selected="true"]',
-            'li a:contains("리뷰")'
-        ]
-        review_tab_clicked = False
-        for selector in review_tab_selectors:
-            try:
-                if selector.startswith('#') or selector.startswith('a['):
-                    review_tab = driver.find_element(By.CSS_SELECTOR, selector)
-                    if safe_click(driver, review_tab):
-                        review_tab_clicked = True
-                        print("[INFO] 리뷰 탭 클릭 완료.")
-                        break
-                elif 'contains' in selector:
-                    review_elements = driver.find_elements(By.XPATH, "//a[contains(text(), '리뷰')]")
-                    if review_elements:
-                        if safe_click(driver, review_elements[0]):
-                            review_tab_clicked = True
-                            print("[INFO] 리뷰 탭 클릭 완료 (텍스트 검색).")
-                            break
-            except NoSuchElementException:
-                continue
-        
-        if not review_tab_clicked:
+        # 후보를 하나씩 find_element로 찾지 않고 암묵적 대기 없이 한 번에 검사 (common.locators)
+        review_tab_selector = click_any(driver, patterns('review_tab'), lambda tab: safe_click(driver, tab),
+                                        'review_tab_probe', description="리뷰 탭")
+        if review_tab_selector is not None:
+            print(f"[INFO] 리뷰 탭 클릭 완료. ({review_tab_selector})")
+        else:
             print("[WARN] 리뷰 탭을 찾지 못하거나 클릭할 수 없습니다. 이미 리뷰 페이지일 가능성이 있음.")
             if "REVIEW" not in driver.page_source and "리뷰" not in driver.page_source:
                 print("[ERROR] 리뷰 섹션을 찾을 수 없음.")
                 return pd.DataFrame() if return_df else None
         
-        time.sleep(3)
+        wait_network_idle(driver, fixed_delay=3, condition='review_tab')
+        review_state = get_signature(driver, patterns('review_state'))
 
         # 최신순 버튼 클릭 시도
-        latest_selectors = [
-            '#REVIEW > div > div._2LvIMaBiIO > div._2LAwVxx1Sd > div._1txuie7UTH > ul > li:nth-child(2) > a',
-            'a.filter_sort:contains("최신순")',
-            '//a[contains(text(), "최신순")]',
-            'a[aria-selected="false"]'
-        ]
-        latest_clicked = False
-        for selector in latest_selectors:
-            try:
-                if selector.startswith('#'):
-                    latest_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                    if safe_click(driver, latest_btn, use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료.")
-                        break
-                elif selector.startswith('//'):
-                    latest_btns = driver.find_elements(By.XPATH, selector)
-                    if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료 (XPath).")
-                        break
-                elif 'contains' in selector:
-                    latest_btns = driver.find_elements(By.XPATH, "//a[contains(text(), '최신순')]")
-                    if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료 (텍스트 검색).")
-                        break
-                elif selector.startswith('a[aria'):
-                    filter_btns = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in filter_btns:
-                        if '최신' in btn.text:
-                            if safe_click(driver, btn, use_js=True):
-                                latest_clicked = True
-                                print("[INFO] 최신순 버튼 클릭 완료 (aria 속성).")
-                                break
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                print(f"[WARN] 최신순 버튼 클릭 시도 중 오류: {e}")
-        if not latest_clicked:
+        latest_selector = click_any(driver, patterns('review_sort_latest'), lambda btn: safe_click(driver, btn, use_js=True),
+                                    'sort_probe', description="최신순 버튼")
+        latest_clicked = latest_selector is not None
+        if latest_clicked:
+            print(f"[INFO] 최신순 버튼 클릭 완료. ({latest_selector})")
+            wait_for_change(driver, patterns('review_state'), review_state, 'review_list', fixed_delay=3)
+        else:
             print("[WARN] 최신순 버튼 클릭 실패. 기본 정렬로 진행.")
-        time.sleep(3)
+            wait_for_element(driver, patterns('review_state'), 'review_list', fixed_delay=3)
 
         # 리뷰 데이터 수집 리스트 초기화
-        write_dt_lst = []
-        rating_lst = []
-        item_nm_lst = []
-        content_lst = []
-        option_size_lst = []
-        option_color_lst = []
-        reviewer_info_lst = []
-        review_imgs_lst = []
+        review_rows = []
 
         page_num = 1
         consecutive_empty_pages = 0
         max_consecutive_empty = 2
-        previous_page_html = ""
-        
-        while True:
-            print(f"[INFO] {page_num} 페이지 수집 중...")
-            html_source = driver.page_source
-            if html_source == previous_page_html:
-                print("[INFO] 이전 페이지와 동일한 내용. 새 페이지 없으므로 종료.")
-                break
-            previous_page_html = html_source
-            soup = BeautifulSoup(html_source, 'html.parser')
-            time.sleep(0.5)
-
-            review_selectors = [
-                'li.BnwL_cs1av',
-                'li[class*="review_"]',
-                'div[class*="review_item"]',
-                'div._1MMhUGHnc_',
-                '.reviewItems_review_item'
-            ]
-            reviews = []
-            for selector in review_selectors:
-                reviews = soup.select(selector)
-                if reviews:
-                    print(f"[INFO] 리뷰 {len(reviews)}개 찾음. (선택자: {selector})")
-                    break
-            if not reviews:
-                print("[INFO] 리뷰를 찾지 못함.")
+        previous_page_key = None
+
+        def consume(page_num, reviews_found, selector, page_rows, total_reviews_text):
+            """페이지 추출 결과를 반영하고 수집을 끝낼지 반환합니다."""
+            nonlocal consecutive_empty_pages
+            if not reviews_found:
+                print(f"[INFO] {page_num} 페이지: 리뷰를 찾지 못함.")
                 consecutive_empty_pages += 1
                 if consecutive_empty_pages >= max_consecutive_empty:
                     print(f"[INFO] {max_consecutive_empty}페이지 연속 빈 결과로 종료.")
-                    break
+                    return True
             else:
+                print(f"[INFO] {page_num} 페이지: 리뷰 {reviews_found}개 찾음. (선택자: {selector})")
                 consecutive_empty_pages = 0
 
-            for r in reviews:
-                write_dt = ""
-                date_selectors = [
-                    'span._2L3vDiadT9',
-                    'span[class*="date"]',
-                    'div[class*="date"]',
-                    'span[class*="time"]',
-                    'em[class*="date"]'
-                ]
-                for selector in date_selectors:
-                    date_elements = r.select(selector)
-                    if date_elements:
-                        try:
-                            date_text = date_elements[0].get_text().strip()
-                            if re.match(r'\d{2}\.\d{2}\.\d{2}', date_text) or re.match(r'\d{2}\.\d{2}\.\d{2}\.', date_text):
-                                date_text = date_text.rstrip('.')
-                                write_dt = datetime.strptime(date_text, '%y.%m.%d').strftime('%Y%m%d')
-                                break
-                            elif re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                                write_dt = date_text.replace('.', '')
-                                break
-                            elif re.match(r'\d{4}-\d{2}-\d{2}', date_text):
-                                write_dt = date_text.replace('-', '')
-                                break
-                        except (ValueError, IndexError):
-                            continue
-                rating = ""
-                rating_selectors = [
-                    'em._15NU42F3kT',
-                    'em[class*="rating"]',
-                    'span[class*="rating"]',
-                    'div[class*="star"] em',
-                    'em[class*="score"]'
-                ]
-                for selector in rating_selectors:
-                    rating_elements = r.select(selector)
-                    if rating_elements:
-                        rating = rating_elements[0].get_text().strip()
-                        if rating:
-                            break
-                option_size = ""
-                option_color = ""
-                item_nm = ""
-                option_selectors = [
-                    'div._2FXNMst_ak',
-                    'div[class*="option"]',
-                    'div[class*="product_info"]',
-                    'dl[class*="option"]',
-                    'p[class*="option"]'
-                ]
-                for selector in option_selectors:
-                    option_elements = r.select(selector)
-                    if option_elements:
-                        try:
-                            item_div = option_elements[0]
-                            item_nm_info_raw = item_div.get_text()
-                            dl_tag = None
-                            dl_selectors = ['dl.XbGQRlzveO', 'dl[class*="option"]', 'dl']
-                            for dl_selector in dl_selectors:
-                                dl_candidates = item_div.select(dl_selector)
-                                if dl_candidates:
-                                    dl_tag = dl_candidates[0]
-                                    break
-                            if dl_tag:
-                                dt_tags = dl_tag.find_all('dt')
-                                dd_tags = dl_tag.find_all('dd')
-                                options_dict = {}
-                                for i in range(min(len(dt_tags), len(dd_tags))):
-                                    option_name = dt_tags[i].get_text().strip().replace(':', '')
-                                    option_value = dd_tags[i].get_text().strip()
-                                    options_dict[option_name] = option_value
-                                for key in ['사이즈', 'size', 'SIZE', '크기']:
-                                    if key in options_dict:
-                                        option_size = options_dict[key]
-                                        break
-                                for key in ['색상', '컬러', 'color', 'COLOR']:
-                                    if key in options_dict:
-                                        option_color = options_dict[key]
-                                        break
-                                item_nm_info_for_del = dl_tag.get_text()
-                            else:
-                                item_nm_info_for_del = ""
-                            item_nm_info = re.sub(item_nm_info_for_del, '', item_nm_info_raw)
-                            str_start_idx = item_nm_info.find('제품 선택: ')
-                            if str_start_idx != -1:
-                                item_nm = item_nm_info[str_start_idx + 6:].strip()
-                            else:
-                                item_nm = item_nm_info.strip()
-                            break
-                        except (IndexError, AttributeError):
-                            continue
-                review_content = ""
-                content_selectors = [
-                    'div._1kMfD5ErZ6 span._2L3vDiadT9',
-                    'div[class*="content"]',
-                    'p[class*="content"]',
-                    'span[class*="content"]'
-                ]
-                for selector in content_selectors:
-                    content_elements = r.select(selector)
-                    if content_elements:
-                        try:
-                            content_raw = content_elements[0].get_text()
-                            review_content = re.sub(' +', ' ', re.sub('\n', ' ', content_raw)).strip()
-                            if review_content:
-                                break
-                        except (AttributeError, IndexError):
-                            continue
-                reviewer_info = ""
-                reviewer_selectors = [
-                    'div._1_XCKE2RrJ',
-                    'div[class*="profile"]',
-                    'span[class*="profile"]',
-                    'div[class*="user_info"]'
-                ]
-                for selector in reviewer_selectors:
-                    reviewer_elements = r.select(selector)
-                    if reviewer_elements:
-                        try:
-                            reviewer_info = reviewer_elements[0].get_text().strip()
-                            if reviewer_info:
-                                break
-                        except (AttributeError, IndexError):
-                            continue
-                review_images = []
-                image_selectors = [
-                    'div._2389dRohZq img',
-                    'div[class*="img"] img',
-                    'a[class*="img"] img',
-                    'ul[class*="img"] img'
-                ]
-                for selector in image_selectors:
-                    image_elements = r.select(selector)
-                    if image_elements:
-                        for img in image_elements:
-                            if 'src' in img.attrs:
-                                review_images.append(img['src'])
-                        if review_images:
-                            break
-                if review_content or rating:
-                    write_dt_lst.append(write_dt)
-                    rating_lst.append(rating)
-                    item_nm_lst.append(item_nm)
-                    content_lst.append(review_content)
-                    option_size_lst.append(option_size)
-                    option_color_lst.append(option_color)
-                    reviewer_info_lst.append(reviewer_info)
-                    review_imgs_lst.append("|".join(review_images) if review_images else "")
-            
-            if max_pages and page_num >= max_pages:
-                print(f"[INFO] 최대 페이지 수({max_pages}) 도달. 종료.")
-                break
-            
-            total_reviews_text = soup.select_one('span[class*="review_count"], span[class*="review_total"]')
+            if watermark is not None:
+                # 증분 수집: 이미 수집한 리뷰 제외
+                new_rows = [row for row in page_rows if not watermark.is_seen(row)]
+                review_rows.extend(new_rows)
+                print(f"[INFO] 새 리뷰 {len(new_rows)}개 / 페이지 리뷰 {len(page_rows)}개")
+                if page_rows and not new_rows:
+                    if latest_clicked:
+                        print("[INFO] 이미 수집한 리뷰만 있는 페이지. 증분 수집 종료.")
+                        return True
+                    # 최신순 정렬이 아니면 뒤 페이지에 새 리뷰가 있을 수 있어 계속 진행
+            else:
+                review_rows.extend(page_rows)
+
             if total_reviews_text:
                 try:
-                    total_reviews_text = total_reviews_text.get_text().strip()
+                    total_reviews_text = total_reviews_text.strip()
                     total_reviews = re.search(r'\d+', total_reviews_text)
                     if total_reviews:
                         total_reviews = int(total_reviews.group())
-                        current_reviews = len(write_dt_lst)
+                        current_reviews = len(review_rows)
                         print(f"[INFO] 총 리뷰 {total_reviews}개 중 {current_reviews}개 수집 (진행률: {current_reviews/total_reviews*100:.1f}%)")
                         if current_reviews >= total_reviews:
                             print("[INFO] 모든 리뷰 수집 완료. 종료.")
-                            break
+                            return True
                 except Exception as e:
                     print(f"[WARN] 리뷰 개수 확인 오류: {e}")
+            return False
+
+        # 백그라운드 파싱: 페이지 HTML만 가져와 파싱 프로세스로 보내고 바로 다음 페이지로 이동
+        # (결과는 페이지 순서대로 반영, 종료 조건이 늦게 확인되는 만큼 최대 depth 페이지를 더 이동할 수 있음)
+        pipeline = ReviewParsePipeline() if is_parse_pool_enabled() and _review_extractor == 'html' else None
+        stopped = False
+        
+        while True:
+            print(f"[INFO] {page_num} 페이지 수집 중...")
+            if pipeline is not None:
+                with timed('page_source'):
+                    page_key = driver.page_source
+            else:
+                page_key, reviews_found, selector, page_rows, total_reviews_text = read_review_page(
+                    driver, product_code, target_url, page_num
+                )
+            if page_key == previous_page_key:
+                print("[INFO] 이전 페이지와 동일한 내용. 새 페이지 없으므로 종료.")
+                break
+            previous_page_key = page_key
+            if page_num > 1:
+                note_page_load(driver)  # 리뷰 페이지 이동도 렌더러 메모리를 늘리므로 페이지로 집계
+            wait_for(driver, 'page_settle', 0.5)
+
+            if pipeline is not None:
+                archive_snapshot(page_key, product_code, target_url, KIND_REVIEW, page=page_num)
+                for ready_page, result in pipeline.submit(page_num, page_key):
+                    if consume(ready_page, *result):
+                        stopped = True
+                        break
+                if stopped:
+                    pipeline.cancel()
+                    break
+            elif consume(page_num, reviews_found, selector, page_rows, total_reviews_text):
+                break
             
-            next_page_found = False
-            try:
-                next_page_number = page_num + 1
-                next_page_xpath = f"//a[contains(text(), '{next_page_number}')]"
-                next_page_elements = driver.find_elements(By.XPATH, next_page_xpath)
-                for element in next_page_elements:
-                    if element.text.strip() == str(next_page_number):
-                        if safe_click(driver, element, use_js=True):
-                            next_page_found = True
-                            break
-            except Exception as e:
-                print(f"[WARN] 숫자 페이지네이션 오류: {e}")
+            if max_pages and page_num >= max_pages:
+                print(f"[INFO] 최대 페이지 수({max_pages}) 도달. 종료.")
+                break
             
-            if not next_page_found:
+            review_state = get_signature(driver, patterns('review_state'))
+            # 후보 XPath/선택자가 없을 때마다 암묵적 대기만큼 멈추지 않도록 끈 상태로 찾음
+            with no_implicit_wait(driver):
+                next_page_found = False
                 try:
-                    next_button_xpaths = [
-                        "//a[contains(text(), '다음')]",
-                        "//a[contains(text(), '>')]",
-                        "//button[contains(text(), '다음')]",
-                        "//button[contains(text(), '>')]",
-                        "//a[contains(@class, 'next')]",
-                        "//button[contains(@class, 'next')]"
-                    ]
-                    for xpath in next_button_xpaths:
-                        next_buttons = driver.find_elements(By.XPATH, xpath)
-                        if next_buttons:
-                            for btn in next_buttons:
-                                if btn.is_displayed() and btn.is_enabled():
-                                    if safe_click(driver, btn, use_js=True):
-                                        next_page_found = True
-                                        break
-                        if next_page_found:
-                            break
+                    next_page_number = page_num + 1
+                    next_page_xpath = f"//a[contains(text(), '{next_page_number}')]"
+                    next_page_elements = driver.find_elements(By.XPATH, next_page_xpath)
+                    for element in next_page_elements:
+                        if element.text.strip() == str(next_page_number):
+                            if safe_click(driver, element, use_js=True, stage='pagination_click'):
+                                next_page_found = True
+                                break
                 except Exception as e:
-                    print(f"[WARN] 다음 페이지 버튼 오류: {e}")
+                    print(f"[WARN] 숫자 페이지네이션 오류: {e}")
             
-            if not next_page_found:
-                try:
-                    pagination_selectors = [
-                        'div._2g7PKvqCKe', 
-                        'div[class*="pagination"]',
-                        'div[class*="paging"]',
-                        'div[class*="page_num"]',
-                        'ul[class*="pagination"]'
-                    ]
-                    for selector in pagination_selectors:
-                        pagination_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if pagination_elements:
-                            pagination_area = pagination_elements[0]
-                            page_links = pagination_area.find_elements(By.TAG_NAME, 'a')
-                            for i, link in enumerate(page_links):
-                                if link.text.strip() == str(page_num):
-                                    if i + 1 < len(page_links):
-                                        next_link = page_links[i + 1]
-                                        if safe_click(driver, next_link, use_js=True):
+                if not next_page_found:
+                    try:
+                        for xpath in patterns('review_next_button'):
+                            next_buttons = driver.find_elements(By.XPATH, xpath)
+                            if next_buttons:
+                                for btn in next_buttons:
+                                    if btn.is_displayed() and btn.is_enabled():
+                                        if safe_click(driver, btn, use_js=True, stage='pagination_click'):
                                             next_page_found = True
                                             break
-                        if next_page_found:
-                            break
-                except Exception as e:
-                    print(f"[WARN] 페이지네이션 영역 오류: {e}")
+                            if next_page_found:
+                                break
+                    except Exception as e:
+                        print(f"[WARN] 다음 페이지 버튼 오류: {e}")
+            
+                if not next_page_found:
+                    try:
+                        def click_after_current(selector):
+                            pagination_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                            if not pagination_elements:
+                                return None
+                            page_links = pagination_elements[0].find_elements(By.TAG_NAME, 'a')
+                            for i, link in enumerate(page_links):
+                                if link.text.strip() == str(page_num) and i + 1 < len(page_links):
+                                    if safe_click(driver, page_links[i + 1], use_js=True, stage='pagination_click'):
+                                        return True
+                            return None
+                        next_page_found = bool(first_match('review_pagination', patterns('review_pagination'), click_after_current))
+                    except Exception as e:
+                        print(f"[WARN] 페이지네이션 영역 오류: {e}")
             
             if not next_page_found:
                 print("[INFO] 더 이상 다음 페이지 없음. 종료.")
                 break
             
-            time.sleep(3)
+            wait_for_change(driver, patterns('review_state'), review_state, 'pagination', fixed_delay=3)
             page_num += 1
 
+        if pipeline is not None and not stopped:
+            # 이동이 끝난 뒤 아직 파싱 중인 페이지의 결과를 순서대로 반영
+            for ready_page, result in pipeline.drain():
+                if consume(ready_page, *result):
+                    pipeline.cancel()
+                    break
+
         print(f"[{product_title}] 크롤링 완료!")
 
-        result_df = pd.DataFrame({
-            'PRODUCT_CODE': [product_code] * len(write_dt_lst),
-            'PRODUCT_TITLE': [product_title] * len(write_dt_lst),
-            'RD_WRITE_DT': write_dt_lst,
-            'RD_RATING': rating_lst,
-            'RD_ITEM_NM': item_nm_lst,
-            'RD_CONTENT': content_lst,
-            'RD_OPTION_SIZE': option_size_lst,
-            'RD_OPTION_COLOR': option_color_lst,
-            'RD_REVIEWER_INFO': reviewer_info_lst,
-            'RD_REVIEW_IMAGES': review_imgs_lst
-        })
-
-        if len(result_df) == 0:
+        if not review_rows:
             print(f"[WARN] {product_title}에서 수집된 리뷰가 없음.")
             return pd.DataFrame() if return_df else None
 
-        if len(result_df) > 0:
-            result_df = result_df.drop_duplicates(subset=['RD_WRITE_DT', 'RD_CONTENT'], keep='first')
-            print(f"[INFO] 중복 제거 후 {len(result_df)}개의 리뷰 남음.")
+        result_df = build_review_dataframe(review_rows, product_title, product_code)
+        print(f"[INFO] 중복 제거 후 {len(result_df)}개의 리뷰 남음.")
 
         if output_csv:
             if append_mode and os.path.exists(output_csv):
@@ -0,0 +1,78 @@
+# reviewcrawler/review_script.py
+from common.timing import timed
+
+# 리뷰 영역(#REVIEW, 없으면 문서 전체)에서 리뷰 항목을 찾아 필드별 원본 텍스트만 JSON으로 반환하는 스크립트
+# arguments[0]: 리뷰 항목 선택자 목록, arguments[1]: 필드별 선택자 목록 (review_crawler.review_field_patterns),
+# arguments[2]: 총 리뷰 수 선택자 (선택자 그룹은 common/selectors.json)
+# 선택자 우선순위 규칙은 parse_review_element와 같으며, 텍스트 정규화(작성일/옵션/공백 처리)는 Python에서 합니다.
+#   dates/ratings/contents/reviewers: 요소가 있는 선택자마다 첫 번째 요소의 textContent (선택자 순서)
+#   option: 요소가 있는 첫 선택자의 첫 요소 {text, dl_text, pairs: [[dt, dd], ...]}
+#   images: src 속성이 있는 img가 하나라도 있는 첫 선택자의 src 목록
+REVIEW_EXTRACT_SCRIPT = """
+var itemSelectors = arguments[0], fields = arguments[1], totalSelector = arguments[2];
+var scope = document.querySelector('#REVIEW') || document;
+var items = [], selector = null;
+for (var s = 0; s < itemSelectors.length; s++) {
+    items = scope.querySelectorAll(itemSelectors[s]);
+    if (items.length) { selector = itemSelectors[s]; break; }
+}
+function firstTexts(item, selectors) {
+    var texts = [];
+    for (var i = 0; i < selectors.length; i++) {
+        var el = item.querySelector(selectors[i]);
+        if (el) texts.push(el.textContent);
+    }
+    return texts;
+}
+function option(item) {
+    for (var i = 0; i < fields.option.length; i++) {
+        var div = item.querySelector(fields.option[i]);
+        if (!div) continue;
+        var dl = null;
+        for (var j = 0; j < fields.option_dl.length && !dl; j++) dl = div.querySelector(fields.option_dl[j]);
+        var pairs = [];
+        if (dl) {
+            var dts = dl.querySelectorAll('dt'), dds = dl.querySelectorAll('dd');
+            for (var k = 0; k < dts.length && k < dds.length; k++) pairs.push([dts[k].textContent, dds[k].textContent]);
+        }
+        return {text: div.textContent, dl_text: dl ? dl.textContent : '', pairs: pairs};
+    }
+    return null;
+}
+function images(item) {
+    for (var i = 0; i < fields.image.length; i++) {
+        var srcs = [], imgs = item.querySelectorAll(fields.image[i]);
+        for (var j = 0; j < imgs.length; j++) {
+            if (imgs[j].hasAttribute('src')) srcs.push(imgs[j].getAttribute('src'));
+        }
+        if (srcs.length) return srcs;
+    }
+    return [];
+}
+var records = [];
+for (var n = 0; n < items.length; n++) {
+    var item = items[n];
+    records.push({
+        dates: firstTexts(item, fields.date),
+        ratings: firstTexts(item, fields.rating),
+        option: option(item),
+        contents: firstTexts(item, fields.content),
+        reviewers: firstTexts(item, fields.reviewer),
+        images: images(item)
+    });
+}
+var total = document.querySelector(totalSelector);
+return {selector: selector, records: records, total_text: total ? total.textContent : null};
+"""
+
+def extract_reviews_in_page(driver, item_selectors, field_selectors, total_selector):
+    """
+    현재 리뷰 페이지에서 스크립트 한 번으로 리뷰 항목별 원본 텍스트를 가져옵니다.
+    (page_source 전체를 전송/파싱하지 않음)
+
+    Returns:
+        dict: {'selector': 사용된 항목 선택자, 'records': 항목 목록, 'total_text': 총 리뷰 수 텍스트}
+    """
+    with timed('extract'):
+        result = driver.execute_script(REVIEW_EXTRACT_SCRIPT, item_selectors, field_selectors, total_selector)
+    return result or {'selector': None, 'records': [], 'total_text': None}
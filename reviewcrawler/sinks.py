@@ -0,0 +1,302 @@
+# reviewcrawler/sinks.py
+import os
+import re
+import csv
+import math
+from abc import ABC, abstractmethod
+from datetime import date
+import pandas as pd
+
+from common.timing import timed
+
+# 한 번에 파일에 기록할 행 수 (메모리에 쌓아 두는 최대 행 수)
+DEFAULT_BATCH_SIZE = 500
+
+# 결과 파일 형식
+# - csv: 기존과 같은 CSV (+ 엑셀 변환)
+# - parquet: 타입이 지정된 컬럼형 파일 (pyarrow 필요, zstd 압축)
+OUTPUT_FORMATS = ('csv', 'parquet')
+DEFAULT_OUTPUT_FORMAT = 'csv'
+
+# parquet 컬럼별 타입 (지정되지 않은 컬럼은 문자열)
+# - int8: 평점
+# - date32: 작성일 (YYYYMMDD)
+# - dictionary: 행마다 반복되는 값 (카테고리, 상품 코드, 옵션 등)
+PARQUET_INT8_COLUMNS = ('RD_RATING',)
+PARQUET_DATE_COLUMNS = ('RD_WRITE_DT',)
+PARQUET_DICTIONARY_COLUMNS = (
+    '1st_depth', '2nd_depth', '3rd_depth', '4th_depth',
+    'PRODUCT_CODE', 'PRODUCT_TITLE', 'RD_ITEM_NM', 'RD_OPTION_SIZE', 'RD_OPTION_COLOR',
+)
+PARQUET_COMPRESSION = 'zstd'
+
+class BatchSink(ABC):
+    """
+    수집 결과를 배치 단위로 파일에 이어 쓰는 출력 싱크의 공통 부분
+
+    제품 하나가 끝날 때마다 write로 결과를 넘기면 batch_size 행이 쌓일 때마다 파일에 기록하므로,
+    메모리 사용량은 전체 수집량이 아니라 배치 크기에 비례합니다.
+    하위 클래스는 flush에서 self._buffer를 파일에 기록합니다.
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, columns=None):
+        """
+        Args:
+            path (str): 결과 파일 경로 (기존 파일은 새로 씀)
+            batch_size (int): 파일에 기록하기 전 메모리에 모아 둘 행 수
+            columns (list, optional): 고정할 앞쪽 컬럼 순서
+        """
+        self.path = path
+        self.batch_size = max(1, int(batch_size or 1))
+        self.columns = list(columns or [])
+        self.count = 0
+        self._buffer = []
+        if os.path.exists(path):
+            os.remove(path)
+
+    def write(self, rows):
+        """
+        결과 행을 추가합니다.
+
+        Args:
+            rows: dict 한 개, dict 목록 또는 DataFrame
+        """
+        if rows is None:
+            return
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict('records')
+        elif isinstance(rows, dict):
+            rows = [rows]
+        if not rows:
+            return
+        self._buffer.extend(rows)
+        self.count += len(rows)
+        if len(self._buffer) >= self.batch_size:
+            with timed('output_write'):
+                self.flush()
+
+    @property
+    def buffered(self):
+        """아직 파일에 기록되지 않은 행 수"""
+        return len(self._buffer)
+
+    def _new_columns(self):
+        """버퍼에서 처음 등장한 컬럼 목록을 등장 순서대로 반환합니다."""
+        known = set(self.columns)
+        new_columns = []
+        for row in self._buffer:
+            for col in row:
+                if col not in known:
+                    known.add(col)
+                    new_columns.append(col)
+        return new_columns
+
+    @abstractmethod
+    def flush(self):
+        """메모리에 모인 행(self._buffer)을 파일에 기록하고 버퍼를 비웁니다."""
+
+    def close(self):
+        """남은 행을 기록합니다."""
+        with timed('output_write'):
+            self.flush()
+
+class CsvSink(BatchSink):
+    """
+    수집 결과를 배치 단위로 CSV 파일에 이어 쓰는 출력 싱크
+    이후 배치에서 새 컬럼이 나타나면 기존 파일의 헤더를 확장하여 다시 씁니다.
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, columns=None):
+        super().__init__(path, batch_size, columns)
+        self._header_written = False
+
+    def flush(self):
+        """메모리에 모인 행을 파일에 기록합니다."""
+        if not self._buffer:
+            return
+        new_columns = self._new_columns()
+        if new_columns and self._header_written:
+            self._extend_header(self.columns + new_columns)
+        self.columns.extend(new_columns)
+
+        df = pd.DataFrame(self._buffer, columns=self.columns)
+        df.to_csv(self.path, mode='a', index=False, header=not self._header_written, encoding='utf-8-sig')
+        self._header_written = True
+        self._buffer = []
+
+    def _extend_header(self, columns):
+        """기존 파일을 한 줄씩 옮겨 쓰며 새 컬럼을 빈 값으로 추가합니다."""
+        print(f"[SINK] {self.path}: 새 컬럼 {len(columns) - len(self.columns)}개 추가로 헤더 확장")
+        temp_path = self.path + '.tmp'
+        padding = [''] * (len(columns) - len(self.columns))
+        with open(self.path, newline='', encoding='utf-8-sig') as src, \
+                open(temp_path, 'w', newline='', encoding='utf-8-sig') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader, None)
+            writer.writerow(columns)
+            for row in reader:
+                writer.writerow(row + padding)
+        os.replace(temp_path, self.path)
+
+def _is_missing(value):
+    return value is None or value == '' or (isinstance(value, float) and math.isnan(value))
+
+def _to_int8(value):
+    if _is_missing(value):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.search(r'\d+', str(value))
+    return int(match.group()) if match else None
+
+def _to_date(value):
+    if _is_missing(value):
+        return None
+    digits = re.sub(r'\D', '', str(value))
+    if len(digits) != 8:
+        return None
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    except ValueError:
+        return None
+
+def _to_str(value):
+    return None if _is_missing(value) else str(value)
+
+class ParquetSink(BatchSink):
+    """
+    수집 결과를 배치마다 row group 하나로 parquet 파일에 이어 쓰는 출력 싱크
+
+    CsvSink와 같은 인터페이스(write/flush/close/count)를 가지며,
+    평점은 int8, 작성일은 date32, 반복되는 값은 dictionary 인코딩으로 저장합니다.
+    이후 배치에서 새 컬럼이 나타나면 기존 row group을 하나씩 옮겨 쓰며 스키마를 확장합니다.
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, columns=None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow") from e
+        super().__init__(path, batch_size, columns)
+        self._writer = None
+        self._writer_path = None
+        self._part = 0
+
+    @staticmethod
+    def _field(column):
+        import pyarrow as pa
+        if column in PARQUET_INT8_COLUMNS:
+            return pa.field(column, pa.int8())
+        if column in PARQUET_DATE_COLUMNS:
+            return pa.field(column, pa.date32())
+        if column in PARQUET_DICTIONARY_COLUMNS:
+            return pa.field(column, pa.dictionary(pa.int32(), pa.string()))
+        return pa.field(column, pa.string())
+
+    def _schema(self, columns):
+        import pyarrow as pa
+        return pa.schema([self._field(col) for col in columns])
+
+    def _to_table(self, rows, schema):
+        import pyarrow as pa
+        arrays = []
+        for field in schema:
+            values = [row.get(field.name) for row in rows]
+            if pa.types.is_int8(field.type):
+                arrays.append(pa.array([_to_int8(v) for v in values], type=pa.int8()))
+            elif pa.types.is_date32(field.type):
+                arrays.append(pa.array([_to_date(v) for v in values], type=pa.date32()))
+            elif pa.types.is_dictionary(field.type):
+                arrays.append(pa.array([_to_str(v) for v in values], type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array([_to_str(v) for v in values], type=pa.string()))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def _open_writer(self, schema):
+        """작성 중인 임시 파일에 대한 writer를 엽니다. (close 시 최종 경로로 이동)"""
+        import pyarrow.parquet as pq
+        self._part += 1
+        self._writer_path = f"{self.path}.part{self._part}"
+        return pq.ParquetWriter(self._writer_path, schema, compression=PARQUET_COMPRESSION)
+
+    def flush(self):
+        """메모리에 모인 행을 row group 하나로 기록합니다."""
+        if not self._buffer:
+            return
+        new_columns = self._new_columns()
+        if new_columns and self._writer is not None:
+            self._extend_schema(self.columns + new_columns)
+        self.columns.extend(new_columns)
+
+        schema = self._schema(self.columns)
+        if self._writer is None:
+            self._writer = self._open_writer(schema)
+        self._writer.write_table(self._to_table(self._buffer, schema))
+        self._buffer = []
+
+    def _extend_schema(self, columns):
+        """기존 row group을 하나씩 새 스키마로 옮겨 쓰며 새 컬럼을 null로 추가합니다."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        print(f"[SINK] {self.path}: 새 컬럼 {len(columns) - len(self.columns)}개 추가로 스키마 확장")
+        self._writer.close()
+        old_path = self._writer_path
+        schema = self._schema(columns)
+        self._writer = self._open_writer(schema)
+        source = pq.ParquetFile(old_path)
+        for i in range(source.num_row_groups):
+            table = source.read_row_group(i)
+            for field in schema:
+                if field.name not in table.column_names:
+                    table = table.append_column(field, pa.nulls(table.num_rows, type=field.type))
+            self._writer.write_table(table.select(columns).cast(schema))
+        source.close()
+        os.remove(old_path)
+
+    def close(self):
+        """남은 행을 기록하고 파일을 완성합니다."""
+        with timed('output_write'):
+            self.flush()
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                os.replace(self._writer_path, self.path)
+
+def create_sink(path, output_format=DEFAULT_OUTPUT_FORMAT, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    출력 형식에 맞는 싱크를 생성합니다.
+
+    Args:
+        path (str): 결과 파일 경로 (parquet 형식이면 확장자를 .parquet으로 변경)
+        output_format (str): OUTPUT_FORMATS 중 하나
+        batch_size (int): 한 번에 기록할 행 수
+
+    Returns:
+        CsvSink | ParquetSink
+    """
+    if output_format == 'parquet':
+        return ParquetSink(os.path.splitext(path)[0] + '.parquet', batch_size=batch_size)
+    if output_format == 'csv':
+        return CsvSink(path, batch_size=batch_size)
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format} (사용 가능: {', '.join(OUTPUT_FORMATS)})")
+
+def stream_csv_to_excel(csv_path, excel_path, chunksize=DEFAULT_BATCH_SIZE * 10):
+    """
+    CSV 파일을 청크 단위로 읽어 엑셀 파일로 변환합니다.
+    (openpyxl write-only 모드를 사용하여 전체 데이터를 메모리에 올리지 않음)
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    header_written = False
+    for chunk in pd.read_csv(csv_path, encoding='utf-8-sig', chunksize=chunksize):
+        if not header_written:
+            sheet.append(list(chunk.columns))
+            header_written = True
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(list(row))
+    workbook.save(excel_path)
+    return excel_path
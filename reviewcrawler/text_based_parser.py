@@ -1,17 +1,21 @@
 # reviewcrawler/text_based_parser.py
-from bs4 import BeautifulSoup
+import re
+
+from reviewcrawler.document import get_document
+from common.selector_stats import first_match
+from common.selector_registry import selectors
 
 def parse_product_info_by_text(html_source):
     """
     텍스트 기반으로 상품 정보를 파싱하는 함수
     
     Args:
-        html_source (str): HTML 소스
+        html_source (str | ParsedDocument): HTML 소스 또는 파싱된 문서
         
     Returns:
         dict: 파싱된 상품 정보
     """
-    soup = BeautifulSoup(html_source, 'html.parser')
+    soup = get_document(html_source).soup
     product_info = {}
     
     # 찾고자 하는 상품 정보 라벨 목록
@@ -71,39 +75,18 @@ def parse_product_info_by_text(html_source):
                                 print(f"[DEBUG] 텍스트 매칭으로 추출: {label_text} -> {value}")
     
     # 상품명 추출 (별도 처리)
-    title_selectors = [
-        'h3._22kNQuEXmb',
-        'h3[class*="product_title"]',
-        'div[class*="headingArea"] h2',
-        'h2[class*="product_title"]',
-        'h3.product_title',
-        'h2.product_name'
-    ]
-    
-    for selector in title_selectors:
-        title_element = soup.select_one(selector)
-        if title_element:
-            product_info['상품명'] = title_element.get_text(strip=True)
-            break
+    title_element = first_match('text_title', selectors('text_title'), soup.select_one)
+    if title_element:
+        product_info['상품명'] = title_element.get_text(strip=True)
     
     # 가격 추출 (별도 처리)
-    price_selectors = [
-        'span[class*="price_num"]',
-        'span.price_num__OMokY',
-        'div[class*="price"] strong',
-        'em[class*="price"]',
-        'span.price',
-        'strong.price'
-    ]
-    
-    for selector in price_selectors:
+    def find_price(selector):
         price_element = soup.select_one(selector)
         if price_element:
-            price_text = price_element.get_text(strip=True)
-            import re
-            price_value = re.sub(r'[^\d]', '', price_text)
-            if price_value:
-                product_info['가격'] = price_value
-                break
+            return re.sub(r'[^\d]', '', price_element.get_text(strip=True)) or None
+        return None
+    price_value = first_match('text_price', selectors('text_price'), find_price)
+    if price_value:
+        product_info['가격'] = price_value
     
     return product_info
\ No newline at end of file
@@ -1,40 +1,36 @@
 # reviewcrawler/utils.py
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import ElementNotInteractableException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import hashlib
+from reviewcrawler.document import get_document
+from common.waits import wait_for, wait_network_idle
+from common.driver_factory import create_driver
+from common.timing import timed
+from common.selector_registry import selectors
 
 def setup_driver():
-    """Chrome 웹드라이버 설정"""
-    options = webdriver.ChromeOptions()
-    # options.add_argument("--headless")  # 헤드리스 모드 활성화
-    options.add_argument("window-size=1920x1080")  # 브라우저 크기
-    options.add_argument("disable-gpu")
-    options.add_argument("disable-infobars")
-    options.add_argument("--disable-extensions")
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')  # 메모리 관련 오류 방지
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(3)
-    return driver
+    """Chrome 웹드라이버 설정 (common.driver_factory 공통 설정 사용)"""
+    return create_driver(implicit_wait=3)
 
-def safe_click(driver, element, retry=3, use_js=False, scroll_first=True):
-    """안전하게 요소를 클릭하는 함수"""
+def safe_click(driver, element, retry=3, use_js=False, scroll_first=True, stage='tab_click'):
+    """
+    안전하게 요소를 클릭하는 함수
+    (클릭 시간은 stage 단계로 계측: 탭/정렬은 tab_click, 리뷰 페이지 이동은 pagination_click)
+    """
+    with timed(stage):
+        return _click_with_retry(driver, element, retry, use_js, scroll_first)
+
+def _click_with_retry(driver, element, retry, use_js, scroll_first):
     for attempt in range(retry):
         try:
             if scroll_first:
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.5)
+                wait_for(driver, 'scroll', 0.5)
             if use_js:
                 driver.execute_script("arguments[0].click();", element)
             else:
                 element.click()
-            time.sleep(1)  # 클릭 후 잠시 대기
+            wait_network_idle(driver, fixed_delay=1, condition='click')  # 클릭 후 잠시 대기
             return True
         except (ElementNotInteractableException, TimeoutException) as e:
             print(f"클릭 시도 {attempt+1}/{retry} 실패: {e}")
@@ -54,15 +50,12 @@ def safe_click(driver, element, retry=3, use_js=False, scroll_first=True):
 def extract_product_info_from_html(soup):
     """
     HTML에서 상품 정보 테이블 데이터 추출
+    (soup 대신 HTML 문자열이나 ParsedDocument도 받을 수 있음)
     """
+    if not hasattr(soup, 'select'):
+        soup = get_document(soup).soup
     product_info = {}
-    table_selectors = [
-        'table.TH_yvPweZa',
-        'table[class*="_yvPweZa"]',
-        'div._1Hbih69XFT table',
-        'div[class*="product_info"] table'
-    ]
-    for selector in table_selectors:
+    for selector in selectors('product_table'):
         tables = soup.select(selector)
         for table in tables:
             rows = table.select('tr')
@@ -92,16 +85,18 @@ def get_text_from_element(element):
 def parse_product_info_tables(html_source):
     """
     네이버 스마트스토어 상품 정보 테이블 파싱
+    (html_source는 HTML 문자열 또는 ParsedDocument)
     """
     from reviewcrawler.text_based_parser import parse_product_info_by_text
-    product_info = parse_product_info_by_text(html_source)
+    document = get_document(html_source)
+    product_info = parse_product_info_by_text(document)
     if not product_info:
-        soup = BeautifulSoup(html_source, 'html.parser')
+        soup = document.soup
         product_info = {}
-        product_info_divs = soup.select('div._1Hbih69XFT')
+        product_info_divs = soup.select(selectors('product_info_area'))
         if not product_info_divs:
             print("[WARN] 상품 정보 영역(_1Hbih69XFT)을 찾을 수 없습니다.")
-            product_info_divs = soup.select('div[class*="product_info"], div[class*="productInfo"]')
+            product_info_divs = soup.select(selectors('product_info_area_fallback'))
         for div in product_info_divs:
             tables = div.select('table')
             for table in tables:
@@ -127,7 +122,7 @@ def parse_product_info_tables(html_source):
                                         product_info[key] = b_value
                                         print(f"[DEBUG] b 태그에서 상품번호 추출: {b_value}")
         if '영수증발급' in product_info and not 'A/S 안내' in product_info:
-            as_rows = soup.select('th:contains("A/S"), th:contains("AS")')
+            as_rows = soup.select(selectors('product_info_as_header'))
             for as_row in as_rows:
                 if as_row.parent:
                     td_cell = as_row.parent.select_one('td')
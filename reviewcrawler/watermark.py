@@ -0,0 +1,146 @@
+# reviewcrawler/watermark.py
+import json
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+
+def review_hash(write_dt, content):
+    """리뷰 중복 판단 기준(작성일 + 내용)의 해시를 반환합니다."""
+    return hashlib.md5(f"{write_dt}|{content}".encode('utf-8')).hexdigest()[:16]
+
+class ReviewWatermark:
+    """
+    상품별 리뷰 수집 기준점 (high-water mark)
+
+    가장 최근 리뷰 작성일(RD_WRITE_DT)과 그 날짜에 작성된 리뷰들의 내용 해시를 보관합니다.
+    최신순으로 정렬된 리뷰 목록에서 이 기준점 이전(또는 같은 날짜의 이미 본 리뷰)은
+    이미 수집된 리뷰로 판단합니다.
+    """
+
+    def __init__(self, write_dt='', hashes=None):
+        self.write_dt = write_dt or ''
+        self.hashes = set(hashes or [])
+
+    def is_seen(self, review):
+        """review(RD_WRITE_DT, RD_CONTENT 키를 가진 dict)가 이미 수집된 리뷰인지 확인합니다."""
+        write_dt = review.get('RD_WRITE_DT', '')
+        if review_hash(write_dt, review.get('RD_CONTENT', '')) in self.hashes:
+            return True
+        # 작성일을 파싱하지 못한 리뷰는 해시로만 판단
+        if not write_dt or not self.write_dt:
+            return False
+        return write_dt < self.write_dt
+
+    def advance(self, reviews):
+        """
+        새로 수집한 리뷰를 반영한 기준점을 반환합니다.
+
+        Args:
+            reviews (iterable): RD_WRITE_DT, RD_CONTENT 키를 가진 dict 목록
+
+        Returns:
+            ReviewWatermark: 갱신된 기준점
+        """
+        latest_dt = self.write_dt
+        hashes = set(self.hashes)
+        for review in reviews:
+            write_dt = review.get('RD_WRITE_DT', '')
+            if not write_dt or write_dt < latest_dt:
+                continue
+            if write_dt > latest_dt:
+                latest_dt = write_dt
+                hashes = set()
+            hashes.add(review_hash(write_dt, review.get('RD_CONTENT', '')))
+        return ReviewWatermark(latest_dt, hashes)
+
+class ReviewWatermarkStore:
+    """
+    상품별 리뷰 기준점을 실행 간에 유지하는 SQLite 저장소
+    여러 워커 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, db_path='review_watermarks.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_watermarks (
+                product_code TEXT PRIMARY KEY,
+                write_dt TEXT,
+                hashes TEXT,
+                updated_at TEXT
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, product_code):
+        """저장된 기준점을 반환합니다. (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT write_dt, hashes FROM review_watermarks WHERE product_code = ?", (product_code,)
+            ).fetchone()
+        if not row:
+            return None
+        return ReviewWatermark(row[0], json.loads(row[1] or '[]'))
+
+    def save(self, product_code, watermark):
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO review_watermarks (product_code, write_dt, hashes, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(product_code) DO UPDATE SET
+                    write_dt = excluded.write_dt,
+                    hashes = excluded.hashes,
+                    updated_at = excluded.updated_at
+            """, (
+                product_code, watermark.write_dt, json.dumps(sorted(watermark.hashes)),
+                datetime.now().isoformat(timespec='seconds')
+            ))
+            self._conn.commit()
+
+    def propose(self, product_code, reviews_df):
+        """
+        새로 수집한 리뷰를 반영한 상품의 기준점을 반환합니다. (저장하지 않음, 리뷰가 없으면 None)
+        리뷰가 결과 파일에 기록된 뒤 PendingWatermarks.commit으로 저장합니다.
+        """
+        if reviews_df is None or reviews_df.empty:
+            return None
+        previous = self.get(product_code) or ReviewWatermark()
+        return previous.advance(reviews_df.to_dict('records'))
+
+    def update(self, product_code, reviews_df):
+        """새로 수집한 리뷰로 상품의 기준점을 바로 갱신합니다."""
+        watermark = self.propose(product_code, reviews_df)
+        if watermark is not None:
+            self.save(product_code, watermark)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class PendingWatermarks:
+    """
+    결과 파일에 아직 기록되지 않은 리뷰의 기준점을 모아 두었다가 기록된 뒤에 저장합니다.
+
+    워커가 리뷰를 수집하자마자 기준점을 저장하면, 리뷰가 풀의 결과 대기열이나 싱크 버퍼에 있는 동안
+    실행이 중단될 때 다음 증분 수집이 그 리뷰를 이미 수집한 것으로 보고 건너뜁니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, product_code, watermark):
+        """기준점을 보류합니다. (같은 상품은 나중 값으로 대체)"""
+        if watermark is not None and product_code:
+            self._pending[product_code] = watermark
+
+    def commit(self):
+        """보류한 기준점을 모두 저장합니다. (싱크가 버퍼를 파일에 기록한 뒤 호출)"""
+        for product_code, watermark in self._pending.items():
+            self.store.save(product_code, watermark)
+        self._pending.clear()
@@ -0,0 +1,41 @@
+# tests/test_archive.py - HTML 아카이브가 같은 내용의 스냅샷을 한 번만 저장하는지 확인
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from reviewcrawler.archive import SnapshotArchive, KIND_PRODUCT, KIND_REVIEW
+from reviewcrawler.document import ParsedDocument
+
+PAGE_1 = '<html><body><ul><li>좋아요</li></ul></body></html>'
+PAGE_2 = '<html><body><ul><li>보통</li></ul></body></html>'
+
+def stored_objects(root):
+    return [name for _, _, files in os.walk(os.path.join(root, 'objects')) for name in files]
+
+def test_snapshots_are_deduplicated_by_content_hash(tmp_path):
+    pytest.importorskip('zstandard')
+    root = str(tmp_path / 'html_archive')
+    archive = SnapshotArchive(root)
+    try:
+        first = archive.save(PAGE_1, 'P1', 'https://example.com/P1', KIND_PRODUCT)
+        # 같은 내용은 문자열/파싱된 문서 어느 쪽으로 넘겨도 같은 객체를 가리킴
+        again = archive.save(ParsedDocument(PAGE_1), 'P1', 'https://example.com/P1', KIND_REVIEW, page=1)
+        second = archive.save(PAGE_2, 'P1', 'https://example.com/P1', KIND_REVIEW, page=2)
+
+        assert first == again != second
+        assert len(stored_objects(root)) == 2
+        assert archive.get(first) == PAGE_1
+        assert archive.get(second) == PAGE_2
+        assert [(s['kind'], s['page'], s['content_hash']) for s in archive.snapshots(product_code='P1')] == [
+            (KIND_PRODUCT, 0, first), (KIND_REVIEW, 1, first), (KIND_REVIEW, 2, second),
+        ]
+        assert archive.summary() == {
+            KIND_PRODUCT: {'snapshots': 1, 'unique': 1},
+            KIND_REVIEW: {'snapshots': 2, 'unique': 2},
+        }
+    finally:
+        archive.close()
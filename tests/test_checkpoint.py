@@ -0,0 +1,44 @@
+# tests/test_checkpoint.py - 체크포인트에 기록한 결과를 다시 열어 이어서 실행(--resume)할 수 있는지 확인
+import os
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from reviewcrawler.checkpoint import CheckpointStore, STATUS_DONE, STATUS_FAILED, STATUS_RUNNING
+
+def test_resume_round_trip(tmp_path):
+    db_path = str(tmp_path / 'crawl_checkpoint.db')
+    product_info = {'상품명': '원피스', '상품가격': '39,200'}
+    reviews_df = pd.DataFrame([
+        {'RD_WRITE_DT': '20240102', 'RD_CONTENT': '좋아요', 'RD_RATING': 5},
+        {'RD_WRITE_DT': '20240101', 'RD_CONTENT': '보통', 'RD_RATING': 3},
+    ])
+
+    store = CheckpointStore(db_path)
+    store.mark_running('P1', 'https://example.com/P1')
+    store.mark_done('P1', product_info, reviews_df)
+    store.mark_running('P2', 'https://example.com/P2')
+    store.mark_failed('P2', 'timeout')
+    # 처리 중에 중단된 제품
+    store.mark_running('P3', 'https://example.com/P3')
+    store.close()
+
+    resumed = CheckpointStore(db_path)
+    try:
+        assert resumed.completed_codes() == {'P1'}
+        assert resumed.summary() == {STATUS_DONE: 1, STATUS_FAILED: 1, STATUS_RUNNING: 1}
+        loaded_info, loaded_reviews = resumed.load_result('P1')
+        assert loaded_info == product_info
+        pd.testing.assert_frame_equal(loaded_reviews, reviews_df, check_dtype=False)
+        assert resumed.load_result('P3') == (None, None)
+
+        # 다시 처리하여 완료하면 완료 목록에 추가
+        resumed.mark_running('P3', 'https://example.com/P3')
+        resumed.mark_done('P3', None, None)
+        assert resumed.completed_codes() == {'P1', 'P3'}
+        assert resumed.load_result('P3') == (None, None)
+    finally:
+        resumed.close()
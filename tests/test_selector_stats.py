@@ -0,0 +1,61 @@
+# tests/test_selector_stats.py - 대체 선택자 시도 순서가 추출 결과를 바꾸지 않는지 확인
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from common.html_parser import parse_html
+from common.selector_stats import ROTATION_LOOKUPS, PRIMARY_PROBE_LOOKUPS, selector_stats, set_selector_order, get_selector_order
+from reviewcrawler.review_crawler import parse_review_element
+
+# 내용 span(_1kMfD5ErZ6)이 없어 넓은 대체 선택자(div[class*="content"])로 찾는 리뷰, 정상 리뷰
+MISSING_SPAN = '<li class="BnwL_cs1av"><span class="_2L3vDiadT9">24.01.02.</span><div class="review_content">좋아요<a>더보기</a></div></li>'
+NORMAL = (
+    '<li class="BnwL_cs1av"><span class="_2L3vDiadT9">24.01.01.</span>'
+    '<div class="_1kMfD5ErZ6 review_content"><span class="_2L3vDiadT9">좋아요</span><a>더보기</a></div></li>'
+)
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    previous = get_selector_order()
+    selector_stats.reset()
+    yield
+    selector_stats.reset()
+    set_selector_order(previous)
+
+def review_content(html):
+    return parse_review_element(parse_html(html).select_one('li'))['RD_CONTENT']
+
+@pytest.mark.parametrize('order', ['static', 'adaptive'])
+def test_fallback_hit_does_not_change_later_reviews(order):
+    set_selector_order(order)
+    review_content(MISSING_SPAN)
+    assert review_content(NORMAL) == '좋아요'
+
+CONTENT_SELECTORS = ['div._1kMfD5ErZ6 span._2L3vDiadT9', 'div[class*="content"]']
+
+def test_adaptive_promotes_fallback_after_rotation():
+    set_selector_order('adaptive')
+    for _ in range(ROTATION_LOOKUPS + 1):
+        review_content(MISSING_SPAN)
+    assert selector_stats.summary()['review_content']['rotated']
+    assert selector_stats.order('review_content', CONTENT_SELECTORS)[0] == 'div[class*="content"]'
+
+def test_adaptive_demotes_fallback_when_primary_returns(tmp_path):
+    set_selector_order('adaptive')
+    for _ in range(ROTATION_LOOKUPS):
+        review_content(MISSING_SPAN)
+    assert selector_stats.summary()['review_content']['rotated']
+
+    # 앞세운 대체 선택자가 항상 일치해도 주기적으로 기본 선택자를 시도하여 되돌림 (저장 후 다음 실행에서도 같음)
+    path = str(tmp_path / 'selector_stats.json')
+    selector_stats.save(path)
+    selector_stats.load(path)
+    for _ in range(PRIMARY_PROBE_LOOKUPS):
+        review_content(NORMAL)
+    assert not selector_stats.summary()['review_content']['rotated']
+    assert selector_stats.order('review_content', CONTENT_SELECTORS) == CONTENT_SELECTORS
+    assert all(review_content(NORMAL) == '좋아요' for _ in range(100))
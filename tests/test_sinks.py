@@ -0,0 +1,53 @@
+# tests/test_sinks.py - 배치 출력 싱크가 이어 쓴 결과 파일의 형식 확인
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from reviewcrawler.sinks import CsvSink, ParquetSink
+
+def test_csv_sink_widens_header_for_new_columns(tmp_path):
+    path = str(tmp_path / 'review_all.csv')
+    sink = CsvSink(path, batch_size=1)
+    sink.write({'PRODUCT_CODE': 'P1', 'RD_CONTENT': '좋아요'})
+    # 이후 배치에서 새 컬럼이 나타나면 이미 기록한 행은 빈 값으로 채움
+    sink.write([{'PRODUCT_CODE': 'P2', 'RD_CONTENT': '보통', 'RD_RATING': 4}])
+    sink.close()
+
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype=str)
+    assert list(df.columns) == ['PRODUCT_CODE', 'RD_CONTENT', 'RD_RATING']
+    assert df.fillna('').values.tolist() == [['P1', '좋아요', ''], ['P2', '보통', '4']]
+    assert sink.count == 2
+    assert not os.path.exists(path + '.tmp')
+
+def test_parquet_sink_writes_typed_columns_and_renames_part_file(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    import pyarrow as pa
+
+    path = str(tmp_path / 'review_all.parquet')
+    sink = ParquetSink(path, batch_size=1)
+    sink.write({'PRODUCT_CODE': 'P1', 'RD_RATING': '5', 'RD_WRITE_DT': '2024.01.02.'})
+    # 작성 중에는 .partN 임시 파일에만 기록
+    assert os.path.exists(path + '.part1')
+    assert not os.path.exists(path)
+    # 새 컬럼이 나타나면 다음 part 파일로 옮겨 씀
+    sink.write({'PRODUCT_CODE': 'P2', 'RD_RATING': 3, 'RD_WRITE_DT': '20240105', 'RD_CONTENT': '최고'})
+    sink.close()
+
+    assert os.path.exists(path)
+    assert not [name for name in os.listdir(tmp_path) if '.part' in name]
+    table = pq.read_table(path)
+    schema = table.schema
+    assert schema.field('RD_RATING').type == pa.int8()
+    assert schema.field('RD_WRITE_DT').type == pa.date32()
+    assert pa.types.is_dictionary(schema.field('PRODUCT_CODE').type)
+    assert schema.field('RD_CONTENT').type == pa.string()
+    assert table.to_pylist() == [
+        {'PRODUCT_CODE': 'P1', 'RD_RATING': 5, 'RD_WRITE_DT': date(2024, 1, 2), 'RD_CONTENT': None},
+        {'PRODUCT_CODE': 'P2', 'RD_RATING': 3, 'RD_WRITE_DT': date(2024, 1, 5), 'RD_CONTENT': '최고'},
+    ]
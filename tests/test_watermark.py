@@ -0,0 +1,92 @@
+# tests/test_watermark.py - 증분 수집 기준점이 결과 파일에 기록된 리뷰까지만 반영되는지 확인
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import main
+from reviewcrawler.checkpoint import CheckpointStore
+from reviewcrawler.watermark import ReviewWatermarkStore
+
+REVIEWS = {
+    'P1': [{'RD_WRITE_DT': '20240102', 'RD_CONTENT': '좋아요'}, {'RD_WRITE_DT': '20240101', 'RD_CONTENT': '보통'}],
+    'P2': [{'RD_WRITE_DT': '20240105', 'RD_CONTENT': '최고'}, {'RD_WRITE_DT': '20240103', 'RD_CONTENT': '별로'}],
+}
+
+class FakeCrawler:
+    """브라우저 없이 상품별 고정 리뷰를 돌려주는 크롤러 (기준점 이후 리뷰만 반환)"""
+
+    def crawl_product_info(self, target_url):
+        return {'상품URL': target_url}
+
+    def crawl_reviews(self, target_url, max_pages=None, return_df=True, watermark=None):
+        rows = [row for row in REVIEWS[target_url] if watermark is None or not watermark.is_seen(row)]
+        return pd.DataFrame(rows) if rows else None
+
+class CrashingPool:
+    """
+    실제 풀처럼 모든 작업을 앞서 처리해 두고 결과를 입력 순서대로 반환하다가,
+    crash_after개를 반환한 뒤 실행 중단(KeyboardInterrupt)을 흉내 냅니다.
+    """
+    crash_after = None
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self, tasks, handler):
+        results = [(task[0], task, handler(FakeCrawler(), task)) for task in tasks]
+        for count, result in enumerate(results):
+            if self.crash_after is not None and count >= self.crash_after:
+                raise KeyboardInterrupt
+            yield result
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, 'CrawlerPool', CrashingPool)
+    monkeypatch.setattr(main, 'convert_csv_to_excel', lambda *args, **kwargs: None)
+    return tmp_path
+
+def run_crawl(watermarks, checkpoint, crash_after=None):
+    CrashingPool.crash_after = crash_after
+    url_df = pd.DataFrame([{'PRODUCT_CODE': code, '제품_URL': code} for code in REVIEWS])
+    return main.crawl_product_info_and_reviews(url_df, checkpoint=checkpoint, watermarks=watermarks, batch_size=500)
+
+def test_crash_keeps_unwritten_reviews_for_next_run(workdir):
+    watermarks = ReviewWatermarkStore(str(workdir / 'watermarks.db'))
+    checkpoint = CheckpointStore(str(workdir / 'checkpoint.db'))
+
+    # P2는 워커가 수집했지만 결과 파일에 기록되기 전에 중단
+    with pytest.raises(KeyboardInterrupt):
+        run_crawl(watermarks, checkpoint, crash_after=1)
+    written = pd.read_csv('review_all.csv', encoding='utf-8-sig')
+    assert set(written['RD_CONTENT']) == {'좋아요', '보통'}
+    assert watermarks.get('P1').write_dt == '20240102'
+    assert watermarks.get('P2') is None
+
+    # 다음 증분 실행: P1은 새 리뷰 없음, P2 리뷰는 다시 수집
+    product_count, review_count = run_crawl(watermarks, checkpoint)
+    written = pd.read_csv('review_all.csv', encoding='utf-8-sig')
+    assert review_count == 2
+    assert set(written['RD_CONTENT']) == {'최고', '별로'}
+    assert watermarks.get('P2').write_dt == '20240105'
+
+    checkpoint.close()
+    watermarks.close()
+
+def test_watermark_saved_after_reviews_written(workdir):
+    watermarks = ReviewWatermarkStore(str(workdir / 'watermarks.db'))
+    checkpoint = CheckpointStore(str(workdir / 'checkpoint.db'))
+
+    run_crawl(watermarks, checkpoint)
+    assert watermarks.get('P1').write_dt == '20240102'
+    assert watermarks.get('P2').write_dt == '20240105'
+    # 다시 실행하면 새 리뷰가 없음
+    assert run_crawl(watermarks, checkpoint)[1] == 0
+
+    checkpoint.close()
+    watermarks.close()
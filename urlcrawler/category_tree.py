@@ -0,0 +1,204 @@
+# urlcrawler/category_tree.py
+import os
+import json
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from page_navigation import (
+    navigate_to_base_page,
+    get_subcategory_items,
+    click_subcategory,
+    get_first_detail_menu_items,
+    click_first_detail_menu,
+    get_second_detail_menu_items,
+    click_second_detail_menu
+)
+from common.driver_factory import note_page_load
+from common.timing import timed
+from common.waits import wait_network_idle
+from common.selector_registry import patterns
+from common.endpoints import get_base_urls
+
+# 카테고리 트리 캐시 파일 (1st~4th depth 노드와 노드별 목록 URL)
+DEFAULT_TREE_CACHE = "category_tree.json"
+ROOT_CATEGORY = "여성의류"
+DEPTH_KEYS = ["1st_depth", "2nd_depth", "3rd_depth", "4th_depth"]
+
+def _make_node(path, url, parent_url):
+    """
+    카테고리 노드를 만듭니다.
+    메뉴 클릭으로 주소가 바뀌지 않는 경우(화면 상태만 바뀌는 경우) url은 None으로 두고 클릭 경로로 이동합니다.
+    """
+    node = {key: (path[i] if i < len(path) else "") for i, key in enumerate(DEPTH_KEYS)}
+    node["depth"] = len(path)
+    node["url"] = url if url and url != parent_url else None
+    node["has_children"] = False
+    return node
+
+def _safe_items(get_items, driver):
+    """메뉴 항목 조회 (메뉴 영역이 없으면 빈 목록)"""
+    try:
+        return get_items(driver)
+    except Exception as e:
+        print(f">> [DEBUG] 메뉴 항목 없음: {e}")
+        return []
+
+def discover_category_tree(driver, max_depth):
+    """
+    1st depth부터 max_depth까지 메뉴를 한 번 순회하며 카테고리 트리를 기록합니다.
+    각 노드에는 메뉴 클릭 후의 목록 URL을 함께 저장합니다.
+    하위 메뉴 탐색 중 오류가 난 노드는 건너뛰고 계속 탐색하며, 건너뛴 경로를 함께 반환합니다.
+
+    Returns:
+        tuple: (노드 dict 목록 (1st_depth~4th_depth, depth, url, has_children), 탐색 오류 경로 목록)
+    """
+    print(">> [INFO] 카테고리 트리 탐색 시작")
+    navigate_to_base_page(driver)
+    base_url = driver.current_url
+    # 1st depth는 대분류 선택 상태가 필요하므로 항상 navigate_to_base_page로 이동
+    root = _make_node([ROOT_CATEGORY], None, None)
+    nodes = [root]
+    errors = []
+    if max_depth < 2:
+        return nodes, errors
+
+    subcategory_texts = get_subcategory_items(driver)
+    root["has_children"] = bool(subcategory_texts)
+    for subcategory_text in subcategory_texts:
+        try:
+            navigate_to_base_page(driver)
+            click_subcategory(driver, subcategory_text)
+            sub_node = _make_node([ROOT_CATEGORY, subcategory_text], driver.current_url, base_url)
+            nodes.append(sub_node)
+            if max_depth < 3:
+                continue
+
+            first_detail_texts = _safe_items(get_first_detail_menu_items, driver)
+            sub_node["has_children"] = bool(first_detail_texts)
+            for first_detail_text in first_detail_texts:
+                try:
+                    navigate_to_base_page(driver)
+                    click_subcategory(driver, subcategory_text)
+                    sub_url = driver.current_url
+                    click_first_detail_menu(driver, first_detail_text)
+                    first_node = _make_node([ROOT_CATEGORY, subcategory_text, first_detail_text], driver.current_url, sub_url)
+                    nodes.append(first_node)
+                    if max_depth < 4:
+                        continue
+
+                    second_detail_texts = _safe_items(get_second_detail_menu_items, driver)
+                    first_node["has_children"] = bool(second_detail_texts)
+                    first_url = driver.current_url
+                    for second_detail_text in second_detail_texts:
+                        try:
+                            click_second_detail_menu(driver, second_detail_text)
+                            nodes.append(_make_node(
+                                [ROOT_CATEGORY, subcategory_text, first_detail_text, second_detail_text],
+                                driver.current_url, first_url
+                            ))
+                        except Exception as e:
+                            print(f">> [ERROR] 4th depth '{second_detail_text}' 탐색 오류: {e}")
+                            errors.append(" > ".join([subcategory_text, first_detail_text, second_detail_text]))
+                except Exception as e:
+                    print(f">> [ERROR] 3rd depth '{first_detail_text}' 탐색 오류: {e}")
+                    errors.append(" > ".join([subcategory_text, first_detail_text]))
+        except Exception as e:
+            print(f">> [ERROR] 2nd depth '{subcategory_text}' 탐색 오류: {e}")
+            errors.append(subcategory_text)
+
+    direct = sum(1 for node in nodes if node["url"])
+    print(f">> [INFO] 카테고리 트리 탐색 완료: 노드 {len(nodes)}개 (URL로 바로 이동 가능 {direct}개)")
+    if errors:
+        print(f">> [WARN] 탐색 오류로 건너뛴 카테고리 {len(errors)}개: {', '.join(errors)}")
+    return nodes, errors
+
+def save_category_tree(nodes, max_depth, cache_file=DEFAULT_TREE_CACHE, errors=None):
+    """
+    트리를 캐시 파일에 저장합니다.
+    노드 URL은 절대 주소이므로 탐색한 대상 주소(base_url)를 함께 기록합니다.
+    탐색 오류가 있었으면 미완성(complete: false)으로 표시하여 다음 실행에서 다시 탐색합니다.
+    """
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "max_depth": max_depth,
+            "base_url": get_base_urls()["shopping"],
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "complete": not errors,
+            "errors": list(errors or []),
+            "nodes": nodes,
+        }, f, ensure_ascii=False, indent=2)
+    if errors:
+        print(f">> [WARN] 카테고리 트리 캐시 저장 (미완성, 다음 실행에서 다시 탐색): {cache_file}")
+    else:
+        print(f">> [INFO] 카테고리 트리 캐시 저장: {cache_file}")
+
+def load_category_tree(cache_file=DEFAULT_TREE_CACHE, max_depth=4):
+    """캐시된 트리가 현재 대상 주소에서 오류 없이 max_depth까지 탐색된 경우에만 노드 목록을 반환합니다. (없으면 None)"""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f">> [WARN] 카테고리 트리 캐시를 읽지 못했습니다: {e}")
+        return None
+    if cache.get("max_depth", 0) < max_depth:
+        print(f">> [INFO] 캐시된 트리의 depth({cache.get('max_depth')})가 요청 depth({max_depth})보다 얕아 다시 탐색합니다.")
+        return None
+    base_url = get_base_urls()["shopping"]
+    if cache.get("base_url") != base_url:
+        print(f">> [INFO] 캐시된 트리의 대상 주소({cache.get('base_url')})가 현재 주소({base_url})와 달라 다시 탐색합니다.")
+        return None
+    if not cache.get("complete", True):
+        print(f">> [INFO] 캐시된 트리는 탐색 오류로 일부 카테고리가 빠져 있어 다시 탐색합니다: {', '.join(cache.get('errors', []))}")
+        return None
+    print(f">> [INFO] 카테고리 트리 캐시 사용: {cache_file} (생성: {cache.get('created_at')})")
+    return cache["nodes"]
+
+def get_category_tree(driver_factory, max_depth, cache_file=DEFAULT_TREE_CACHE, refresh=False):
+    """
+    캐시된 카테고리 트리를 불러오고, 없거나 refresh면 새로 탐색하여 저장합니다.
+    브라우저는 탐색이 필요한 경우에만 driver_factory()로 생성하고 탐색 후 종료합니다.
+    """
+    nodes = None if refresh else load_category_tree(cache_file, max_depth)
+    if nodes is None:
+        driver = driver_factory()
+        try:
+            nodes, errors = discover_category_tree(driver, max_depth)
+        finally:
+            driver.quit()
+        save_category_tree(nodes, max_depth, cache_file, errors)
+    return nodes
+
+def category_leaves(nodes, max_depth):
+    """
+    max_depth 기준으로 제품 URL을 수집할 노드(잎)를 트리 순서대로 반환합니다.
+    하위 메뉴가 없는 노드는 더 얕은 depth여도 잎으로 취급합니다.
+    """
+    return [
+        node for node in nodes
+        if node["depth"] == max_depth or (node["depth"] < max_depth and not node["has_children"])
+    ]
+
+def open_category_node(driver, node):
+    """
+    노드의 목록 페이지로 이동합니다.
+    저장된 URL이 있으면 driver.get 한 번으로 이동하고, 없으면 메뉴 클릭 경로로 이동합니다.
+    """
+    if node["url"]:
+        with timed('driver_get'):
+            driver.get(node["url"])
+        note_page_load(driver)
+        WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.CSS_SELECTOR, patterns('menu_list'))))
+        wait_network_idle(driver, fixed_delay=1, condition='page_load')
+        return
+
+    navigate_to_base_page(driver)
+    if node["2nd_depth"]:
+        click_subcategory(driver, node["2nd_depth"])
+    if node["3rd_depth"]:
+        click_first_detail_menu(driver, node["3rd_depth"])
+    if node["4th_depth"]:
+        click_second_detail_menu(driver, node["4th_depth"])
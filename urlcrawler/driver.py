@@ -1,15 +1,8 @@
 # urlcrawler/driver.py
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from common.driver_factory import create_driver
 
 def setup_driver():
-    options = webdriver.ChromeOptions()
-    # 필요에 따라 headless 모드를 활성화할 수 있습니다.
-    # options.add_argument("--headless")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.implicitly_wait(5)
+    # headless / 로딩 전략 / lean 모드는 common.browser.configure_browser 설정을 따릅니다.
+    driver = create_driver(implicit_wait=5, arguments=())
     print(">> [DEBUG] 웹드라이버 초기화 완료")
     return driver
@@ -1,29 +1,86 @@
 # urlcrawler/main.py
+import os
+import sys
 import csv
-import time
 import traceback
 from tqdm import tqdm
 import hashlib
+
+# 공용 모듈(common) import를 위해 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from driver import setup_driver
-from page_navigation import (
-    navigate_to_base_page,
-    get_subcategory_items,       # 기존 소분류 → 2nd depth
-    click_subcategory,           # 2nd depth 클릭
-    get_first_detail_menu_items, # 기존 첫 번째 detail → 3rd depth
-    click_first_detail_menu,     # 3rd depth 클릭
-    get_second_detail_menu_items,# 기존 두 번째 detail → 4th depth
-    click_second_detail_menu     # 4th depth 클릭
+from category_tree import (
+    DEFAULT_TREE_CACHE,
+    DEPTH_KEYS,
+    get_category_tree,    # 1st~4th depth 트리 탐색 또는 캐시 로드
+    category_leaves,      # 제품 URL을 수집할 잎 노드
+    open_category_node    # 노드 목록 페이지로 바로 이동
 )
 from scraper import scrape_product_urls, apply_sort_filter
 from utils import safe_click
+from common.waits import wait_network_idle
+from common.timing import timing_context
+from common.pool import CrawlerPool
+
+def scrape_leaf(driver, leaf, product_limit, max_retries=3):
+    """
+    카테고리 잎 노드 하나의 목록 페이지로 바로 이동하여 제품 URL을 수집합니다.
+    실패 시 노드 페이지를 다시 열어 최대 max_retries회 시도합니다.
+    """
+    label = " > ".join(leaf[key] for key in DEPTH_KEYS if leaf[key])
+    with timing_context(category=label):
+        return _scrape_leaf(driver, leaf, label, product_limit, max_retries)
+
+def _scrape_leaf(driver, leaf, label, product_limit, max_retries):
+    for attempt in range(1, max_retries + 1):
+        try:
+            open_category_node(driver, leaf)
+            apply_sort_filter(driver, safe_click)
+            urls = scrape_product_urls(driver, limit=product_limit)
+            if not urls:
+                raise Exception(f"'{label}'에서 제품 URL 추출 실패")
+            print(f">> [INFO] '{label}'에서 제품 URL {len(urls)}개 추출 완료")
+            return urls
+        except Exception as e:
+            print(f">> [ERROR] '{label}' 처리 오류 (시도 {attempt}/{max_retries}): {e}")
+            if attempt < max_retries:
+                wait_network_idle(driver, fixed_delay=1, condition='retry_settle')
+    print(f">> [ERROR] 최대 재시도 초과: '{label}' 건너뜀")
+    return []
 
-def run_url_crawler(max_depth=None, product_limit=None):
+class LeafScraper:
+    """
+    워커 풀(CrawlerPool)에서 워커마다 사용하는 URL 수집용 브라우저
+    (CrawlerPool이 요구하는 driver / setup_driver / close 인터페이스 제공)
+    """
+    
+    def __init__(self):
+        self.driver = None
+    
+    def setup_driver(self):
+        self.driver = setup_driver()
+        return self.driver
+    
+    def close(self):
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+def run_url_crawler(max_depth=None, product_limit=None, tree_cache=DEFAULT_TREE_CACHE, refresh_tree=False, workers=1):
     """
     URL 크롤러 실행 함수
     
+    처음 실행 시 카테고리 트리(1st~4th depth)와 노드별 목록 URL을 탐색하여 tree_cache에 저장하고,
+    이후에는 각 잎 노드의 목록 페이지로 바로 이동하여 제품 URL을 수집합니다.
+    잎 노드는 workers개의 브라우저에 나누어 처리하며, 결과는 트리 순서대로 중복 없이 기록합니다.
+    
     Args:
         max_depth: 크롤링할 최대 depth (1-4) 
         product_limit: 각 depth에서 크롤링할 제품 수
+        tree_cache: 카테고리 트리 캐시 파일
+        refresh_tree: True면 캐시를 무시하고 카테고리 트리를 다시 탐색
+        workers: 동시에 실행할 브라우저 워커 수
         
     Returns:
         str: 생성된 CSV 파일명
@@ -47,10 +104,6 @@ def run_url_crawler(max_depth=None, product_limit=None):
             print("잘못된 입력입니다. 기본값 10으로 설정합니다.")
             product_limit = 10
 
-    driver = setup_driver()
-    
-    print(">> [DEBUG] safe_click 함수:", safe_click, type(safe_click))
-    
     # CSV 파일 생성 (헤더: 새 용어 사용)
     csv_filename = "all_category_product_urls.csv"
     with open(csv_filename, "w", newline="", encoding="utf-8") as f:
@@ -62,157 +115,34 @@ def run_url_crawler(max_depth=None, product_limit=None):
         print("네이버 쇼핑 카테고리별 제품 URL 수집기")
         print("=" * 50)
         
-        # 1st depth: 기본 페이지 (예, "여성의류")
-        navigate_to_base_page(driver)
+        # 카테고리 트리 (캐시가 있으면 메뉴 탐색 없이 사용)
+        nodes = get_category_tree(setup_driver, max_depth, cache_file=tree_cache, refresh=refresh_tree)
+        leaves = category_leaves(nodes, max_depth)
+        if not leaves:
+            raise Exception("제품 URL을 수집할 카테고리를 찾지 못했습니다.")
+        print(f">> [INFO] 수집 대상 카테고리 {len(leaves)}개")
         
-        # 만약 최대 depth가 1이면, 기본 페이지에서 바로 크롤링
-        if max_depth == 1:
-            apply_sort_filter(driver, safe_click)
-            urls = scrape_product_urls(driver, limit=product_limit)
-            print(f">> [INFO] 1st depth 페이지에서 제품 URL {len(urls)}개 추출 완료")
-            with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                for url in urls:
-                    writer.writerow(["여성의류", "", "", "", url])
-            print(f"\n>> [SUCCESS] 모든 크롤링 완료. URL은 '{csv_filename}'에 저장됨.")
-            driver.quit()
-            return csv_filename
-
-        # 최대 depth >= 2: 2nd depth (소분류) 처리
-        subcategory_texts = get_subcategory_items(driver)
-        if not subcategory_texts:
-            raise Exception("2nd depth 메뉴 항목(소분류)을 찾지 못했습니다.")
-        
-        # tqdm으로 진행률 표시 추가
-        for subcat_idx, subcategory_text in enumerate(tqdm(subcategory_texts, desc="2nd depth 처리")):
-            try:
-                print(f"\n>> [INFO] 2nd depth ({subcat_idx+1}/{len(subcategory_texts)}): '{subcategory_text}' 처리 시작")
-                click_subcategory(driver, subcategory_text)
-                
-                # 만약 최대 depth가 2이면, 2nd depth에서 직접 제품 URL 크롤링
-                if max_depth == 2:
-                    apply_sort_filter(driver, safe_click)
-                    urls = scrape_product_urls(driver, limit=product_limit)
-                    print(f">> [INFO] 2nd depth '{subcategory_text}'에서 제품 URL {len(urls)}개 추출 완료")
-                    with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                        writer = csv.writer(f)
-                        for url in urls:
-                            writer.writerow(["여성의류", subcategory_text, "", "", url])
-                    navigate_to_base_page(driver)
-                    continue
-                
-                # 최대 depth >= 3: 3rd depth 처리 (첫 번째 detail 메뉴)
-                first_detail_menu_texts = get_first_detail_menu_items(driver)
-                if not first_detail_menu_texts:
-                    print(f">> [INFO] 2nd depth '{subcategory_text}'에서 3rd depth 항목이 없습니다. 제품 크롤링 진행.")
-                    apply_sort_filter(driver, safe_click)
-                    urls = scrape_product_urls(driver, limit=product_limit)
-                    with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                        writer = csv.writer(f)
-                        for url in urls:
-                            writer.writerow(["여성의류", subcategory_text, "", "", url])
-                    navigate_to_base_page(driver)
-                    click_subcategory(driver, subcategory_text)
-                    continue
-                
-                # tqdm으로 3rd depth 진행률 표시
-                for i, first_detail_text in enumerate(tqdm(first_detail_menu_texts, desc=f"'{subcategory_text}' 3rd depth 처리")):
-                    try:
-                        print(f"\n>> [INFO] 3rd depth ({i+1}/{len(first_detail_menu_texts)}): '{first_detail_text}' 처리 시작")
-                        click_first_detail_menu(driver, first_detail_text)
-                        
-                        # 만약 최대 depth가 3이면, 여기서 제품 URL 크롤링 진행
-                        if max_depth == 3:
-                            apply_sort_filter(driver, safe_click)
-                            urls = scrape_product_urls(driver, limit=product_limit)
-                            print(f">> [INFO] 3rd depth '{first_detail_text}'에서 제품 URL {len(urls)}개 추출 완료")
-                            with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                                writer = csv.writer(f)
-                                for url in urls:
-                                    writer.writerow(["여성의류", subcategory_text, first_detail_text, "", url])
-                            navigate_to_base_page(driver)
-                            click_subcategory(driver, subcategory_text)
-                            continue
-                        
-                        # 최대 depth가 4이면, 4th depth 처리 (두 번째 detail 메뉴)
-                        second_detail_menu_texts = get_second_detail_menu_items(driver)
-                        if not second_detail_menu_texts:
-                            print(f">> [INFO] 3rd depth '{first_detail_text}'에서 4th depth 항목이 없습니다. 제품 크롤링 진행.")
-                            apply_sort_filter(driver, safe_click)
-                            urls = scrape_product_urls(driver, limit=product_limit)
-                            with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                                writer = csv.writer(f)
-                                for url in urls:
-                                    writer.writerow(["여성의류", subcategory_text, first_detail_text, "", url])
-                            navigate_to_base_page(driver)
-                            click_subcategory(driver, subcategory_text)
-                            click_first_detail_menu(driver, first_detail_text)
-                            continue
-                        
-                        # tqdm으로 4th depth 진행률 표시
-                        for j, second_detail_text in enumerate(tqdm(second_detail_menu_texts, desc=f"'{first_detail_text}' 4th depth 처리")):
-                            retry_count = 0
-                            max_retries = 3
-                            success = False
-                            
-                            while retry_count < max_retries and not success:
-                                try:
-                                    print(f"\n>> [INFO] 4th depth ({j+1}/{len(second_detail_menu_texts)}): '{second_detail_text}' 처리 시작")
-                                    if retry_count > 0:
-                                        print(f">> [DEBUG] 재시도 {retry_count}: 3rd depth '{first_detail_text}' 다시 클릭")
-                                        navigate_to_base_page(driver)
-                                        click_subcategory(driver, subcategory_text)
-                                        click_first_detail_menu(driver, first_detail_text)
-                                        time.sleep(1)
-                                    
-                                    click_second_detail_menu(driver, second_detail_text)
-                                    apply_sort_filter(driver, safe_click)
-                                    urls = scrape_product_urls(driver, limit=product_limit)
-                                    if not urls:
-                                        raise Exception(f"'{first_detail_text} > {second_detail_text}'에서 제품 URL 추출 실패")
-                                    
-                                    print(f">> [INFO] 4th depth '{second_detail_text}'에서 제품 URL {len(urls)}개 추출 완료")
-                                    with open(csv_filename, "a", newline="", encoding="utf-8") as f:
-                                        writer = csv.writer(f)
-                                        for url in urls:
-                                            writer.writerow(["여성의류", subcategory_text, first_detail_text, second_detail_text, url])
-                                    success = True
-                                
-                                except Exception as e:
-                                    retry_count += 1
-                                    print(f">> [ERROR] 4th depth '{second_detail_text}' 처리 오류 (시도 {retry_count}/{max_retries}): {e}")
-                                    if retry_count >= max_retries:
-                                        print(f">> [ERROR] 최대 재시도 초과: '{second_detail_text}' 건너뜀")
-                                        break
-                                    navigate_to_base_page(driver)
-                                    click_subcategory(driver, subcategory_text)
-                                    click_first_detail_menu(driver, first_detail_text)
-                        # 3rd depth 내 다음 항목 처리를 위해 초기화
-                        navigate_to_base_page(driver)
-                        click_subcategory(driver, subcategory_text)
-                    
-                    except Exception as e:
-                        print(f">> [ERROR] 3rd depth '{first_detail_text}' 처리 오류:", e)
-                        navigate_to_base_page(driver)
-                        click_subcategory(driver, subcategory_text)
+        # 잎 노드를 워커 브라우저에 분배 (결과는 트리 순서대로 반환)
+        pool = CrawlerPool(LeafScraper, workers=workers, max_retries=1, retry_delay=1)
+        handler = lambda scraper, leaf: scrape_leaf(scraper.driver, leaf, product_limit)
+        written_rows = set()
+        with open(csv_filename, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            for _, leaf, urls in tqdm(pool.run(leaves, handler), total=len(leaves), desc="카테고리 처리"):
+                for url in urls or []:
+                    row = tuple(leaf[key] for key in DEPTH_KEYS) + (url,)
+                    if row in written_rows:
                         continue
-                # 2nd depth 내 다음 소분류 처리를 위해 초기화
-                navigate_to_base_page(driver)
-            
-            except Exception as e:
-                print(f">> [ERROR] 2nd depth '{subcategory_text}' 처리 오류:", e)
-                navigate_to_base_page(driver)
-                continue
+                    written_rows.add(row)
+                    writer.writerow(row)
+                f.flush()
         
-        print(f"\n>> [SUCCESS] 모든 크롤링 완료. 수집된 URL은 '{csv_filename}'에 저장되었습니다.")
+        print(f"\n>> [SUCCESS] 모든 크롤링 완료. 수집된 URL {len(written_rows)}개는 '{csv_filename}'에 저장되었습니다.")
     
     except Exception as e:
         print(">> [CRITICAL] 프로그램 실행 중 치명적 오류 발생:", e)
         traceback.print_exc()
     
-    finally:
-        driver.quit()
-    
     return csv_filename
 
 # 직접 실행 시
@@ -0,0 +1,103 @@
+# urlcrawler/menu_dom.py
+from collections import namedtuple
+from common.waits import wait_network_idle
+from common.timing import timed
+from common.selector_registry import patterns
+
+# 메뉴 영역: container(컨테이너, None이면 문서 전체) 중 position번째 안의 button 요소들
+# container/button은 선택자 그룹 이름 (common/selectors.json, 호출할 때 선택자 문자열로 바꿈)
+MenuArea = namedtuple('MenuArea', ['container', 'position', 'button'])
+
+MAIN_MENU = MenuArea(None, 0, 'main_menu_button')
+SUB_MENU = MenuArea(None, 0, 'sub_menu_button')
+FIRST_DETAIL_MENU = MenuArea('detail_menu_container', 0, 'detail_menu_button')
+SECOND_DETAIL_MENU = MenuArea('detail_menu_container', 1, 'detail_menu_button')
+
+# 메뉴 영역의 버튼 목록 찾기 (컨테이너가 없으면 null) - 두 스크립트 공통
+_FIND_BUTTONS = """
+var scope = document;
+if (arguments[0]) {
+    scope = document.querySelectorAll(arguments[0])[arguments[1]];
+    if (!scope) return null;
+}
+var buttons = scope.querySelectorAll(arguments[2]);
+"""
+
+# 버튼마다 텍스트/클래스/표시 여부를 한 번에 읽음 (WebElement.text, get_attribute 등을 버튼마다 호출하지 않음)
+# 화면에 보이지 않는 버튼은 WebElement.text와 같이 텍스트를 ''로 반환 (숨겨진 중복/접힌 메뉴를 항목으로 읽지 않음)
+_READ_MENU_SCRIPT = _FIND_BUTTONS + """
+var items = [];
+for (var i = 0; i < buttons.length; i++) {
+    var button = buttons[i];
+    var rect = button.getBoundingClientRect();
+    var style = window.getComputedStyle(button);
+    var displayed = rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    items.push({
+        index: i,
+        text: displayed ? (button.innerText || button.textContent || '').trim() : '',
+        classes: button.className || '',
+        displayed: displayed,
+        enabled: !button.disabled
+    });
+}
+return items;
+"""
+
+# index번째 버튼의 텍스트가 읽을 때와 같으면 화면 가운데로 스크롤 후 클릭 (목록이 바뀌었으면 클릭하지 않음)
+_CLICK_MENU_SCRIPT = _FIND_BUTTONS + """
+var button = buttons[arguments[3]];
+if (!button) return 'missing';
+if ((button.innerText || button.textContent || '').trim() !== arguments[4]) return 'changed';
+button.scrollIntoView({block: 'center'});
+button.click();
+return 'clicked';
+"""
+
+def _area_arguments(area):
+    """메뉴 스크립트에 넘길 (컨테이너 선택자, 순번, 버튼 선택자)"""
+    return (patterns(area.container) if area.container else None, area.position, patterns(area.button))
+
+def is_active(item):
+    """메뉴 항목이 선택 상태인지 (클래스에 active/selected 포함)"""
+    classes = item['classes'].lower()
+    return "active" in classes or "selected" in classes
+
+def read_menu(driver, area):
+    """
+    메뉴 영역의 항목 목록을 스크립트 한 번으로 읽습니다.
+
+    Returns:
+        list: {'index', 'text', 'classes', 'displayed', 'enabled', 'active'} 목록
+              (보이지 않는 버튼의 text는 '', 메뉴 영역 컨테이너가 없으면 None)
+    """
+    items = driver.execute_script(_READ_MENU_SCRIPT, *_area_arguments(area))
+    if items is None:
+        return None
+    for item in items:
+        item['active'] = is_active(item)
+    return items
+
+def find_menu_item(items, match):
+    """match(text)가 참인 첫 번째 항목 (없으면 None)"""
+    for item in items or []:
+        if item['text'] and match(item['text']):
+            return item
+    return None
+
+def click_menu_item(driver, area, item, description=""):
+    """
+    read_menu로 읽은 항목을 순번으로 클릭합니다. (텍스트가 바뀌었으면 다시 읽어서 같은 텍스트의 항목 클릭)
+    """
+    print(f">> [DEBUG] {description} 클릭 시도: 텍스트='{item['text']}', 순번={item['index']}, displayed={item['displayed']}")
+    with timed('tab_click'):
+        result = driver.execute_script(_CLICK_MENU_SCRIPT, *_area_arguments(area), item['index'], item['text'])
+        if result != 'clicked':
+            print(f">> [DEBUG] {description} 메뉴 목록이 바뀌어 다시 읽음 ({result})")
+            current = find_menu_item(read_menu(driver, area), lambda text: text == item['text'])
+            if current is None:
+                raise Exception(f"{description} 항목 '{item['text']}'을(를) 다시 찾지 못했습니다.")
+            result = driver.execute_script(_CLICK_MENU_SCRIPT, *_area_arguments(area), current['index'], current['text'])
+            if result != 'clicked':
+                raise Exception(f"{description} 클릭 실패 ({result})")
+    print(f">> [DEBUG] {description} 클릭 성공")
+    wait_network_idle(driver, fixed_delay=0.5, condition='click')
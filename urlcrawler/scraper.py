@@ -1,36 +1,168 @@
 # urlcrawler/scraper.py
-import time
-from bs4 import BeautifulSoup
+import os
+from common.html_parser import parse_html
+from common.waits import wait_network_idle, wait_for_element, wait_until, get_signature, wait_for_change
+from common.timing import timed
+from common.endpoints import product_card_selector
+from common.selector_registry import patterns
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
-def scrape_product_urls(driver, limit=10):
+# 제품 URL 수집 방식
+# - incremental: 스크롤마다 페이지 안 스크립트로 새로 추가된 카드의 링크만 가져옴 (기본값)
+# - snapshot: 스크롤마다 page_source 전체를 파싱하여 모든 카드를 다시 확인 (기존 방식)
+HARVEST_MODES = ('incremental', 'snapshot')
+
+_harvest_mode = os.environ.get('CRAWLER_HARVEST_MODE', 'incremental')
+
+# 이미 읽은 카드에는 읽을 때의 href를 표시해 두고, 표시가 없거나 href가 바뀐 카드의 링크만 반환합니다.
+# (목록을 다시 그리면서 같은 요소의 href만 바꾸는 경우도 새 카드로 인식)
+# arguments[1]이 참이면 수집 후 페이지 끝으로 스크롤하여 다음 카드 로딩을 유도합니다.
+_HARVEST_SCRIPT = """
+var cards = document.querySelectorAll(arguments[0]);
+var hrefs = [];
+for (var i = 0; i < cards.length; i++) {
+    var href = cards[i].getAttribute('href');
+    if (cards[i].getAttribute('data-crawler-seen') === href) continue;
+    cards[i].setAttribute('data-crawler-seen', href);
+    hrefs.push(href);
+}
+if (arguments[1]) window.scrollTo(0, document.body.scrollHeight);
+return hrefs;
+"""
+
+_HAS_NEW_CARD_SCRIPT = """
+var cards = document.querySelectorAll(arguments[0]);
+for (var i = cards.length - 1; i >= 0; i--) {
+    if (cards[i].getAttribute('data-crawler-seen') !== cards[i].getAttribute('href')) return true;
+}
+return false;
+"""
+
+def set_harvest_mode(mode):
+    """제품 URL 수집 방식(incremental/snapshot)을 설정합니다."""
+    global _harvest_mode
+    if mode not in HARVEST_MODES:
+        raise ValueError(f"지원하지 않는 수집 방식입니다: {mode} (사용 가능: {', '.join(HARVEST_MODES)})")
+    _harvest_mode = mode
+    print(f"[INFO] 제품 URL 수집 방식: {mode}")
+
+def get_harvest_mode():
+    return _harvest_mode
+
+def extract_product_urls(html_source, product_urls, limit, seen=None):
+    """
+    목록 페이지 스냅샷에서 제품 카드 링크를 추출하여 product_urls에 순서대로 추가합니다.
+    (이미 있는 URL은 건너뛰고, limit개가 되면 중단)
+    여러 번 호출할 때는 같은 seen 집합을 넘기면 중복 확인을 다시 만들지 않습니다.
+
+    Returns:
+        list: product_urls
+    """
+    if seen is None:
+        seen = set(product_urls)
+    soup = parse_html(html_source)
+    with timed('extract'):
+        product_cards = soup.select(product_card_selector())
+        print(">> [DEBUG] 추출된 product_card 개수:", len(product_cards))
+        
+        for card in product_cards:
+            href = card.get("href")
+            if href:
+                add_product_url(href, product_urls, seen)
+                if len(product_urls) >= limit:
+                    break
+    return product_urls
+
+def add_product_url(href, product_urls, seen):
+    """처음 보는 URL이면 product_urls에 추가하고 True를 반환합니다."""
+    href = href.strip()
+    if not href or href in seen:
+        return False
+    seen.add(href)
+    product_urls.append(href)
+    return True
+
+def scrape_product_urls(driver, limit=10, mode=None):
     """
     페이지에서 최대 limit 개의 제품 URL을 추출합니다.
     스크롤을 반복하여 원하는 개수만큼 로드하도록 구현합니다.
+    (mode가 None이면 set_harvest_mode로 설정한 수집 방식 사용)
+    """
+    mode = mode or _harvest_mode
+    if mode == 'incremental':
+        return harvest_product_urls(driver, limit)
+    return _scrape_product_urls_snapshot(driver, limit)
+
+def harvest_product_urls(driver, limit=10):
     """
+    무한 스크롤 목록에서 스크롤할 때마다 새로 추가된 카드의 링크만 가져와 최대 limit개의 제품 URL을 수집합니다.
+    page_source 전체를 파싱하지 않고, 수집과 스크롤을 스크립트 한 번으로 처리하며,
+    스크롤 후 새 카드가 나타나지 않거나 새 URL이 없으면 바로 종료합니다.
+    """
+    product_urls = []
+    seen = set()
+    card_selector = product_card_selector()
+    max_scrolls = max(10, limit // 5)  # 스크롤당 최소 5개는 추가된다고 보고 상한 설정
+    has_new_card = lambda d: d.execute_script(_HAS_NEW_CARD_SCRIPT, card_selector)
+
+    if not wait_until(driver, 'product_list', has_new_card):
+        print(">> [DEBUG] 제품 카드가 나타나지 않아 수집 종료")
+        return product_urls
+
+    scroll_count = 0
+    while True:
+        # 남은 개수가 있으면 수집과 동시에 다음 카드 로딩을 위해 스크롤
+        with timed('extract'):
+            hrefs = driver.execute_script(_HARVEST_SCRIPT, card_selector, True) or []
+        added = 0
+        for href in hrefs:
+            if href and add_product_url(href, product_urls, seen):
+                added += 1
+                if len(product_urls) >= limit:
+                    break
+        print(f">> [DEBUG] 새 카드 {len(hrefs)}개, 새 URL {added}개. 현재 수집된 URL 개수: {len(product_urls)}")
+
+        if len(product_urls) >= limit:
+            break
+        if scroll_count and not added:
+            print(">> [DEBUG] 스크롤 후 새 제품 URL이 없어 수집 종료")
+            break
+        if scroll_count >= max_scrolls:
+            print(f">> [DEBUG] 최대 스크롤 횟수({max_scrolls}) 도달")
+            break
+        scroll_count += 1
+        if not wait_until(driver, 'scroll_load', has_new_card):
+            print(">> [DEBUG] 스크롤 후 새 제품이 로드되지 않아 수집 종료")
+            break
+
+    return product_urls
+
+def _scrape_product_urls_snapshot(driver, limit):
     product_urls = []
+    seen = set()
     scroll_count = 0
     max_scrolls = 10  # 최대 스크롤 횟수
+    card_state = None
+    card_selector = product_card_selector()
     
     while len(product_urls) < limit and scroll_count < max_scrolls:
-        time.sleep(2)  # 스크롤 후 로딩 대기
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        product_cards = soup.select("a[href^='https://shopping.naver.com/window-products/style/']")
-        print(">> [DEBUG] 추출된 product_card 개수:", len(product_cards))
-        
-        for card in product_cards:
-            href = card.get("href")
-            if href and href.strip() not in product_urls:
-                product_urls.append(href.strip())
-                if len(product_urls) >= limit:
-                    break
+        # 스크롤 후 로딩 대기
+        if scroll_count == 0:
+            wait_for_element(driver, card_selector, 'product_list', fixed_delay=2)
+        elif not wait_for_change(driver, card_selector, card_state, 'product_list', fixed_delay=2):
+            print(">> [DEBUG] 스크롤 후 새 제품이 로드되지 않아 수집 종료")
+            break
+        with timed('page_source'):
+            html_source = driver.page_source
+        extract_product_urls(html_source, product_urls, limit, seen)
         
         if len(product_urls) >= limit:
             break
         
         # 페이지의 가장 밑으로 스크롤하여 추가 로딩을 유도합니다.
+        card_state = get_signature(driver, card_selector)
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         scroll_count += 1
         print(f">> [DEBUG] 스크롤 {scroll_count}회 진행 중. 현재 수집된 URL 개수: {len(product_urls)}")
@@ -43,7 +175,7 @@ def apply_sort_filter(driver, safe_click, wait_func=None):
     """
     try:
         sort_filter = WebDriverWait(driver, 20).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "div.sortFilterWrapper_sort_filter_wrapper__Ny94X"))
+            EC.visibility_of_element_located((By.CSS_SELECTOR, patterns('sort_filter')))
         )
         print(">> [DEBUG] sort filter 컨테이너 로드됨")
     except Exception as e:
@@ -64,10 +196,10 @@ def apply_sort_filter(driver, safe_click, wait_func=None):
 
     try:
         sort_detail_list = WebDriverWait(driver, 5).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, "ul.sort_option_detail_list__4oSrw"))
+            EC.visibility_of_element_located((By.CSS_SELECTOR, patterns('sort_option_list')))
         )
         print(">> [DEBUG] sort detail 리스트 로드됨")
-        sort_buttons = sort_detail_list.find_elements(By.CSS_SELECTOR, "button.sort_detail_button__CoQKb")
+        sort_buttons = sort_detail_list.find_elements(By.CSS_SELECTOR, patterns('sort_option_button'))
         target_sort = None
         for btn in sort_buttons:
             if btn.text.strip() == "전체":
@@ -81,4 +213,4 @@ def apply_sort_filter(driver, safe_click, wait_func=None):
     except Exception as e:
         print(">> [DEBUG] sort detail 리스트 처리 중 예외 발생:", e)
     
-    time.sleep(2)
+    wait_network_idle(driver, fixed_delay=2, condition='sort_filter')
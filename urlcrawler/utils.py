@@ -1,6 +1,7 @@
 # urlcrawler/utils.py
-import time
 from selenium.webdriver.support.ui import WebDriverWait
+from common.waits import wait_for, wait_network_idle
+from common.timing import timed
 
 def wait_until_clickable(driver, element, timeout=20, description=""):
     if element is None:
@@ -13,36 +14,47 @@ def wait_until_clickable(driver, element, timeout=20, description=""):
         print(f">> [DEBUG] {description} 요소 대기 실패: {e}")
         return False
 
+# 스크롤 후 클릭 전 상태(텍스트, 표시/활성 여부, outerHTML 일부)를 한 번에 읽음
+_PREPARE_CLICK_SCRIPT = """
+var el = arguments[0];
+el.scrollIntoView({block: 'center'});
+var rect = el.getBoundingClientRect();
+var style = window.getComputedStyle(el);
+return {
+    text: (el.innerText || el.textContent || '').trim(),
+    displayed: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    enabled: !el.disabled,
+    outer_html: (el.outerHTML || '').slice(0, 200)
+};
+"""
+
 def safe_click(driver, element, description=""):
     # 요소가 None인 경우 조기에 예외 처리합니다.
     if element is None:
         raise Exception(f"{description} 요소가 None입니다. safe_click 호출 불가")
     
+    state = None
     try:
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-    except Exception as e:
-        print(f">> [DEBUG] {description} 스크롤 실패: {e}")
-    time.sleep(0.5)
-    try:
-        text = element.text.strip()
-        displayed = element.is_displayed()
-        enabled = element.is_enabled()
-        outer_html = element.get_attribute("outerHTML")[:200]
-        print(f">> [DEBUG] {description} safe_click 시도: 텍스트='{text}', displayed={displayed}, enabled={enabled}")
-        print(">> [DEBUG] outerHTML 일부:", outer_html)
-    except Exception as ex:
-        print(f">> [DEBUG] {description} safe_click 디버깅 예외: {ex}")
-    if not wait_until_clickable(driver, element, description=description):
-        raise Exception(f"{description} 요소가 클릭 가능하지 않음")
-    try:
-        element.click()
-        print(f">> [DEBUG] {description} 클릭 성공")
+        state = driver.execute_script(_PREPARE_CLICK_SCRIPT, element)
+        print(f">> [DEBUG] {description} safe_click 시도: 텍스트='{state['text']}', displayed={state['displayed']}, enabled={state['enabled']}")
+        print(">> [DEBUG] outerHTML 일부:", state['outer_html'])
     except Exception as e:
-        print(f">> [DEBUG] {description} 일반 클릭 실패, JS 클릭 시도: {e}")
+        print(f">> [DEBUG] {description} 스크롤/상태 확인 실패: {e}")
+    wait_for(driver, 'scroll', 0.5)
+    # 이미 표시/활성 상태면 추가 확인 없이 클릭
+    if not (state and state['displayed'] and state['enabled']):
+        if not wait_until_clickable(driver, element, description=description):
+            raise Exception(f"{description} 요소가 클릭 가능하지 않음")
+    with timed('tab_click'):
         try:
-            driver.execute_script("arguments[0].click();", element)
-            print(f">> [DEBUG] {description} JS 클릭 성공")
-        except Exception as e2:
-            print(f">> [DEBUG] {description} JS 클릭 실패: {e2}")
-            raise
-    time.sleep(0.5)
+            element.click()
+            print(f">> [DEBUG] {description} 클릭 성공")
+        except Exception as e:
+            print(f">> [DEBUG] {description} 일반 클릭 실패, JS 클릭 시도: {e}")
+            try:
+                driver.execute_script("arguments[0].click();", element)
+                print(f">> [DEBUG] {description} JS 클릭 성공")
+            except Exception as e2:
+                print(f">> [DEBUG] {description} JS 클릭 실패: {e2}")
+                raise
+    wait_network_idle(driver, fixed_delay=0.5, condition='click')